@@ -0,0 +1,34 @@
+"""Unique match score per job and resume
+
+Revision ID: 3b7e1c9a2f40
+Revises: 900c2d54f50a
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e1c9a2f40'
+down_revision: Union[str, None] = '900c2d54f50a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate cache rows left by concurrent lazy scoring, keeping the newest
+    op.execute("""
+        DELETE FROM matchscores a
+        USING matchscores b
+        WHERE a.job_id = b.job_id
+          AND a.resume_id = b.resume_id
+          AND (COALESCE(a.computed_at, 'epoch'), a.id) < (COALESCE(b.computed_at, 'epoch'), b.id)
+    """)
+    op.create_unique_constraint('unique_match_score', 'matchscores', ['job_id', 'resume_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('unique_match_score', 'matchscores', type_='unique')
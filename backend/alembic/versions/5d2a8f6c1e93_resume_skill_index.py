@@ -0,0 +1,45 @@
+"""Inverted skill index for resumes
+
+Revision ID: 5d2a8f6c1e93
+Revises: 3b7e1c9a2f40
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a8f6c1e93'
+down_revision: Union[str, None] = '3b7e1c9a2f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('resumeskills',
+    sa.Column('resume_id', sa.UUID(), nullable=False),
+    sa.Column('skill', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('resume_id', 'skill')
+    )
+    op.create_index('ix_resumeskills_skill_resume_id', 'resumeskills', ['skill', 'resume_id'], unique=False)
+    # Backfill postings for resumes parsed before the index existed.
+    # Skills are either plain strings or enriched {"skill": ...} objects.
+    op.execute("""
+        INSERT INTO resumeskills (resume_id, skill)
+        SELECT DISTINCT r.id, lower(COALESCE(s->>'skill', s #>> '{}'))
+        FROM resumes r, jsonb_array_elements(
+            CASE WHEN jsonb_typeof(r.parsed_json->'skills') = 'array'
+                 THEN r.parsed_json->'skills' ELSE '[]'::jsonb END
+        ) s
+        WHERE r.status = 'PARSED'
+          AND COALESCE(s->>'skill', s #>> '{}') <> ''
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resumeskills_skill_resume_id', table_name='resumeskills')
+    op.drop_table('resumeskills')
@@ -0,0 +1,28 @@
+"""Ranking indexes for match score listings
+
+Revision ID: 7c4e2b9d8a15
+Revises: 5d2a8f6c1e93
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e2b9d8a15'
+down_revision: Union[str, None] = '5d2a8f6c1e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_matchscores_job_id_score', 'matchscores', ['job_id', sa.text('score DESC'), sa.text('resume_id DESC')], unique=False)
+    op.create_index('ix_matchscores_resume_id_score', 'matchscores', ['resume_id', sa.text('score DESC'), sa.text('job_id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_matchscores_resume_id_score', table_name='matchscores')
+    op.drop_index('ix_matchscores_job_id_score', table_name='matchscores')
@@ -0,0 +1,36 @@
+"""Versioned, content-hashed match score cache
+
+Revision ID: 9a1f3d7e5b28
+Revises: 7c4e2b9d8a15
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a1f3d7e5b28'
+down_revision: Union[str, None] = '7c4e2b9d8a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('feature_hash', sa.String(length=64), nullable=True))
+    op.add_column('jobs', sa.Column('requirements_hash', sa.String(length=64), nullable=True))
+    op.add_column('matchscores', sa.Column('scoring_version', sa.Integer(), nullable=True))
+    op.add_column('matchscores', sa.Column('resume_hash', sa.String(length=64), nullable=True))
+    op.add_column('matchscores', sa.Column('job_hash', sa.String(length=64), nullable=True))
+    # Existing rows have no stamps, so they are treated as stale and recomputed
+    # by refresh_stale_scores_task or on the next read.
+
+
+def downgrade() -> None:
+    op.drop_column('matchscores', 'job_hash')
+    op.drop_column('matchscores', 'resume_hash')
+    op.drop_column('matchscores', 'scoring_version')
+    op.drop_column('jobs', 'requirements_hash')
+    op.drop_column('resumes', 'feature_hash')
@@ -0,0 +1,28 @@
+"""Store the SHA-256 of uploaded resume files
+
+Revision ID: a3d8f2c6b915
+Revises: f1c9a6b3d284
+Create Date: 2026-10-18 17:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d8f2c6b915'
+down_revision: Union[str, None] = 'f1c9a6b3d284'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('content_sha256', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_resumes_content_sha256'), 'resumes', ['content_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resumes_content_sha256'), table_name='resumes')
+    op.drop_column('resumes', 'content_sha256')
@@ -0,0 +1,35 @@
+"""Dense skill IDs and packed resume skill bitsets
+
+Revision ID: b2e6c4a8d371
+Revises: 9a1f3d7e5b28
+Create Date: 2026-10-18 13:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.schema import CreateSequence, DropSequence
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e6c4a8d371'
+down_revision: Union[str, None] = '9a1f3d7e5b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(CreateSequence(sa.Sequence('skills_bit_index_seq', start=0, minvalue=0)))
+    # Volatile default: existing skills each get the next ID
+    op.add_column('skills', sa.Column('bit_index', sa.Integer(), server_default=sa.text("nextval('skills_bit_index_seq')"), nullable=False))
+    op.create_unique_constraint('skills_bit_index_key', 'skills', ['bit_index'])
+    # Packed lazily by refresh_stale_scores_task; NULL means "not packed yet"
+    op.add_column('resumes', sa.Column('skill_bits', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('resumes', 'skill_bits')
+    op.drop_constraint('skills_bit_index_key', 'skills', type_='unique')
+    op.drop_column('skills', 'bit_index')
+    op.execute(DropSequence(sa.Sequence('skills_bit_index_seq')))
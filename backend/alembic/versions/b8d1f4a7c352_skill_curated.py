@@ -0,0 +1,34 @@
+"""Flag curated skills and retire auto-registered resume skills
+
+Revision ID: b8d1f4a7c352
+Revises: e2b7d4f9a186
+Create Date: 2026-10-18 20:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d1f4a7c352'
+down_revision: Union[str, None] = 'e2b7d4f9a186'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('skills', sa.Column('curated', sa.Boolean(), server_default=sa.true(), nullable=False))
+    # Parsed resume skills used to be registered as they were: lowercased,
+    # with no synonyms or category. Keep their rows (and bit indexes, which
+    # stored bitsets still reference) but stop treating them as taxonomy.
+    op.execute(
+        "UPDATE skills SET curated = false "
+        "WHERE canonical_name = lower(canonical_name) "
+        "AND coalesce(cardinality(synonyms), 0) = 0 AND category IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('skills', 'curated')
@@ -0,0 +1,31 @@
+"""Link duplicate resume uploads to the upload they reuse
+
+Revision ID: c5f1e8a2d639
+Revises: a3d8f2c6b915
+Create Date: 2026-10-18 18:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f1e8a2d639'
+down_revision: Union[str, None] = 'a3d8f2c6b915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('duplicate_of', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key('resumes_duplicate_of_fkey', 'resumes', 'resumes', ['duplicate_of'], ['id'])
+    op.create_index(op.f('ix_resumes_duplicate_of'), 'resumes', ['duplicate_of'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resumes_duplicate_of'), table_name='resumes')
+    op.drop_constraint('resumes_duplicate_of_fkey', 'resumes', type_='foreignkey')
+    op.drop_column('resumes', 'duplicate_of')
@@ -0,0 +1,29 @@
+"""Hashed resume text vectors for similarity search
+
+Revision ID: d4a7e2f9c610
+Revises: b2e6c4a8d371
+Create Date: 2026-10-18 14:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e2f9c610'
+down_revision: Union[str, None] = 'b2e6c4a8d371'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('text_vector', sa.LargeBinary(), nullable=True))
+    # parsed_at is the watermark for incremental similarity index refreshes
+    op.create_index(op.f('ix_resumes_parsed_at'), 'resumes', ['parsed_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resumes_parsed_at'), table_name='resumes')
+    op.drop_column('resumes', 'text_vector')
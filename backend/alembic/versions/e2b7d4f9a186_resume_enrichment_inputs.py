@@ -0,0 +1,31 @@
+"""Keep extracted text and raw extraction for re-enrichment
+
+Revision ID: e2b7d4f9a186
+Revises: c5f1e8a2d639
+Create Date: 2026-10-18 19:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7d4f9a186'
+down_revision: Union[str, None] = 'c5f1e8a2d639'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('extracted_text', sa.LargeBinary(), nullable=True))
+    op.add_column('resumes', sa.Column('raw_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('resumes', sa.Column('enrichment_version', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('resumes', 'enrichment_version')
+    op.drop_column('resumes', 'raw_json')
+    op.drop_column('resumes', 'extracted_text')
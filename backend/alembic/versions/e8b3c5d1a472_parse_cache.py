@@ -0,0 +1,37 @@
+"""Content-addressed cache for LLM resume parses
+
+Revision ID: e8b3c5d1a472
+Revises: d4a7e2f9c610
+Create Date: 2026-10-18 15:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c5d1a472'
+down_revision: Union[str, None] = 'd4a7e2f9c610'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('parsecaches',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('raw_json', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('size_bytes', sa.Integer(), nullable=False),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('last_used_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_parsecaches_last_used_at'), 'parsecaches', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_parsecaches_last_used_at'), table_name='parsecaches')
+    op.drop_table('parsecaches')
@@ -0,0 +1,27 @@
+"""Track skill taxonomy changes for the skill matcher
+
+Revision ID: f1c9a6b3d284
+Revises: e8b3c5d1a472
+Create Date: 2026-10-18 16:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c9a6b3d284'
+down_revision: Union[str, None] = 'e8b3c5d1a472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('skills', sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('skills', 'updated_at')
@@ -1,8 +1,9 @@
 from fastapi import APIRouter
-from app.api.api_v1.endpoints import auth, resumes, jobs, matches
+from app.api.api_v1.endpoints import auth, resumes, jobs, matches, system
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="", tags=["auth"])
 api_router.include_router(resumes.router, prefix="/resumes", tags=["resumes"])
 api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
 api_router.include_router(matches.router, prefix="/matches", tags=["matches"])
+api_router.include_router(system.router, prefix="/system", tags=["system"])
@@ -4,45 +4,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import uuid
 from app.api import deps
-from app.models.job import Job
-from app.core.config import settings
-from groq import Groq
-import json
+from app.models.job import Job, JobStatus
+from app.worker import analyze_job_task, score_job_task, get_cached_job_analysis
+from app.core.scoring import job_requirements_hash
+from sqlalchemy.sql import func
+from app.core.celery_app import PRIORITY_INTERACTIVE
 
 router = APIRouter()
 
-async def analyze_job_description(description: str) -> dict:
-    """
-    Use LLM to extract structured requirements from a job description.
-    """
-    client = Groq(api_key=settings.GROQ_API_KEY)
-    
-    prompt = f"""
-    You are an expert Job Analyzer. Extract structured requirements from the job description text below and return ONLY valid JSON.
-    Do not add any markdown formatting or explanations.
-    
-    Structure:
-    {{
-        "required_skills": [],
-        "preferred_skills": [],
-        "experience_years": 0,
-        "education_level": "",
-        "key_responsibilities": []
-    }}
-    
-    Job Description:
-    {description[:10000]}
-    """
-    
-    completion = client.chat.completions.create(
-        model="llama3-70b-8192",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0,
-        response_format={"type": "json_object"}
-    )
-    
-    return json.loads(completion.choices[0].message.content)
-
 from app.schemas.job import JobCreate
 
 @router.post("/", response_model=dict)
@@ -53,13 +22,13 @@ async def create_job(
     current_user: Any = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Create a new job posting and analyze it.
+    Create a new job posting. Its requirements are extracted in the background:
+    the job is PENDING_ANALYSIS until then and ACTIVE afterwards (a DRAFT with
+    the error recorded if the analysis fails). Reposts of an already analyzed
+    description are ACTIVE at once.
     """
-    # 1. Analyze with LLM
-    try:
-        structured_requirements = await analyze_job_description(job_in.description)
-    except Exception as e:
-        structured_requirements = {"error": str(e)}
+    # 1. Reuse the analysis of an identical (normalized) description
+    requirements = await get_cached_job_analysis(job_in.description, db)
 
     # 2. Create Job Record
     db_job = Job(
@@ -68,12 +37,27 @@ async def create_job(
         company=job_in.company,
         location=job_in.location,
         posted_by=current_user.id,
-        parsed_requirements=structured_requirements
+        status=JobStatus.PENDING_ANALYSIS
     )
+    if requirements is not None:
+        db_job.parsed_requirements = requirements
+        db_job.requirements_hash = job_requirements_hash(requirements)
+        db_job.status = JobStatus.ACTIVE
+        db_job.analyzed_at = func.now()
     db.add(db_job)
     await db.commit()
     await db.refresh(db_job)
 
+    # 3. Analyze with LLM on the analysis queue (match scoring follows it),
+    # or go straight to scoring
+    try:
+        if requirements is None:
+            analyze_job_task.apply_async((str(db_job.id),), priority=PRIORITY_INTERACTIVE)
+        else:
+            score_job_task.delay(str(db_job.id))
+    except Exception as celery_err:
+        print(f"CELERY TASK DISPATCH FAILED: {celery_err}")
+
     return db_job
 
 @router.get("/", response_model=List[dict])
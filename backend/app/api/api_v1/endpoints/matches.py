@@ -1,122 +1,280 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, AsyncIterator, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.orm import undefer
+import base64
+import json
 import uuid
 from app.api import deps
+from app.db.session import AsyncSessionLocal
 from app.models.resume import Resume, ResumeStatus
-from app.models.job import Job
-from app.models.match_score import MatchScore
-from app.core.scoring import calculate_match_score
+from app.models.job import Job, JobStatus
+from app.crud import crud_match, crud_similarity, crud_sql_scoring
+from app.core.config import settings
+from app.core.scoring import calculate_match_scores_batch
+from app.core.similarity import embed_text, job_text, vector_from_bytes
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+STREAM_CHUNK_SIZE = 500
+
+def encode_cursor(score: int, entity_id: uuid.UUID) -> str:
+    """Opaque keyset cursor for the last row of a page."""
+    raw = json.dumps([score, str(entity_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[int, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, entity_id = json.loads(raw)
+        return int(score), uuid.UUID(entity_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def ensure_job_analyzed(job: Job) -> None:
+    """409 until the job's requirements exist; scoring against none would rank everyone 100."""
+    if job.status == JobStatus.PENDING_ANALYSIS:
+        raise HTTPException(status_code=409, detail="Job requirements are still being analyzed")
+    if "error" in (job.parsed_requirements or {}):
+        raise HTTPException(status_code=409, detail="Job requirements could not be analyzed")
+
 @router.get("/job/{job_id}", response_model=List[dict])
 async def get_matches_for_job(
     job_id: uuid.UUID,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    min_score: Optional[int] = Query(None, ge=0, le=100),
+    cursor: Optional[str] = None,
+    include_breakdown: bool = True,
     db: AsyncSession = Depends(deps.get_db),
     current_user: Any = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Get all candidate matches for a specific job.
+    Get candidate matches for a specific job, best first.
+
+    With `limit`, one page is returned and the cursor for the next page is
+    sent in the X-Next-Cursor header.
     """
     job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    
+
     # Check if user is the poster or an admin
     if job.posted_by != current_user.id:
          raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    # Fetch all PARSED resumes
-    result = await db.execute(select(Resume).where(Resume.status == ResumeStatus.PARSED))
-    resumes = result.scalars().all()
-    
-    matches = []
-    for resume in resumes:
-        # Calculate score (In a real app, we'd cache this in the MatchScore table)
-        # We check Cache first
-        cache_result = await db.execute(
-            select(MatchScore).where(MatchScore.job_id == job_id, MatchScore.resume_id == resume.id)
-        )
-        match_record = cache_result.scalars().first()
-        
-        if not match_record:
-            score_data = calculate_match_score(resume.parsed_json, job.parsed_requirements)
-            match_record = MatchScore(
-                job_id=job_id,
-                candidate_id=resume.user_id,
-                resume_id=resume.id,
-                score=score_data["score"],
-                breakdown=score_data["breakdown"]
+    ensure_job_analyzed(job)
+
+    after = decode_cursor(cursor) if cursor else None
+    job_requirements = job.parsed_requirements or {}
+
+    if limit is not None and after is None and await crud_match.has_unscored_resumes(db, job):
+        # First page while scores are incomplete: rank through the skill index
+        # (or inside Postgres) instead of scoring every resume up front
+        if settings.MATCH_SCORING_ENGINE == "sql":
+            top = await crud_sql_scoring.get_top_matches_for_job_sql(db, job_requirements, limit, min_score=min_score)
+        else:
+            top = await crud_match.get_top_matches_for_job(
+                db, job_requirements, limit, min_score=min_score,
+                use_bitsets=settings.MATCH_SCORING_ENGINE == "bitset"
             )
-            db.add(match_record)
-            await db.commit()
-            await db.refresh(match_record)
-        
-        matches.append({
-            "candidate_id": resume.user_id,
-            "resume_id": resume.id,
-            "candidate_name": resume.original_filename, # Placeholder for user name
-            "score": match_record.score,
-            "breakdown": match_record.breakdown
-        })
-        
-    # Sort by score descending
-    matches.sort(key=lambda x: x["score"], reverse=True)
-    return matches
+        matches = [
+            {
+                "candidate_id": match["candidate_id"],
+                "resume_id": match["resume_id"],
+                "candidate_name": match["original_filename"], # Placeholder for user name
+                "score": match["score"],
+                **({"breakdown": match["breakdown"]} if include_breakdown else {})
+            }
+            for match in top
+        ]
+        if len(matches) == limit:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(matches[-1]["score"], matches[-1]["resume_id"])
+        return matches
+
+    # Batch-score only resumes with no stored score, or a stale one
+    if await crud_match.fill_unscored_resumes(db, job):
+        await db.commit()
+
+    # Sorted, filtered and paged by the database
+    rows = await crud_match.get_ranked_matches_for_job(
+        db, job_id,
+        limit=limit + 1 if limit is not None else None,
+        min_score=min_score,
+        after=after,
+        include_breakdown=include_breakdown,
+    )
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].score, rows[-1].resume_id)
+
+    return [
+        {
+            "candidate_id": row.candidate_id,
+            "resume_id": row.resume_id,
+            "candidate_name": row.original_filename, # Placeholder for user name
+            "score": row.score,
+            **({"breakdown": row.breakdown} if include_breakdown else {})
+        }
+        for row in rows
+    ]
+
+async def generate_match_lines(
+    job: Job, min_score: Optional[int], include_breakdown: bool
+) -> AsyncIterator[bytes]:
+    """
+    NDJSON lines of ranked matches, read through a server-side cursor.
+
+    Runs in its own session because request-scoped dependencies are closed
+    before a streaming body is sent.
+    """
+    async with AsyncSessionLocal() as session:
+        # Normally a no-op once eager scoring has run; bounded by the chunk size otherwise
+        if await crud_match.fill_unscored_resumes(session, job, chunk_size=STREAM_CHUNK_SIZE):
+            await session.commit()
+
+        stmt = crud_match.ranked_matches_for_job_stmt(
+            job.id, min_score=min_score, include_breakdown=include_breakdown
+        )
+        stream = await session.stream(stmt.execution_options(yield_per=STREAM_CHUNK_SIZE))
+        async for partition in stream.partitions():
+            yield "".join(
+                json.dumps({
+                    "candidate_id": str(row.candidate_id),
+                    "resume_id": str(row.resume_id),
+                    "candidate_name": row.original_filename, # Placeholder for user name
+                    "score": row.score,
+                    **({"breakdown": row.breakdown} if include_breakdown else {})
+                }) + "\n"
+                for row in partition
+            ).encode()
+
+@router.get("/job/{job_id}/stream")
+async def stream_matches_for_job(
+    job_id: uuid.UUID,
+    min_score: Optional[int] = Query(None, ge=0, le=100),
+    include_breakdown: bool = True,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: Any = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Stream every candidate match for a job as NDJSON, best first.
+    """
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job.posted_by != current_user.id:
+         raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    ensure_job_analyzed(job)
+
+    return StreamingResponse(
+        generate_match_lines(job, min_score, include_breakdown),
+        media_type="application/x-ndjson",
+    )
+
+@router.get("/job/{job_id}/similar", response_model=List[dict])
+async def get_similar_candidates(
+    job_id: uuid.UUID,
+    limit: int = Query(20, ge=1, le=200),
+    resume_id: Optional[uuid.UUID] = None,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: Any = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Candidates whose resume text is closest to the job posting, or to the
+    resume `resume_id` when given, by local text similarity.
+
+    Each match also carries its structured score for the job, with the
+    similarity as `semantic_score` in the breakdown.
+    """
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job.posted_by != current_user.id:
+         raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    ensure_job_analyzed(job)
+
+    if resume_id is not None:
+        resume = await db.get(Resume, resume_id, options=[undefer(Resume.text_vector)])
+        if not resume or resume.text_vector is None:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        query = vector_from_bytes(resume.text_vector)
+    else:
+        query = embed_text(job_text(job.title, job.description, job.parsed_requirements))
+
+    hits = await crud_similarity.get_similar_resumes(db, query, limit, exclude=resume_id)
+    results = calculate_match_scores_batch(
+        [row.parsed_json or {} for row, _ in hits],
+        job.parsed_requirements or {},
+        similarities=[similarity for _, similarity in hits],
+    )
+    return [
+        {
+            "candidate_id": row.user_id,
+            "resume_id": row.id,
+            "candidate_name": row.original_filename, # Placeholder for user name
+            "similarity": round(similarity, 4),
+            "score": score_data["score"],
+            "breakdown": score_data["breakdown"]
+        }
+        for (row, similarity), score_data in zip(hits, results)
+    ]
 
 @router.get("/resume/{resume_id}", response_model=List[dict])
 async def get_matches_for_resume(
     resume_id: uuid.UUID,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    min_score: Optional[int] = Query(None, ge=0, le=100),
+    cursor: Optional[str] = None,
+    include_breakdown: bool = True,
     db: AsyncSession = Depends(deps.get_db),
     current_user: Any = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Get all job matches for a specific resume.
+    Get job matches for a specific resume, best first.
     """
     resume = await db.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    
+
     if resume.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
     if resume.status != ResumeStatus.PARSED:
         return [] # Or raise error
 
-    # Fetch all jobs
-    result = await db.execute(select(Job))
-    jobs = result.scalars().all()
-    
-    matches = []
-    for job in jobs:
-        # Check Cache
-        cache_result = await db.execute(
-            select(MatchScore).where(MatchScore.job_id == job.id, MatchScore.resume_id == resume_id)
-        )
-        match_record = cache_result.scalars().first()
-        
-        if not match_record:
-            score_data = calculate_match_score(resume.parsed_json, job.parsed_requirements)
-            match_record = MatchScore(
-                job_id=job.id,
-                candidate_id=resume.user_id,
-                resume_id=resume.id,
-                score=score_data["score"],
-                breakdown=score_data["breakdown"]
-            )
-            db.add(match_record)
-            await db.commit()
-            await db.refresh(match_record)
-            
-        matches.append({
-            "job_id": job.id,
-            "job_title": job.title,
-            "company": job.company,
-            "score": match_record.score,
-            "breakdown": match_record.breakdown
-        })
-        
-    matches.sort(key=lambda x: x["score"], reverse=True)
-    return matches
+    after = decode_cursor(cursor) if cursor else None
+
+    missing = await crud_match.get_unscored_jobs(db, resume)
+    if missing:
+        await crud_match.score_jobs_for_resume(db, resume, missing)
+        await db.commit()
+
+    rows = await crud_match.get_ranked_matches_for_resume(
+        db, resume_id,
+        limit=limit + 1 if limit is not None else None,
+        min_score=min_score,
+        after=after,
+        include_breakdown=include_breakdown,
+    )
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].score, rows[-1].job_id)
+
+    return [
+        {
+            "job_id": row.job_id,
+            "job_title": row.Job.title,
+            "company": row.Job.company,
+            "score": row.score,
+            **({"breakdown": row.breakdown} if include_breakdown else {})
+        }
+        for row in rows
+    ]
@@ -1,19 +1,26 @@
 import os
 import uuid
-import shutil
-from typing import Any, List, Optional
+import json
+import redis
+from typing import Any, AsyncIterator, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.api import deps
+from app.db.session import AsyncSessionLocal
 from app.models.resume import Resume, ResumeStatus
-from app.worker import parse_resume_task
+from app.worker import parse_resume_task, link_duplicate_resume_task, ingest_resumes_task
+from app.core.celery_app import PRIORITY_INTERACTIVE
+from app.core.config import settings
+from app.core.queue_stats import get_ingest_progress, record_ingest_progress
+from app.core.resume_events import subscribe_resume_status
+from starlette.concurrency import run_in_threadpool
+from app.crud import crud_parse_cache, crud_resume
+from app.core.uploads import UPLOAD_DIR, UploadTooLarge, save_upload, move_to_content_address
 
 router = APIRouter()
 
-# Determine absolute path for uploads directory
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-UPLOAD_DIR = os.path.join(BASE_DIR, "uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 @router.post("/upload")
@@ -28,22 +35,27 @@ async def upload_resume(
         
         file_id = str(uuid.uuid4())
         file_extension = os.path.splitext(file.filename)[1]
-        safe_filename = f"{file_id}{file_extension}"
-        file_path = os.path.join(UPLOAD_DIR, safe_filename)
         
-        # Read content to get size and then write
-        content = await file.read()
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
+        # Stream to disk in chunks, hashing and enforcing MAX_UPLOAD_BYTES on the way,
+        # then store by content hash so identical files are kept once
+        try:
+            stored = await save_upload(file, os.path.join(UPLOAD_DIR, f"{file_id}.part"))
+        except UploadTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        stored = await move_to_content_address(stored, UPLOAD_DIR, file_extension)
+        file_path = stored.path
         
-        file_size = len(content)
+        # Reuse the parse of an earlier upload of the same bytes, finished or in flight
+        source = await crud_resume.find_parse_source(db, stored.sha256)
         
         resume = Resume(
             id=uuid.UUID(file_id),
             user_id=current_user.id,
             original_filename=file.filename,
             file_path=file_path,
-            file_size_bytes=file_size,
+            file_size_bytes=stored.size_bytes,
+            content_sha256=stored.sha256,
+            duplicate_of=source.id if source else None,
             status=ResumeStatus.PENDING
         )
         
@@ -53,7 +65,8 @@ async def upload_resume(
         
         # Trigger Celery Task (Pass absolute path for safety)
         try:
-            parse_resume_task.delay(str(resume.id), file_path)
+            task = link_duplicate_resume_task if source else parse_resume_task
+            task.apply_async((str(resume.id), file_path), priority=PRIORITY_INTERACTIVE)
         except Exception as celery_err:
             print(f"CELERY TASK DISPATCH FAILED: {celery_err}")
         
@@ -107,6 +120,57 @@ async def get_my_latest_resume(
         "updated_at": resume.parsed_at
     }
 
+@router.post("/bulk")
+async def bulk_upload_resumes(
+    file: UploadFile = File(...),
+    current_user: Any = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Queue ingestion of a zip archive of PDF resumes; poll GET /bulk/{ingest_id} for progress.
+    """
+    if not file.filename.lower().endswith(".zip"):
+        raise HTTPException(status_code=400, detail="Bulk uploads must be a .zip archive of PDF files")
+    
+    ingest_id = str(uuid.uuid4())
+    archive_dir = os.path.join(UPLOAD_DIR, "bulk")
+    os.makedirs(archive_dir, exist_ok=True)
+    try:
+        stored = await save_upload(file, os.path.join(archive_dir, f"{ingest_id}.zip"), max_bytes=settings.MAX_BULK_UPLOAD_BYTES)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    await run_in_threadpool(record_ingest_progress, ingest_id, {"done": False, "files": 0, "queued": True})
+    try:
+        ingest_resumes_task.delay(stored.path, str(current_user.id), ingest_id, True)
+    except Exception as celery_err:
+        os.remove(stored.path)
+        raise HTTPException(status_code=503, detail=f"Could not queue ingestion: {celery_err}")
+    
+    return {"ingest_id": ingest_id, "archive_bytes": stored.size_bytes}
+
+@router.get("/bulk/{ingest_id}")
+async def get_bulk_upload_progress(
+    ingest_id: uuid.UUID,
+    current_user: Any = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Files stored, parses and duplicates queued, rejects and throughput of a bulk upload.
+    """
+    progress = await run_in_threadpool(get_ingest_progress, str(ingest_id))
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Bulk upload not found")
+    return progress
+
+@router.get("/parse-cache/stats")
+async def get_parse_cache_stats(
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: Any = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Hit/miss counters and size of the LLM parse cache.
+    """
+    return await crud_parse_cache.get_parse_cache_stats(db)
+
 @router.get("/{resume_id}")
 async def get_resume_status(
     resume_id: uuid.UUID,
@@ -119,3 +183,68 @@ async def get_resume_status(
     if resume.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
     return resume
+
+# EventSource reconnects this long after a stream ends or breaks, which also
+# makes it fall back to polling at this interval while Redis is unavailable
+EVENTS_RETRY_MS = 3000
+# Not a ResumeStatus: sent once when the resume is gone, ending the stream
+DELETED_STATUS = "deleted"
+TERMINAL_STATUSES = (ResumeStatus.PARSED.value, ResumeStatus.FAILED.value, DELETED_STATUS)
+
+def format_status_event(event: dict) -> bytes:
+    return f"event: status\ndata: {json.dumps(event)}\n\n".encode()
+
+async def current_status_event(resume_id: uuid.UUID) -> dict:
+    async with AsyncSessionLocal() as session:
+        resume = await session.get(Resume, resume_id)
+    if resume is None:
+        # Removed since the stream opened
+        return {"id": str(resume_id), "status": DELETED_STATUS, "error": None}
+    return {"id": str(resume_id), "status": resume.status.value, "error": resume.error_message}
+
+async def generate_status_events(resume_id: uuid.UUID) -> AsyncIterator[bytes]:
+    """
+    Server-Sent Events of a resume's status: the current one, then every
+    transition, until the resume is PARSED, FAILED or deleted.
+
+    Holds a DB connection only for the initial read, so open streams do not
+    drain the pool.
+    """
+    yield f"retry: {EVENTS_RETRY_MS}\n\n".encode()
+    try:
+        async with subscribe_resume_status(str(resume_id)) as next_event:
+            event = await current_status_event(resume_id)
+            while True:
+                if event is None:
+                    yield b": keepalive\n\n"
+                else:
+                    yield format_status_event(event)
+                    if event["status"] in TERMINAL_STATUSES:
+                        return
+                event = await next_event(settings.RESUME_EVENTS_KEEPALIVE_SECONDS)
+    except redis.RedisError:
+        # Redis unavailable: send the current status and end, so the client reconnects
+        yield format_status_event(await current_status_event(resume_id))
+
+@router.get("/{resume_id}/events")
+async def stream_resume_status(
+    resume_id: uuid.UUID,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: Any = Depends(deps.get_current_active_stream_user),
+) -> Any:
+    """
+    Status changes of an upload as Server-Sent Events, ending once it is
+    PARSED, FAILED or deleted. Replaces polling GET /resumes/{resume_id}. Browsers'
+    EventSource can pass the bearer token as ?access_token=.
+    """
+    resume = await db.get(Resume, resume_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    if resume.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return StreamingResponse(
+        generate_status_events(resume_id),
+        media_type="text/event-stream",
+        # Keep reverse proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
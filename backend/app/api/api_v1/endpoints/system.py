@@ -0,0 +1,20 @@
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
+import redis
+from app.api import deps
+from app.core.queue_stats import get_queue_stats
+
+router = APIRouter()
+
+@router.get("/queues")
+async def get_queues(
+    current_user: Any = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Depth and recent wait times of the parse, score and analysis queues.
+    """
+    try:
+        return await run_in_threadpool(get_queue_stats)
+    except redis.RedisError as e:
+        raise HTTPException(status_code=503, detail=f"Broker unavailable: {e}")
@@ -1,8 +1,63 @@
 from celery import Celery
+from kombu import Queue
 from app.core.config import settings
 
 celery_app = Celery("worker", broker=settings.REDIS_URL)
 
-# celery_app.conf.task_routes = {
-#     "app.worker.parse_resume_task": "main-queue"
-# }
+# One queue per pipeline stage, each consumed by its own worker pool so the
+# stages scale independently (see run_all.ps1 for concurrency and prefetch):
+#   parse    - PDF extraction + LLM parsing, slow and rate limited
+#   score    - match scoring fan-out, short DB-bound tasks
+#   analysis - job description analysis, interactive
+PARSE_QUEUE = "parse"
+SCORE_QUEUE = "score"
+ANALYSIS_QUEUE = "analysis"
+QUEUES = (PARSE_QUEUE, SCORE_QUEUE, ANALYSIS_QUEUE)
+
+# Redis priorities: 0 is served first. Single uploads jump ahead of bulk imports
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 5
+PRIORITY_BULK = 9
+
+celery_app.conf.task_queues = [Queue(name) for name in QUEUES]
+celery_app.conf.task_default_queue = PARSE_QUEUE
+celery_app.conf.task_default_priority = PRIORITY_DEFAULT
+celery_app.conf.task_routes = {
+    "app.worker.parse_resume_task": {"queue": PARSE_QUEUE},
+    "app.worker.link_duplicate_resume_task": {"queue": PARSE_QUEUE},
+    "app.worker.evict_parse_cache_task": {"queue": PARSE_QUEUE},
+    "app.worker.reenrich_*": {"queue": PARSE_QUEUE},
+    "app.worker.ingest_*": {"queue": PARSE_QUEUE},
+    "app.worker.score_*": {"queue": SCORE_QUEUE},
+    "app.worker.refresh_stale_scores_task": {"queue": SCORE_QUEUE},
+    "app.worker.analyze_*": {"queue": ANALYSIS_QUEUE},
+}
+# Each priority level is its own Redis list ("parse", "parse:1" ... "parse:9").
+# Tasks are acknowledged when they finish (acks_late), and Redis redelivers a
+# task not acknowledged within the visibility timeout; it must outlast the
+# longest task (a large bulk ingest) so running tasks are not started twice
+celery_app.conf.broker_transport_options = {
+    "priority_steps": list(range(10)),
+    "sep": ":",
+    "queue_order_strategy": "priority",
+    "visibility_timeout": 6 * 3600,
+}
+# Workers hold no more than they run, so a waiting interactive task is never
+# stuck behind a bulk backlog prefetched by a busy worker
+celery_app.conf.worker_prefetch_multiplier = 1
+
+celery_app.conf.beat_schedule = {
+    # Recompute match scores left stale by re-parses, requirement edits or a scoring version bump
+    "refresh-stale-match-scores": {
+        "task": "app.worker.refresh_stale_scores_task",
+        "schedule": 3600.0,
+    },
+    # Enforce the LLM parse cache TTL and size cap
+    "evict-parse-cache": {
+        "task": "app.worker.evict_parse_cache_task",
+        "schedule": 3600.0,
+    },
+}
+
+# Queue depth and wait-time tracking
+import app.core.queue_stats  # noqa: E402,F401
@@ -87,6 +87,48 @@ class Settings(BaseSettings):
     
     # LLM
     GROQ_API_KEY: Optional[str] = None
+    # Raw LLM resume parses are reused for identical text; entries unused for
+    # the TTL, or beyond the size cap (least recently used first), are evicted
+    PARSE_CACHE_TTL_DAYS: int = 30
+    PARSE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    # Resumes parsed concurrently per worker process; run the worker with
+    # --pool=threads and at least this --concurrency to use it
+    PARSE_CONCURRENCY: int = 8
+    # Resumes the local heuristic parser understands at least this well (0-1)
+    # skip the LLM; 1.1 sends every resume to the LLM
+    HEURISTIC_PARSE_MIN_CONFIDENCE: float = 0.8
+    # PDF text extraction budget; the LLM prompt only sees the first 15,000 chars.
+    # Documents with at least PDF_PARALLEL_MIN_PAGES pages to read are split
+    # across PDF_EXTRACT_WORKERS processes
+    PDF_MAX_CHARS: int = 15000
+    PDF_MAX_PAGES: int = 30
+    PDF_PARALLEL_MIN_PAGES: int = 16
+    PDF_EXTRACT_WORKERS: int = 4
+    # Largest accepted resume upload; bigger requests are rejected from their
+    # Content-Length before the body is read
+    MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    UPLOAD_CHUNK_BYTES: int = 256 * 1024
+    # Zip archives accepted by POST /resumes/bulk
+    MAX_BULK_UPLOAD_BYTES: int = 5 * 1024 * 1024 * 1024
+    # Groq quota shared by all API and worker processes (token buckets in Redis).
+    # Bulk resume parsing leaves LLM_BULK_RESERVE of both buckets to interactive
+    # job analysis, waits at most LLM_BULK_MAX_WAIT_SECONDS in-process and is
+    # then requeued, up to LLM_MAX_REQUEUES times before the resume is FAILED
+    GROQ_REQUESTS_PER_MINUTE: int = 30
+    GROQ_TOKENS_PER_MINUTE: int = 12000
+    LLM_BULK_RESERVE: float = 0.2
+    LLM_BULK_MAX_WAIT_SECONDS: float = 30.0
+    LLM_INTERACTIVE_MAX_WAIT_SECONDS: float = 20.0
+    LLM_MAX_REQUEUES: int = 20
+    # Resume status event streams send a comment this often while idle, so
+    # proxies keep the connection open and dead clients are noticed
+    RESUME_EVENTS_KEEPALIVE_SECONDS: float = 15.0
+    
+    # Matching
+    # "python": skill-index retrieval + NumPy batch scorer
+    # "bitset": same, with candidate overlap from packed skill bitsets
+    # "sql": set-based scoring inside Postgres
+    MATCH_SCORING_ENGINE: str = "python"
     
     class Config:
         env_file = ".env"
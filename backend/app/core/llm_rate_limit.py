@@ -0,0 +1,153 @@
+"""
+Global Groq rate limiting shared by every worker process and the API.
+
+Two token buckets live in Redis, one for requests and one for tokens per
+minute, and are debited atomically by a Lua script using the Redis clock.
+Priority is enforced with headroom: bulk callers may only draw a bucket down
+to `LLM_BULK_RESERVE` of its capacity, so interactive job analysis still
+finds capacity during a bulk import.
+"""
+import asyncio
+import enum
+import logging
+import random
+from typing import Optional
+import redis.asyncio as redis
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+REQUESTS_KEY = "llm_rate:groq:requests"
+TOKENS_KEY = "llm_rate:groq:tokens"
+
+
+class LLMPriority(str, enum.Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+class LLMRateLimited(Exception):
+    """No LLM capacity within the caller's wait budget; retry later."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"LLM rate limit reached, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+# KEYS: requests bucket, tokens bucket
+# ARGV: request capacity, token capacity, request cost, token cost, reserve fraction
+# Returns 0 when granted, otherwise milliseconds until the cost could fit.
+_ACQUIRE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local reserve = tonumber(ARGV[5])
+local wait = 0
+local levels = {}
+for i = 1, 2 do
+    local capacity = tonumber(ARGV[i])
+    local cost = tonumber(ARGV[i + 2])
+    local state = redis.call('HMGET', KEYS[i], 'level', 'ts')
+    local level = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    local rate = capacity / 60000
+    level = math.min(capacity, level + math.max(0, now - ts) * rate)
+    levels[i] = level
+    local need = cost + capacity * reserve - level
+    if need > 0 then
+        wait = math.max(wait, math.ceil(need / rate))
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i = 1, 2 do
+    redis.call('HSET', KEYS[i], 'level', levels[i] - tonumber(ARGV[i + 2]), 'ts', now)
+    redis.call('PEXPIRE', KEYS[i], 120000)
+end
+return 0
+"""
+
+# KEYS: tokens bucket. ARGV: token capacity, tokens to give back
+_REFUND_LUA = """
+local level = tonumber(redis.call('HGET', KEYS[1], 'level'))
+if level then
+    redis.call('HSET', KEYS[1], 'level', math.min(tonumber(ARGV[1]), level + tonumber(ARGV[2])))
+end
+return 0
+"""
+
+_client: Optional[redis.Redis] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _redis() -> redis.Redis:
+    # Connections are bound to the loop that opened them
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = redis.from_url(settings.get_redis_url(), socket_connect_timeout=1)
+        _client_loop = loop
+    return _client
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """Upper bound on the tokens a call may consume (about 4 characters per token)."""
+    return len(prompt) // 4 + max_tokens
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def retry_after_seconds(error: Exception, default: float) -> float:
+    """The Retry-After of a provider 429 response, or `default`."""
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return default
+
+
+async def acquire_llm_capacity(priority: LLMPriority, tokens: int, max_wait: float) -> int:
+    """
+    Wait until one request and `tokens` tokens fit in the global buckets and
+    debit them. Returns the tokens charged, to pass to `refund_llm_tokens`.
+
+    Raises LLMRateLimited when that would take longer than `max_wait`
+    seconds. If Redis is unreachable, calls are let through unmetered.
+    """
+    request_capacity = settings.GROQ_REQUESTS_PER_MINUTE
+    token_capacity = settings.GROQ_TOKENS_PER_MINUTE
+    reserve = settings.LLM_BULK_RESERVE if priority == LLMPriority.BULK else 0.0
+    # A single call larger than the bucket could otherwise never be granted
+    tokens = min(tokens, int(token_capacity * (1 - reserve)))
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
+    while True:
+        try:
+            wait_ms = await _redis().eval(
+                _ACQUIRE_LUA, 2, REQUESTS_KEY, TOKENS_KEY,
+                request_capacity, token_capacity, 1, tokens, reserve,
+            )
+        except redis.RedisError as e:
+            logger.warning(f"LLM rate limiter unavailable, not metering: {e}")
+            return 0
+        if not wait_ms:
+            return tokens
+        # Jitter so waiting workers do not retry in lockstep
+        delay = wait_ms / 1000 * random.uniform(1.0, 1.5)
+        if loop.time() + delay > deadline:
+            raise LLMRateLimited(retry_after=delay)
+        await asyncio.sleep(delay)
+
+
+async def refund_llm_tokens(charged: int, used: Optional[int]) -> None:
+    """Give back the part of an estimate a finished call did not use."""
+    if not charged or used is None or used >= charged:
+        return
+    try:
+        await _redis().eval(_REFUND_LUA, 1, TOKENS_KEY, settings.GROQ_TOKENS_PER_MINUTE, charged - used)
+    except redis.RedisError as e:
+        logger.warning(f"LLM rate limiter unavailable, refund dropped: {e}")
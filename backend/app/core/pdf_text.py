@@ -0,0 +1,170 @@
+"""
+Budgeted PDF text extraction.
+
+Reading stops once `max_chars` characters or `max_pages` pages are in hand,
+since everything past the LLM prompt budget is thrown away anyway. Large
+page ranges are split across a process pool, and the result is cached in a
+JSON sidecar next to the upload so re-parses skip PyMuPDF entirely.
+
+Kept free of app imports so pool workers start quickly.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+import json
+import multiprocessing
+import os
+import threading
+import time
+import fitz  # PyMuPDF
+
+SIDECAR_SUFFIX = ".text.json"
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+@dataclass
+class PdfExtraction:
+    text: str
+    page_count: int
+    pages_read: int
+    truncated: bool
+    seconds: float
+    cached: bool = False
+
+    def report(self) -> dict:
+        """Per-resume extraction stats, without the text."""
+        stats = asdict(self)
+        del stats["text"]
+        stats["chars"] = len(self.text)
+        stats["seconds"] = round(self.seconds, 4)
+        return stats
+
+
+def _read_pages(file_path: str, start: int, stop: int, max_chars: int) -> List[str]:
+    """Text of pages [start, stop), stopping early once `max_chars` are read."""
+    parts: List[str] = []
+    total = 0
+    with fitz.open(file_path) as doc:
+        for number in range(start, min(stop, doc.page_count)):
+            page_text = doc[number].get_text()
+            parts.append(page_text)
+            total += len(page_text)
+            if total >= max_chars:
+                break
+    return parts
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            # spawn: forking a process that runs threads (worker loop, Celery) is unsafe
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def _sidecar_path(file_path: str) -> str:
+    return file_path + SIDECAR_SUFFIX
+
+
+def _load_sidecar(file_path: str, max_chars: int, max_pages: int) -> Optional[PdfExtraction]:
+    path = _sidecar_path(file_path)
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(file_path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("max_chars") != max_chars or data.get("max_pages") != max_pages:
+        return None
+    return PdfExtraction(
+        text=data["text"], page_count=data["page_count"], pages_read=data["pages_read"],
+        truncated=data["truncated"], seconds=data["seconds"], cached=True,
+    )
+
+
+def _store_sidecar(file_path: str, extraction: PdfExtraction, max_chars: int, max_pages: int) -> None:
+    path = _sidecar_path(file_path)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"max_chars": max_chars, "max_pages": max_pages, **asdict(extraction)}, f)
+        os.replace(tmp, path)
+    except OSError:
+        # The cache is an optimization; a read-only upload dir must not fail the parse
+        pass
+
+
+def extract_pdf_text(
+    file_path: str,
+    max_chars: int,
+    max_pages: int,
+    parallel_min_pages: int = 16,
+    workers: int = 4,
+    use_cache: bool = True,
+) -> PdfExtraction:
+    """
+    Text of the first pages of a PDF, up to `max_chars` characters and
+    `max_pages` pages.
+
+    Pages beyond the first `parallel_min_pages` are split across `workers`
+    processes when the budget is not yet reached.
+    """
+    if use_cache:
+        cached = _load_sidecar(file_path, max_chars, max_pages)
+        if cached is not None:
+            return cached
+
+    start = time.perf_counter()
+    with fitz.open(file_path) as doc:
+        page_count = doc.page_count
+    stop = min(page_count, max_pages)
+
+    # Most resumes hit the character budget within a few pages, so the head
+    # is read in-process and only the remaining range of long, text-light
+    # documents is fanned out
+    parts = _read_pages(file_path, 0, min(stop, parallel_min_pages), max_chars)
+    total = sum(len(p) for p in parts)
+    if total < max_chars and stop > parallel_min_pages:
+        rest = range(parallel_min_pages, stop)
+        futures = []
+        if workers > 1:
+            step = -(-len(rest) // workers)
+            futures = [
+                _get_pool(workers).submit(_read_pages, file_path, lo, min(lo + step, stop), max_chars - total)
+                for lo in range(rest.start, stop, step)
+            ]
+            chunks = (future.result() for future in futures)
+        else:
+            chunks = iter([_read_pages(file_path, rest.start, stop, max_chars - total)])
+        try:
+            for chunk in chunks:
+                for page_text in chunk:
+                    if total >= max_chars:
+                        break
+                    parts.append(page_text)
+                    total += len(page_text)
+                if total >= max_chars:
+                    break
+        finally:
+            # The pool is shared: drop ranges not started yet once the budget
+            # is reached (or a range failed) instead of leaving them queued
+            for future in futures:
+                future.cancel()
+
+    text = "".join(parts)
+    extraction = PdfExtraction(
+        text=text[:max_chars],
+        page_count=page_count,
+        pages_read=len(parts),
+        truncated=len(text) > max_chars or len(parts) < page_count,
+        seconds=time.perf_counter() - start,
+    )
+    if use_cache:
+        _store_sidecar(file_path, extraction, max_chars, max_pages)
+    return extraction
@@ -0,0 +1,112 @@
+"""
+Per-queue depth and wait time of the Celery pipeline.
+
+Every published task is stamped with the time it becomes runnable; when a
+worker picks it up, the wait is recorded in a capped Redis list per queue.
+Depth is read straight from the broker lists, one per priority level.
+Bulk ingestion runs publish their progress here too.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+import json
+import logging
+import time
+import redis
+from celery.signals import before_task_publish, task_prerun
+from app.core.celery_app import QUEUES, celery_app
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+WAIT_SAMPLES = 1000
+WAIT_KEY = "queue_stats:wait:{queue}"
+
+_client: Optional[redis.Redis] = None
+
+
+def _redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.get_redis_url(), socket_connect_timeout=1, socket_timeout=1)
+    return _client
+
+
+@before_task_publish.connect
+def _stamp_enqueue_time(headers=None, **kwargs):
+    if headers is None:
+        return
+    ready_at = time.time()
+    # Countdown/ETA tasks (e.g. rate-limit requeues) only start waiting at their ETA
+    eta = headers.get("eta")
+    if eta:
+        try:
+            ready_at = max(ready_at, datetime.fromisoformat(eta).timestamp())
+        except (TypeError, ValueError):
+            pass
+    headers["ready_at"] = ready_at
+
+
+@task_prerun.connect
+def _record_wait(task=None, **kwargs):
+    ready_at = getattr(task.request, "ready_at", None)
+    queue = (task.request.delivery_info or {}).get("routing_key")
+    if ready_at is None or queue not in QUEUES:
+        return
+    key = WAIT_KEY.format(queue=queue)
+    try:
+        pipe = _redis().pipeline()
+        pipe.lpush(key, round(max(0.0, time.time() - ready_at), 3))
+        pipe.ltrim(key, 0, WAIT_SAMPLES - 1)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.debug(f"Queue wait not recorded: {e}")
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def get_queue_stats() -> Dict[str, dict]:
+    """Waiting tasks (total and by priority) and recent wait times per queue."""
+    options = celery_app.conf.broker_transport_options
+    sep = options.get("sep", ":")
+    steps = options.get("priority_steps", [0])
+    client = _redis()
+    stats = {}
+    for queue in QUEUES:
+        pipe = client.pipeline()
+        for step in steps:
+            # Priority 0 lives in the plain queue list
+            pipe.llen(f"{queue}{sep}{step}" if step else queue)
+        pipe.lrange(WAIT_KEY.format(queue=queue), 0, -1)
+        *depths, waits = pipe.execute()
+        waits = [float(w) for w in waits]
+        stats[queue] = {
+            "depth": sum(depths),
+            "depth_by_priority": {step: depth for step, depth in zip(steps, depths) if depth},
+            "wait_seconds": {
+                "samples": len(waits),
+                "p50": _percentile(waits, 0.5) if waits else None,
+                "p95": _percentile(waits, 0.95) if waits else None,
+                "max": max(waits) if waits else None,
+            },
+        }
+    return stats
+
+
+# Bulk ingestion progress, written by the ingesting worker after each batch
+INGEST_KEY = "ingest:{ingest_id}"
+INGEST_PROGRESS_TTL = 7 * 24 * 3600
+
+
+def record_ingest_progress(ingest_id: str, progress: dict) -> None:
+    try:
+        _redis().set(INGEST_KEY.format(ingest_id=ingest_id), json.dumps(progress), ex=INGEST_PROGRESS_TTL)
+    except redis.RedisError as e:
+        logger.warning(f"Ingest progress not recorded: {e}")
+
+
+def get_ingest_progress(ingest_id: str) -> Optional[dict]:
+    data = _redis().get(INGEST_KEY.format(ingest_id=ingest_id))
+    return json.loads(data) if data else None
@@ -0,0 +1,64 @@
+"""
+Resume status transitions over Redis pub/sub.
+
+The worker publishes every status change of a resume to its own channel
+after committing it; the API relays the channel to the uploader as a
+Server-Sent Events stream, so clients no longer poll for the end of a parse.
+Publishing is best effort: without Redis, clients still see the status on
+their next read of the resume.
+"""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional
+import asyncio
+import json
+import logging
+import redis.asyncio as redis
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "resume_status:{resume_id}"
+
+_client: Optional[redis.Redis] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _redis() -> redis.Redis:
+    # Connections are bound to the loop that opened them
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = redis.from_url(settings.get_redis_url(), socket_connect_timeout=1)
+        _client_loop = loop
+    return _client
+
+
+async def publish_resume_status(resume_id: str, status: str, error: Optional[str] = None) -> None:
+    event = {"id": resume_id, "status": status, "error": error}
+    try:
+        await _redis().publish(CHANNEL.format(resume_id=resume_id), json.dumps(event))
+    except redis.RedisError as e:
+        logger.warning(f"Status event for resume {resume_id} not published: {e}")
+
+
+@asynccontextmanager
+async def subscribe_resume_status(
+    resume_id: str,
+) -> AsyncIterator[Callable[[float], Awaitable[Optional[dict]]]]:
+    """
+    Subscribe to a resume's status events, yielding `next_event(timeout)`,
+    which returns the next event or None when `timeout` seconds pass without one.
+
+    Subscribe before reading the current status, so no transition falls in between.
+    """
+    pubsub = _redis().pubsub()
+    try:
+        await pubsub.subscribe(CHANNEL.format(resume_id=resume_id))
+
+        async def next_event(timeout: float) -> Optional[dict]:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+            return json.loads(message["data"]) if message else None
+
+        yield next_event
+    finally:
+        await pubsub.aclose()
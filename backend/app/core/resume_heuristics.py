@@ -0,0 +1,304 @@
+"""
+Deterministic local resume extraction, the fast tier ahead of the LLM.
+
+`extract_resume_locally` returns the same raw structure the LLM prompt asks
+for (contact, skills, projects, experience, education, certifications,
+volunteering, summary), so either result goes through `enrich_resume_data`,
+plus a 0-1 confidence that says whether the LLM is still needed.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import re
+
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "objective", "career objective", "about me", "about"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "core competencies", "technologies",
+               "tech stack", "tools and technologies", "skills and tools"],
+    "experience": ["experience", "work experience", "professional experience", "employment", "employment history",
+                   "work history", "internships", "internship experience"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects", "project experience"],
+    "education": ["education", "academic background", "academics", "educational qualifications", "qualifications"],
+    "certifications": ["certifications", "certificates", "licenses and certifications", "courses and certifications",
+                       "courses"],
+    "volunteering": ["volunteering", "volunteer experience", "extracurricular activities", "activities"],
+}
+_HEADING_LOOKUP = {h: section for section, headings in SECTION_HEADINGS.items() for h in headings}
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s*'?\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}})"
+DATE_RANGE_RE = re.compile(
+    rf"(?P<start>{_DATE})\s*(?:-|–|—|to|till|until)\s*(?P<end>{_DATE}|present|current|now|ongoing|date)",
+    re.IGNORECASE,
+)
+YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_RE = re.compile(r"(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)[\s.-]?)?\d{3,5}[\s.-]?\d{3,5}(?:[\s.-]?\d{2,4})?")
+LINKEDIN_RE = re.compile(r"(?:https?://)?(?:[\w]+\.)?linkedin\.com/[\w/%-]+", re.IGNORECASE)
+DEGREE_RE = re.compile(
+    r"\b(ph\.?\s?d|doctor(?:ate)?|master(?:'?s)?|m\.?\s?(?:sc|s|tech|e|a|ba|ca)\b|mba|bachelor(?:'?s)?|"
+    r"b\.?\s?(?:sc|s|tech|e|a|ca|com)\b|associate|diploma|high school|secondary|hsc|ssc)",
+    re.IGNORECASE,
+)
+INSTITUTION_RE = re.compile(r"\b(university|college|institute|school|academy|polytechnic|iit|nit)\b", re.IGNORECASE)
+FIELD_RE = re.compile(r"^.*\b(?:in|of)\s+([A-Z][\w&. ]+?)(?:\s*[,|(\-–]|\s+\d|$)")
+_BULLET_RE = re.compile(r"^\s*(?:[•●▪■◦‣*·-]|\d+[.)])\s*")
+# Skill list separators. "/" and "and" split only between spaced items
+# ("Java / Go", "Python, and SQL"), never inside names like CI/CD or R and D
+_SPLIT_RE = re.compile(r"\s*(?:,(?:\s*and\b)?|;|\||•|●|▪|\s/\s)\s*")
+_ROLE_WORDS_RE = re.compile(r"\b(engineer|developer|intern|analyst|manager|lead|designer|scientist|consultant|"
+                            r"architect|assistant|associate|specialist|administrator|officer|trainee)\b", re.I)
+
+
+def _is_bullet(line: str) -> bool:
+    return bool(_BULLET_RE.match(line))
+
+
+def _strip_bullet(line: str) -> str:
+    return _BULLET_RE.sub("", line).strip()
+
+
+def _heading(line: str) -> Optional[str]:
+    """Section name when `line` is a section heading."""
+    stripped = re.sub(r"[^a-z& ]", "", line.lower().replace("&", " and ")).strip()
+    stripped = re.sub(r"\s+", " ", stripped)
+    if not stripped or len(line.strip()) > 40:
+        return None
+    return _HEADING_LOOKUP.get(stripped)
+
+
+def split_sections(text: str) -> Tuple[List[str], Dict[str, List[str]]]:
+    """(header lines before the first heading, {section: lines})."""
+    header: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        section = _heading(line)
+        if section:
+            current = sections.setdefault(section, [])
+        elif current is None:
+            header.append(line)
+        else:
+            current.append(line)
+    return header, sections
+
+
+def _contact(header: List[str], text: str) -> Dict[str, str]:
+    email = EMAIL_RE.search(text)
+    linkedin = LINKEDIN_RE.search(text)
+    phone = ""
+    for match in PHONE_RE.finditer(text[:2000]):
+        if len(re.sub(r"\D", "", match.group())) >= 10:
+            phone = match.group().strip()
+            break
+    name = ""
+    for line in header[:5]:
+        words = line.split()
+        if 2 <= len(words) <= 4 and all(re.fullmatch(r"[A-Za-z][A-Za-z.'-]*", w) for w in words):
+            name = line
+            break
+    return {
+        "name": name,
+        "email": email.group() if email else "",
+        "phone": phone,
+        "linkedin": linkedin.group() if linkedin else "",
+        "location": "",
+    }
+
+
+def _split_role_company(line: str) -> Tuple[str, str, bool]:
+    """
+    Best-effort (role, company) from a title line like 'Role at Company' or
+    'Company | Role', and whether a real role/company separator was found
+    (rather than the line just being cut at its first comma or dash).
+    """
+    line = line.strip(" ,|-–—")
+    match = re.match(r"(.+?)\s+(?:at|@)\s+(.+)", line)
+    if match:
+        return match.group(1).strip(), match.group(2).strip(), True
+    parts = [p.strip() for p in re.split(r"\s+[|–—-]\s+|,\s+", line) if p.strip()]
+    if len(parts) >= 2:
+        first, second = bool(_ROLE_WORDS_RE.search(parts[0])), bool(_ROLE_WORDS_RE.search(parts[1]))
+        if second and not first:
+            return parts[1], parts[0], True
+        return parts[0], parts[1], first and not second
+    return line, "", False
+
+
+def _entries(lines: List[str], starts: Callable[[int, str], bool]) -> List[List[str]]:
+    """Group section lines into entries, each starting where `starts` is true."""
+    entries: List[List[str]] = []
+    for i, line in enumerate(lines):
+        if not entries or starts(i, line):
+            entries.append([line])
+        else:
+            entries[-1].append(line)
+    return entries
+
+
+def _experience(
+    lines: List[str], skill_extractor: Callable[[str], List[str]]
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Dated experience entries, and how many of them had a recognized role/company split."""
+    dated = [i for i, line in enumerate(lines) if DATE_RANGE_RE.search(line)]
+    if not dated:
+        return [], 0
+    # An entry starts at its title line: the dated line itself, or the
+    # non-bullet line right above it when the date sits on its own line
+    starts = set()
+    for i in dated:
+        before = DATE_RANGE_RE.sub("", lines[i]).strip(" ,|-–—()")
+        if not before and i > 0 and not _is_bullet(lines[i - 1]):
+            starts.add(i - 1)
+        else:
+            starts.add(i)
+    result = []
+    complete = 0
+    for entry in _entries(lines, lambda i, _: i in starts):
+        block = "\n".join(entry)
+        dates = DATE_RANGE_RE.search(block)
+        if not dates:
+            continue
+        title_lines = [DATE_RANGE_RE.sub("", l).strip(" ,|-–—()") for l in entry[:3] if not _is_bullet(l)]
+        title_lines = [l for l in title_lines if l]
+        role, company, split = _split_role_company(title_lines[0]) if title_lines else ("", "", False)
+        if not company and len(title_lines) > 1:
+            # Role on one line, company on the next
+            company = title_lines[1]
+            split = bool(_ROLE_WORDS_RE.search(role)) and not _ROLE_WORDS_RE.search(company)
+        complete += split
+        end = dates.group("end")
+        result.append({
+            "company": company,
+            "role": role,
+            "start_date": dates.group("start"),
+            "end_date": "Present" if end.lower() in ("present", "current", "now", "ongoing", "date") else end,
+            "description": " ".join(_strip_bullet(l) for l in entry if _is_bullet(l))[:1000],
+            "technologies": skill_extractor(block),
+        })
+    return result, complete
+
+
+def _education(lines: List[str]) -> List[Dict[str, Any]]:
+    # A new entry starts when a degree or institution line repeats
+    entries: List[List[str]] = []
+    seen = set()
+    for line in lines:
+        kind = "degree" if DEGREE_RE.search(line) else "institution" if INSTITUTION_RE.search(line) else None
+        if not entries or (kind and kind in seen):
+            entries.append([])
+            seen = set()
+        entries[-1].append(line)
+        if kind:
+            seen.add(kind)
+
+    result: List[Dict[str, Any]] = []
+    for entry in entries:
+        degree_line = next((l for l in entry if DEGREE_RE.search(l)), "")
+        institution = next((l for l in entry if INSTITUTION_RE.search(l) and l != degree_line), "")
+        if not degree_line and not institution:
+            continue
+        years = [m.group() for m in YEAR_RE.finditer(" ".join(entry))]
+        field = FIELD_RE.search(degree_line)
+        result.append({
+            "institution": DATE_RANGE_RE.sub("", institution).strip(" ,|-–—()"),
+            "degree": DATE_RANGE_RE.sub("", degree_line).strip(" ,|-–—()"),
+            "field": field.group(1).strip() if field else "",
+            "start_date": years[0] if len(years) > 1 else "",
+            "end_date": years[-1] if years else "",
+        })
+    return result
+
+
+def _projects(lines: List[str], skill_extractor: Callable[[str], List[str]]) -> List[Dict[str, Any]]:
+    result = []
+    for entry in _entries(lines, lambda i, line: not _is_bullet(line) and i > 0 and _is_bullet(lines[i - 1])):
+        title = DATE_RANGE_RE.sub("", _strip_bullet(entry[0])).strip(" ,|-–—()")
+        title = re.split(r"\s+[|–—-]\s+|:\s", title)[0][:80]
+        block = "\n".join(entry)
+        duration = DATE_RANGE_RE.search(block) or YEAR_RE.search(block)
+        result.append({
+            "title": title,
+            "description": " ".join(_strip_bullet(l) for l in entry[1:])[:1000],
+            "technologies": skill_extractor(block),
+            "duration": duration.group() if duration else "",
+        })
+    return result
+
+
+def _listed_skills(lines: List[str]) -> List[str]:
+    skills = []
+    for line in lines:
+        # Drop "Languages:" style category labels
+        line = re.sub(r"^[^:]{1,30}:\s*", "", _strip_bullet(line))
+        for item in _SPLIT_RE.split(line):
+            item = item.strip(" .")
+            if item and len(item) <= 40 and len(item.split()) <= 4:
+                skills.append(item)
+    return list(dict.fromkeys(skills))
+
+
+def extract_resume_locally(
+    text: str, skill_extractor: Callable[[str], List[str]]
+) -> Tuple[Dict[str, Any], float]:
+    """
+    Heuristic extraction of the LLM's raw resume structure from plain text.
+
+    `skill_extractor` finds known skills in a block of text. Returns the raw
+    data and a confidence in [0, 1] of how completely the resume was
+    understood: well-sectioned resumes with dated roles score high, free-form
+    layouts low.
+    """
+    header, sections = split_sections(text)
+    contact = _contact(header, text)
+
+    listed = _listed_skills(sections.get("skills", []))
+    found = skill_extractor(text)
+    skills = list(dict.fromkeys(listed + found))
+
+    experience, complete_experience = _experience(sections.get("experience", []), skill_extractor)
+    education = _education(sections.get("education", []))
+    projects = _projects(sections.get("projects", []), skill_extractor) if sections.get("projects") else []
+    certifications = [{"name": _strip_bullet(l)[:120], "issuer": "", "date": (YEAR_RE.search(l) or [""])[0]}
+                      for l in sections.get("certifications", [])]
+    raw_data = {
+        "contact": contact,
+        "skills": skills,
+        "projects": projects,
+        "experience": experience,
+        "education": education,
+        "certifications": certifications,
+        "volunteering": [_strip_bullet(l) for l in sections.get("volunteering", [])],
+        "summary": " ".join(sections.get("summary", []))[:1000],
+    }
+
+    # Confidence: each signal is worth a share of 1.0
+    confidence = 0.0
+    confidence += 0.10 if contact["email"] else 0.0
+    confidence += 0.05 if contact["name"] else 0.0
+    confidence += 0.20 * min(len(skills) / 5, 1.0)
+    exp_lines = sections.get("experience", [])
+    if exp_lines:
+        # Only dated entries split on a real role/company separator count
+        confidence += 0.30 * (complete_experience / len(experience)) if experience else 0.0
+    else:
+        # No experience section at all is normal for freshers: judge by projects
+        confidence += 0.20 if projects else 0.0
+    confidence += 0.15 if any(e["degree"] for e in education) else 0.0
+    total_lines = len(header) + sum(len(lines) for lines in sections.values())
+    if total_lines:
+        # Share of the text that landed in a recognized section
+        confidence += 0.20 * min((total_lines - len(header)) / total_lines / 0.8, 1.0)
+    return raw_data, round(min(confidence, 1.0), 2)
+
+
+def refine_llm_result(llm_raw: Dict[str, Any], local_raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill contact fields the LLM left empty from the local extraction."""
+    refined = dict(llm_raw)
+    contact = dict(refined.get("contact") or {}) if isinstance(refined.get("contact"), dict) else {}
+    for key, value in (local_raw.get("contact") or {}).items():
+        if value and not contact.get(key):
+            contact[key] = value
+    refined["contact"] = contact
+    return refined
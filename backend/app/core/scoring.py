@@ -1,10 +1,92 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
+import hashlib
+import json
+import numpy as np
 
-def calculate_match_score(resume_data: Dict[str, Any], job_requirements: Dict[str, Any]) -> Dict[str, Any]:
+# Bump whenever the formula or weights below change; stored scores with an
+# older version are recomputed lazily or by the background sweep.
+SCORING_VERSION = 2
+
+# Simple hierarchy: Ph.D > Masters > Bachelors > Associate
+EDU_RANK = {"phd": 4, "masters": 3, "bachelors": 2, "associate": 1, "": 0}
+
+
+def normalize_edu(e: str) -> str:
+    """Normalize education names (common patterns)"""
+    e = e.lower()
+    if "phd" in e or "doctor" in e: return "phd"
+    if "master" in e: return "masters"
+    if "bachelor" in e or "degree" in e: return "bachelors"
+    return ""
+
+
+def resume_skill_names(resume_data: Dict[str, Any]) -> List[str]:
+    """
+    Lowercased skill names of a parsed resume.
+
+    Accepts both the plain string list returned by the LLM and the enriched
+    `{"skill": ..., "evidence": ...}` entries produced by `enrich_resume_data`.
+    """
+    names = []
+    for s in resume_data.get("skills", []) or []:
+        if isinstance(s, dict):
+            s = s.get("skill", "")
+        if s:
+            names.append(str(s).lower())
+    return names
+
+
+def resume_experience_years(resume_data: Dict[str, Any]) -> float:
+    """
+    `total_experience_years` of a parsed resume; anything but a number (a
+    string from the LLM, null, a missing key) counts as 0, as in the SQL scorer.
+    """
+    value = resume_data.get("total_experience_years", 0)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return 0
+
+
+def _digest(payload: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def resume_features_hash(resume_data: Dict[str, Any]) -> str:
+    """Hash of only the resume fields the scorer reads."""
+    resume_data = resume_data or {}
+    return _digest({
+        "skills": sorted(set(resume_skill_names(resume_data))),
+        "total_experience_years": resume_data.get("total_experience_years", 0),
+        "education_level": resume_data.get("education_level", ""),
+    })
+
+
+def job_requirements_hash(job_requirements: Dict[str, Any]) -> str:
+    """Hash of only the job requirement fields the scorer reads."""
+    job_requirements = job_requirements or {}
+    return _digest({
+        "required_skills": sorted(set(s.lower() for s in job_requirements.get("required_skills", []))),
+        "experience_years": job_requirements.get("experience_years", 0),
+        "education_level": job_requirements.get("education_level", ""),
+    })
+
+
+def semantic_score(similarity: float) -> int:
+    """Cosine similarity of resume and job text vectors as 0-100 points."""
+    return round(min(max(similarity, 0.0), 1.0) * 100)
+
+
+def calculate_match_score(
+    resume_data: Dict[str, Any],
+    job_requirements: Dict[str, Any],
+    similarity: Optional[float] = None,
+) -> Dict[str, Any]:
     """
     Calculate a match score between a parsed resume and structured job requirements.
-    
-    Returns a score (0-100) and a breakdown.
+
+    Returns a score (0-100) and a breakdown. With `similarity` (see
+    app/core/similarity.py) the breakdown also carries a `semantic_score`;
+    it is reported alongside the score and not added to it.
     """
     score = 0
     breakdown = {
@@ -17,23 +99,23 @@ def calculate_match_score(resume_data: Dict[str, Any], job_requirements: Dict[st
 
     # 1. Skills Match (50%)
     req_skills = set([s.lower() for s in job_requirements.get("required_skills", [])])
-    parsed_skills = set([s.lower() for s in resume_data.get("skills", [])])
-    
+    parsed_skills = set(resume_skill_names(resume_data))
+
     if req_skills:
         matched = req_skills.intersection(parsed_skills)
         breakdown["matched_skills"] = list(matched)
         breakdown["missing_skills"] = list(req_skills - parsed_skills)
-        
+
         skills_ratio = len(matched) / len(req_skills)
         breakdown["skills_score"] = round(skills_ratio * 50)
     else:
         breakdown["skills_score"] = 50 # Default if no requirements
-    
+
     # 2. Experience Match (30%)
     req_exp = job_requirements.get("experience_years", 0)
     # Estimate resume experience - usually LLM extracts a float or we can sum roles
-    resume_exp = resume_data.get("total_experience_years", 0)
-    
+    resume_exp = resume_experience_years(resume_data)
+
     if req_exp > 0:
         exp_ratio = min(resume_exp / req_exp, 1.2) # Bonus up to 1.2x
         # If they meet req, they get full 30, else partial
@@ -45,32 +127,156 @@ def calculate_match_score(resume_data: Dict[str, Any], job_requirements: Dict[st
         breakdown["experience_score"] = 30
 
     # 3. Education Match (20%)
-    # Simple hierarchy: Ph.D > Masters > Bachelors > Associate
-    edu_rank = {"phd": 4, "masters": 3, "bachelors": 2, "associate": 1, "": 0}
     req_edu = job_requirements.get("education_level", "").lower()
-    resume_edu = resume_data.get("education_level", "").lower()
-    
-    # Normalize req_edu names (common patterns)
-    def normalize_edu(e):
-        e = e.lower()
-        if "phd" in e or "doctor" in e: return "phd"
-        if "master" in e: return "masters"
-        if "bachelor" in e or "degree" in e: return "bachelors"
-        return ""
+    resume_edu = (resume_data.get("education_level") or "").lower()
 
     n_req = normalize_edu(req_edu)
     n_res = normalize_edu(resume_edu)
-    
+
     if n_req == "":
         breakdown["education_score"] = 20
     else:
-        if edu_rank.get(n_res, 0) >= edu_rank.get(n_req, 0):
+        if EDU_RANK.get(n_res, 0) >= EDU_RANK.get(n_req, 0):
             breakdown["education_score"] = 20
         else:
             breakdown["education_score"] = 10 # Partial points for having some degree
 
+    # 4. Optional text similarity (informational)
+    if similarity is not None:
+        breakdown["semantic_score"] = semantic_score(similarity)
+
     total_score = breakdown["skills_score"] + breakdown["experience_score"] + breakdown["education_score"]
     return {
         "score": min(total_score, 100),
         "breakdown": breakdown
     }
+
+
+# ====== BATCH SCORING ======
+class ResumeFeatureBlock:
+    """
+    Column-oriented features for a block of parsed resumes.
+
+    Skills are kept as a CSR-style layout (`skill_ids` / `indptr`) over a shared
+    lowercased vocabulary, so a block can be built once and scored against any
+    number of jobs with pure array operations.
+    """
+
+    def __init__(self, resumes: Sequence[Dict[str, Any]]):
+        self.size = len(resumes)
+        self.vocab: Dict[str, int] = {}
+        ids: List[int] = []
+        indptr = [0]
+        experience = np.zeros(self.size, dtype=np.float64)
+        education = np.zeros(self.size, dtype=np.int8)
+
+        for i, resume_data in enumerate(resumes):
+            resume_data = resume_data or {}
+            # Dedupe per resume so counts match the set semantics of the scalar scorer
+            for name in set(resume_skill_names(resume_data)):
+                ids.append(self.vocab.setdefault(name, len(self.vocab)))
+            indptr.append(len(ids))
+            experience[i] = resume_experience_years(resume_data)
+            education[i] = EDU_RANK[normalize_edu(resume_data.get("education_level", "") or "")]
+
+        self.skill_ids = np.asarray(ids, dtype=np.int32)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.row_ids = np.repeat(np.arange(self.size, dtype=np.int32), np.diff(self.indptr))
+        self.experience = experience
+        self.education = education
+
+    def skill_matrix(self, skills: Sequence[str]) -> np.ndarray:
+        """Boolean indicator matrix of shape (resumes, len(skills))."""
+        matrix = np.zeros((self.size, len(skills)), dtype=bool)
+        column = np.full(len(self.vocab) + 1, -1, dtype=np.int32)
+        for j, name in enumerate(skills):
+            idx = self.vocab.get(name)
+            if idx is not None:
+                column[idx] = j
+        if self.skill_ids.size:
+            cols = column[self.skill_ids]
+            hit = cols >= 0
+            matrix[self.row_ids[hit], cols[hit]] = True
+        return matrix
+
+
+def score_feature_block(block: ResumeFeatureBlock, job_requirements: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score every resume in `block` against one job.
+
+    Returns the score components as arrays plus the skill indicator matrix
+    (`required_skills` gives its column order), mirroring `calculate_match_score`.
+    """
+    req_skills = list(dict.fromkeys(s.lower() for s in job_requirements.get("required_skills", [])))
+    skill_matrix = block.skill_matrix(req_skills)
+
+    # 1. Skills Match (50%)
+    if req_skills:
+        matched_count = skill_matrix.sum(axis=1)
+        skills_score = np.round(matched_count / len(req_skills) * 50).astype(np.int64)
+    else:
+        skills_score = np.full(block.size, 50, dtype=np.int64)
+
+    # 2. Experience Match (30%)
+    req_exp = job_requirements.get("experience_years", 0)
+    if req_exp > 0:
+        partial = np.round(block.experience / req_exp * 30)
+        experience_score = np.where(block.experience >= req_exp, 30, partial).astype(np.int64)
+    else:
+        experience_score = np.full(block.size, 30, dtype=np.int64)
+
+    # 3. Education Match (20%)
+    req_rank = EDU_RANK[normalize_edu(job_requirements.get("education_level", "").lower())]
+    if req_rank == 0:
+        education_score = np.full(block.size, 20, dtype=np.int64)
+    else:
+        education_score = np.where(block.education >= req_rank, 20, 10).astype(np.int64)
+
+    total = np.minimum(skills_score + experience_score + education_score, 100)
+    return {
+        "score": total,
+        "skills_score": skills_score,
+        "experience_score": experience_score,
+        "education_score": education_score,
+        "skill_matrix": skill_matrix,
+        "required_skills": req_skills,
+    }
+
+
+def build_breakdown(scored: Dict[str, Any], i: int) -> Dict[str, Any]:
+    """Materialize the `calculate_match_score` breakdown for row `i` of a scored block."""
+    req_skills = scored["required_skills"]
+    row = scored["skill_matrix"][i]
+    return {
+        "skills_score": int(scored["skills_score"][i]),
+        "experience_score": int(scored["experience_score"][i]),
+        "education_score": int(scored["education_score"][i]),
+        "matched_skills": [s for s, hit in zip(req_skills, row) if hit],
+        "missing_skills": [s for s, hit in zip(req_skills, row) if not hit],
+    }
+
+
+def calculate_match_scores_batch(
+    resumes: Sequence[Dict[str, Any]],
+    job_requirements: Dict[str, Any],
+    block: Optional[ResumeFeatureBlock] = None,
+    similarities: Optional[Sequence[float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Batch version of `calculate_match_score` for one job against many resumes.
+
+    Results are returned in input order with the same shape as the scalar
+    scorer. Pass a prebuilt `block` to reuse resume features across jobs, and
+    `similarities` (one per resume) to add `semantic_score` to the breakdowns.
+    """
+    if block is None:
+        block = ResumeFeatureBlock(resumes)
+    scored = score_feature_block(block, job_requirements)
+    results = [
+        {"score": int(scored["score"][i]), "breakdown": build_breakdown(scored, i)}
+        for i in range(block.size)
+    ]
+    if similarities is not None:
+        for result, similarity in zip(results, similarities):
+            result["breakdown"]["semantic_score"] = semantic_score(similarity)
+    return results
@@ -0,0 +1,140 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import math
+import re
+import zlib
+import numpy as np
+
+# Width of the hashed text vectors. Changing it (or the tokenizer) invalidates
+# every stored Resume.text_vector; they are re-embedded by the backfill.
+SIMILARITY_DIM = 256
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word unigrams and bigrams."""
+    words = _TOKEN_RE.findall((text or "").lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def embed_text(text: str, dim: int = SIMILARITY_DIM) -> np.ndarray:
+    """
+    Signed hashing-vectorizer embedding of `text`: sublinear term frequency,
+    L2-normalized float32. Fully local and stateless, so resumes and jobs can
+    be embedded independently and compared with a dot product.
+    """
+    counts: Dict[str, int] = {}
+    for token in tokenize(text):
+        counts[token] = counts.get(token, 0) + 1
+    vector = np.zeros(dim, dtype=np.float32)
+    for token, count in counts.items():
+        h = zlib.crc32(token.encode())
+        # High bit picks the sign so collisions cancel out on average
+        vector[h % dim] += (1.0 + math.log(count)) * (1.0 if h & 0x80000000 else -1.0)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+def vector_to_bytes(vector: np.ndarray) -> bytes:
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def vector_from_bytes(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype="<f4")
+
+
+def resume_text(resume_data: Dict[str, Any]) -> str:
+    """
+    Text to embed for a parsed resume, for resumes whose extracted PDF text
+    is no longer available.
+    """
+    resume_data = resume_data or {}
+    parts: List[str] = []
+    for s in resume_data.get("skills", []) or []:
+        parts.append(s.get("skill", "") if isinstance(s, dict) else str(s))
+    # Enriched resumes (enrich_resume_data) use "role" and project "title";
+    # "title" and "name" are the older/raw shapes
+    for exp in resume_data.get("experience", []) or []:
+        if isinstance(exp, dict):
+            role = exp.get("role") or exp.get("title") or ""
+            parts += [str(role), str(exp.get("company", "")), str(exp.get("description", ""))]
+            parts += [str(t) for t in exp.get("technologies_used", []) or []]
+    for proj in resume_data.get("projects", []) or []:
+        if isinstance(proj, dict):
+            parts += [str(proj.get("title") or proj.get("name") or ""), str(proj.get("description", ""))]
+            parts += [str(t) for t in proj.get("technologies", []) or []]
+    for edu in resume_data.get("education", []) or []:
+        if isinstance(edu, dict):
+            parts += [str(edu.get("degree", "")), str(edu.get("field_of_study", ""))]
+    return "\n".join(p for p in parts if p)
+
+
+def job_text(title: str, description: str, job_requirements: Optional[Dict[str, Any]] = None) -> str:
+    """Text to embed for a job posting."""
+    job_requirements = job_requirements or {}
+    parts = [title or "", description or ""]
+    parts += [str(s) for s in job_requirements.get("required_skills", []) or []]
+    parts += [str(s) for s in job_requirements.get("preferred_skills", []) or []]
+    return "\n".join(p for p in parts if p)
+
+
+class SimilarityIndex:
+    """
+    In-memory brute-force cosine index over unit vectors.
+
+    Rows live in one contiguous float32 matrix that grows geometrically, so
+    a query is a single matrix-vector product plus a partial sort.
+    """
+
+    def __init__(self, dim: int = SIMILARITY_DIM, capacity: int = 1024):
+        self.dim = dim
+        self.matrix = np.zeros((capacity, dim), dtype=np.float32)
+        self.ids: List[Any] = []
+        self.rows: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def upsert(self, key: Any, vector: np.ndarray) -> None:
+        row = self.rows.get(key)
+        if row is None:
+            row = len(self.ids)
+            if row == self.matrix.shape[0]:
+                grown = np.zeros((row * 2, self.dim), dtype=np.float32)
+                grown[:row] = self.matrix
+                self.matrix = grown
+            self.ids.append(key)
+            self.rows[key] = row
+        self.matrix[row] = vector
+
+    def remove(self, key: Any) -> None:
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        # Move the last row into the hole to keep the matrix dense
+        last = len(self.ids) - 1
+        if row != last:
+            self.matrix[row] = self.matrix[last]
+            self.ids[row] = self.ids[last]
+            self.rows[self.ids[row]] = row
+        self.ids.pop()
+
+    def search(self, query: np.ndarray, k: int, exclude: Iterable[Any] = ()) -> List[Tuple[Any, float]]:
+        """Top `k` (key, cosine similarity) pairs, most similar first."""
+        n = len(self.ids)
+        if n == 0 or k <= 0:
+            return []
+        sims = self.matrix[:n] @ np.asarray(query, dtype=np.float32)
+        for key in exclude:
+            row = self.rows.get(key)
+            if row is not None:
+                sims[row] = -np.inf
+        if k < n:
+            top = np.argpartition(-sims, k - 1)[:k]
+        else:
+            top = np.arange(n)
+        top = top[np.argsort(-sims[top], kind="stable")]
+        return [(self.ids[i], float(sims[i])) for i in top if sims[i] != -np.inf]
+
@@ -0,0 +1,59 @@
+from typing import Iterable, List, Optional, Sequence
+import numpy as np
+
+# Bits set in every byte value, for popcount on packed uint8 rows
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def pack_skill_bits(bit_ids: Iterable[int]) -> bytes:
+    """Pack dense skill IDs into a little-endian bitset (ID i -> byte i // 8, bit i % 8)."""
+    bit_ids = list(bit_ids)
+    if not bit_ids:
+        return b""
+    bits = np.zeros(max(bit_ids) // 8 + 1, dtype=np.uint8)
+    for i in bit_ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return bits.tobytes()
+
+
+def unpack_skill_bits(data: Optional[bytes]) -> List[int]:
+    """Skill IDs set in a packed bitset."""
+    if not data:
+        return []
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little")
+    return np.flatnonzero(bits).tolist()
+
+
+class SkillBitMatrix:
+    """
+    Packed skill bitsets of many resumes as one (rows, bytes) uint8 matrix.
+
+    Rows are zero-padded to the widest bitset, so skills registered after a
+    resume was packed simply read as absent.
+    """
+
+    def __init__(self, bitsets: Sequence[Optional[bytes]]):
+        width = max((len(b) for b in bitsets if b), default=0)
+        self.matrix = np.zeros((len(bitsets), width), dtype=np.uint8)
+        for i, data in enumerate(bitsets):
+            if data:
+                self.matrix[i, :len(data)] = np.frombuffer(data, dtype=np.uint8)
+
+    def _mask(self, bit_ids: Iterable[int]) -> np.ndarray:
+        mask = np.zeros(self.matrix.shape[1], dtype=np.uint8)
+        for i in bit_ids:
+            if (i >> 3) < mask.size:
+                mask[i >> 3] |= 1 << (i & 7)
+        return mask
+
+    def overlap_counts(self, bit_ids: Iterable[int]) -> np.ndarray:
+        """Number of the given skills held by each row: popcount(row AND mask)."""
+        return _POPCOUNT[self.matrix & self._mask(bit_ids)].sum(axis=1, dtype=np.int64)
+
+    def indicator(self, bit_ids: Sequence[int]) -> np.ndarray:
+        """Boolean matrix of shape (rows, len(bit_ids)), one column per skill ID."""
+        out = np.zeros((self.matrix.shape[0], len(bit_ids)), dtype=bool)
+        for j, i in enumerate(bit_ids):
+            if (i >> 3) < self.matrix.shape[1]:
+                out[:, j] = (self.matrix[:, i >> 3] >> (i & 7)) & 1
+        return out
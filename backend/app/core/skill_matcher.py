@@ -0,0 +1,94 @@
+"""
+Single-pass dictionary skill extraction.
+
+Skill names and synonyms are compiled into a token-level trie: the text is
+tokenized once and, at each token, the longest known phrase starting there
+is taken (leftmost-longest, non-overlapping). Matching happens on whole
+tokens, so "Java" never matches inside "JavaScript" nor "SQL" inside
+"MySQL", and the cost per resume depends on its length, not on the size
+of the vocabulary.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import re
+
+# Tokens keep the punctuation that is part of skill names: C++, C#, .NET, Node.js
+_TOKEN_RE = re.compile(r"\.?[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+# Used until (and alongside) the Skill taxonomy
+BUILTIN_SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "React", "Node.js",
+    "Flask", "Django", "MySQL", "PostgreSQL", "MongoDB", "AWS",
+    "Machine Learning", "Data Analysis", "Git", "Docker", "Kubernetes",
+    "Spring Boot", "HTML", "CSS", "TailwindCSS", "FastAPI", "SQL"
+]
+BUILTIN_SYNONYMS = {
+    "React": ["react.js", "reactjs"],
+    "Node.js": ["nodejs"],
+    "PostgreSQL": ["postgres"],
+    "MongoDB": ["mongo"],
+    "Machine Learning": ["ml"],
+}
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SkillMatcher:
+    """Compiled phrase trie mapping token sequences to canonical skill names."""
+
+    def __init__(self, entries: Iterable[Tuple[str, Iterable[str]]]):
+        """`entries` are (canonical_name, synonyms) pairs; earlier entries win on conflicts."""
+        self.phrases: Dict[Tuple[str, ...], str] = {}
+        # Longest phrase (in tokens) per first token bounds the lookahead
+        self.max_len: Dict[str, int] = {}
+        for canonical_name, synonyms in entries:
+            for alias in [canonical_name, *(synonyms or [])]:
+                key = tuple(tokenize(alias or ""))
+                # One-letter names ("C", "R") would match every stray initial
+                # or grade; they are still picked up from skills sections
+                if not key or key in self.phrases or (len(key) == 1 and len(key[0]) == 1):
+                    continue
+                self.phrases[key] = canonical_name
+                self.max_len[key[0]] = max(self.max_len.get(key[0], 0), len(key))
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def extract(self, text: str) -> List[str]:
+        """Canonical names of the skills mentioned in `text`, in order of first mention."""
+        tokens = tokenize(text)
+        found: Dict[str, None] = {}
+        i, n = 0, len(tokens)
+        while i < n:
+            longest = self.max_len.get(tokens[i])
+            step = 1
+            if longest:
+                for length in range(min(longest, n - i), 0, -1):
+                    name = self.phrases.get(tuple(tokens[i:i + length]))
+                    if name is not None:
+                        found[name] = None
+                        step = length
+                        break
+            i += step
+        return list(found)
+
+
+def builtin_entries() -> List[Tuple[str, List[str]]]:
+    return [(name, BUILTIN_SYNONYMS.get(name, [])) for name in BUILTIN_SKILLS]
+
+
+_default_matcher: Optional[SkillMatcher] = None
+
+
+def get_default_matcher() -> SkillMatcher:
+    """The most recently built matcher, or one over the built-in skills."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = SkillMatcher(builtin_entries())
+    return _default_matcher
+
+
+def set_default_matcher(matcher: SkillMatcher) -> None:
+    global _default_matcher
+    _default_matcher = matcher
@@ -0,0 +1,16 @@
+"""
+Compact storage of extracted resume text.
+
+Text is kept zlib-compressed (typically 3-4x smaller) so re-enrichment can
+rerun without touching the PDFs.
+"""
+import zlib
+from typing import Optional
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def decompress_text(data: Optional[bytes]) -> str:
+    return zlib.decompress(data).decode("utf-8") if data else ""
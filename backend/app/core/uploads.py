@@ -0,0 +1,120 @@
+"""
+Streaming upload storage.
+
+Uploads are copied to disk in fixed-size chunks with async file I/O, hashing
+and counting bytes on the way, so neither a large file nor many concurrent
+uploads hold whole documents in API memory or block the event loop. Files are
+stored under their SHA-256, so identical uploads are kept once.
+
+Bulk ingestion reads PDFs from a directory tree or zip archive with the same
+chunked copy (synchronous, for worker threads and the CLI).
+"""
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator, Tuple
+import hashlib
+import os
+import uuid
+import zipfile
+import aiofiles
+import aiofiles.os
+from fastapi import UploadFile
+from app.core.config import settings
+
+UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
+
+
+class UploadTooLarge(Exception):
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File exceeds the {max_bytes / (1024 * 1024):g} MB upload limit")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class StoredUpload:
+    path: str
+    size_bytes: int
+    sha256: str
+
+
+async def save_upload(file: UploadFile, path: str, max_bytes: int = None) -> StoredUpload:
+    """
+    Stream `file` to `path`, returning its size and SHA-256.
+
+    Raises UploadTooLarge, and removes the partial file, as soon as more than
+    `max_bytes` (default MAX_UPLOAD_BYTES) have been read.
+    """
+    max_bytes = max_bytes or settings.MAX_UPLOAD_BYTES
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(path, "wb") as out:
+            while chunk := await file.read(settings.UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        if os.path.exists(path):
+            await aiofiles.os.remove(path)
+        raise
+    return StoredUpload(path=path, size_bytes=size, sha256=digest.hexdigest())
+
+
+async def move_to_content_address(stored: StoredUpload, directory: str, extension: str) -> StoredUpload:
+    """
+    Move a saved upload to `<sha256><extension>` in `directory`, so identical
+    files are stored once. A file already at that address is kept and the new
+    copy dropped.
+    """
+    path = os.path.join(directory, f"{stored.sha256}{extension.lower()}")
+    if await aiofiles.os.path.exists(path):
+        await aiofiles.os.remove(stored.path)
+    else:
+        await aiofiles.os.replace(stored.path, path)
+    return StoredUpload(path=path, size_bytes=stored.size_bytes, sha256=stored.sha256)
+
+
+def store_file(source: BinaryIO, directory: str, extension: str, max_bytes: int = None) -> StoredUpload:
+    """Synchronous `save_upload` + `move_to_content_address` for an open binary file."""
+    max_bytes = max_bytes or settings.MAX_UPLOAD_BYTES
+    digest = hashlib.sha256()
+    size = 0
+    tmp = os.path.join(directory, f"{uuid.uuid4()}.part")
+    try:
+        with open(tmp, "wb") as out:
+            while chunk := source.read(settings.UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                digest.update(chunk)
+                out.write(chunk)
+        path = os.path.join(directory, f"{digest.hexdigest()}{extension.lower()}")
+        if os.path.exists(path):
+            os.remove(tmp)
+        else:
+            os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return StoredUpload(path=path, size_bytes=size, sha256=digest.hexdigest())
+
+
+def iter_pdf_sources(path: str) -> Iterator[Tuple[str, Callable[[], BinaryIO]]]:
+    """
+    (filename, opener) for every PDF in a directory tree or zip archive, in a
+    stable order. Files are opened one at a time, so archives of any size
+    stream through.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in sorted(archive.infolist(), key=lambda i: i.filename):
+                if not info.is_dir() and info.filename.lower().endswith(".pdf"):
+                    yield os.path.basename(info.filename), lambda info=info: archive.open(info)
+    else:
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(".pdf"):
+                    yield name, lambda full=os.path.join(root, name): open(full, "rb")
@@ -0,0 +1,318 @@
+import heapq
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import exists, or_, tuple_
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import func
+from app.models.match_score import MatchScore
+from app.models.resume import Resume, ResumeStatus
+from app.models.job import Job, JobStatus
+from app.models.resume_skill import ResumeSkill
+from app.crud import crud_skill, crud_skill_index
+from app.core.scoring import SCORING_VERSION, ResumeFeatureBlock, calculate_match_scores_batch
+
+def _fresh_score(job_id, job_hash, resume_id, resume_hash):
+    """A stored score computed by the current scorer from the current inputs."""
+    return exists().where(
+        MatchScore.job_id == job_id,
+        MatchScore.resume_id == resume_id,
+        MatchScore.scoring_version == SCORING_VERSION,
+        MatchScore.resume_hash.is_not_distinct_from(resume_hash),
+        MatchScore.job_hash.is_not_distinct_from(job_hash),
+    )
+
+def _scorable_job():
+    """Jobs that hold eager match scores: ACTIVE only, not drafts, closed or awaiting analysis."""
+    return Job.status == JobStatus.ACTIVE
+
+def _unscored_resumes(job: Job):
+    return select(Resume.id, Resume.user_id, Resume.parsed_json, Resume.feature_hash).where(
+        Resume.status == ResumeStatus.PARSED,
+        ~_fresh_score(job.id, job.requirements_hash, Resume.id, Resume.feature_hash)
+    )
+
+async def has_unscored_resumes(db: AsyncSession, job: Job) -> bool:
+    result = await db.execute(select(_unscored_resumes(job).exists()))
+    return result.scalar()
+
+async def fill_unscored_resumes(db: AsyncSession, job: Job, chunk_size: int = 1000) -> int:
+    """
+    Score every PARSED resume without a fresh stored score for the job.
+
+    Resumes are read through a server-side cursor and upserted one chunk at a
+    time, so memory stays bounded by `chunk_size`. The caller commits.
+    """
+    count = 0
+    stream = await db.stream(_unscored_resumes(job).execution_options(yield_per=chunk_size))
+    async for partition in stream.partitions():
+        count += await score_resumes_for_job(db, job, partition)
+    return count
+
+async def get_unscored_jobs(db: AsyncSession, resume: Resume) -> List[Job]:
+    """Scorable jobs without a fresh stored score for the resume."""
+    result = await db.execute(
+        select(Job).where(
+            _scorable_job(),
+            ~_fresh_score(Job.id, Job.requirements_hash, resume.id, resume.feature_hash),
+        )
+    )
+    return result.scalars().all()
+
+async def get_stale_pairs(
+    db: AsyncSession, limit: int, after: Optional[Tuple[uuid.UUID, uuid.UUID]] = None
+) -> List[Any]:
+    """
+    (job_id, resume_id) of stored scores whose scoring version or input
+    hashes no longer match, for the background sweep.
+
+    Pages in (job_id, resume_id) order along unique_match_score; pass the
+    last pair of the previous page as `after` so each page resumes the scan
+    instead of restarting it.
+    """
+    query = (
+        select(MatchScore.job_id, MatchScore.resume_id)
+        .join(Resume, Resume.id == MatchScore.resume_id)
+        .join(Job, Job.id == MatchScore.job_id)
+        .where(
+            Resume.status == ResumeStatus.PARSED,
+            or_(
+                MatchScore.scoring_version.is_distinct_from(SCORING_VERSION),
+                MatchScore.resume_hash.is_distinct_from(Resume.feature_hash),
+                MatchScore.job_hash.is_distinct_from(Job.requirements_hash),
+            )
+        )
+    )
+    if after is not None:
+        query = query.where(tuple_(MatchScore.job_id, MatchScore.resume_id) > tuple_(*after))
+    result = await db.execute(query.order_by(MatchScore.job_id, MatchScore.resume_id).limit(limit))
+    return result.all()
+
+def ranked_matches_for_job_stmt(
+    job_id: uuid.UUID,
+    limit: Optional[int] = None,
+    min_score: Optional[int] = None,
+    after: Optional[Tuple[int, uuid.UUID]] = None,
+    include_breakdown: bool = True,
+):
+    """
+    Stored scores for a job in (score DESC, resume_id DESC) order.
+
+    `after` is the (score, resume_id) keyset of the last row of the previous
+    page. Served from ix_matchscores_job_id_score.
+    """
+    columns = [MatchScore.resume_id, MatchScore.candidate_id, MatchScore.score, Resume.original_filename]
+    if include_breakdown:
+        columns.append(MatchScore.breakdown)
+    stmt = (
+        select(*columns)
+        .join(Resume, Resume.id == MatchScore.resume_id)
+        .where(MatchScore.job_id == job_id, Resume.status == ResumeStatus.PARSED)
+    )
+    if min_score is not None:
+        stmt = stmt.where(MatchScore.score >= min_score)
+    if after is not None:
+        stmt = stmt.where(tuple_(MatchScore.score, MatchScore.resume_id) < tuple_(*after))
+    stmt = stmt.order_by(MatchScore.score.desc(), MatchScore.resume_id.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+async def get_ranked_matches_for_job(db: AsyncSession, job_id: uuid.UUID, **kwargs: Any) -> List[Any]:
+    """One page of `ranked_matches_for_job_stmt`."""
+    result = await db.execute(ranked_matches_for_job_stmt(job_id, **kwargs))
+    return result.all()
+
+async def get_ranked_matches_for_resume(
+    db: AsyncSession,
+    resume_id: uuid.UUID,
+    limit: Optional[int] = None,
+    min_score: Optional[int] = None,
+    after: Optional[Tuple[int, uuid.UUID]] = None,
+    include_breakdown: bool = True,
+) -> List[Any]:
+    """
+    Stored scores for a resume in (score DESC, job_id DESC) order.
+    Served from ix_matchscores_resume_id_score.
+    """
+    columns = [MatchScore.job_id, MatchScore.score, Job]
+    if include_breakdown:
+        columns.append(MatchScore.breakdown)
+    stmt = (
+        select(*columns)
+        .join(Job, Job.id == MatchScore.job_id)
+        .where(MatchScore.resume_id == resume_id)
+    )
+    if min_score is not None:
+        stmt = stmt.where(MatchScore.score >= min_score)
+    if after is not None:
+        stmt = stmt.where(tuple_(MatchScore.score, MatchScore.job_id) < tuple_(*after))
+    stmt = stmt.order_by(MatchScore.score.desc(), MatchScore.job_id.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    result = await db.execute(stmt)
+    return result.all()
+
+async def upsert_match_scores(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """
+    Write many match scores with one bulk INSERT ... ON CONFLICT statement.
+
+    Each row needs job_id, candidate_id, resume_id, score, breakdown and the
+    resume_hash / job_hash stamps of the inputs it was computed from.
+    The caller owns the transaction and commits.
+    """
+    if not rows:
+        return
+    stmt = insert(MatchScore)
+    stmt = stmt.on_conflict_do_update(
+        constraint="unique_match_score",
+        set_={
+            "candidate_id": stmt.excluded.candidate_id,
+            "score": stmt.excluded.score,
+            "breakdown": stmt.excluded.breakdown,
+            "scoring_version": stmt.excluded.scoring_version,
+            "resume_hash": stmt.excluded.resume_hash,
+            "job_hash": stmt.excluded.job_hash,
+            "computed_at": func.now(),
+        },
+    )
+    await db.execute(stmt, [{"id": uuid.uuid4(), "scoring_version": SCORING_VERSION, **row} for row in rows])
+
+async def score_resumes_for_job(db: AsyncSession, job: Job, resumes: List[Any]) -> int:
+    """
+    Batch-score resumes (rows with id, user_id, parsed_json, feature_hash)
+    against one job and upsert.
+    """
+    results = calculate_match_scores_batch(
+        [resume.parsed_json or {} for resume in resumes], job.parsed_requirements or {}
+    )
+    await upsert_match_scores(db, [
+        {
+            "job_id": job.id,
+            "candidate_id": resume.user_id,
+            "resume_id": resume.id,
+            "score": score_data["score"],
+            "breakdown": score_data["breakdown"],
+            "resume_hash": resume.feature_hash,
+            "job_hash": job.requirements_hash
+        }
+        for resume, score_data in zip(resumes, results)
+    ])
+    return len(resumes)
+
+async def score_jobs_for_resume(db: AsyncSession, resume: Resume, jobs: List[Job]) -> int:
+    """Score one resume against many jobs and upsert, building its features once."""
+    block = ResumeFeatureBlock([resume.parsed_json or {}])
+    rows = []
+    for job in jobs:
+        score_data = calculate_match_scores_batch([], job.parsed_requirements or {}, block=block)[0]
+        rows.append({
+            "job_id": job.id,
+            "candidate_id": resume.user_id,
+            "resume_id": resume.id,
+            "score": score_data["score"],
+            "breakdown": score_data["breakdown"],
+            "resume_hash": resume.feature_hash,
+            "job_hash": job.requirements_hash
+        })
+    await upsert_match_scores(db, rows)
+    return len(rows)
+
+async def get_scorable_jobs(db: AsyncSession) -> List[Job]:
+    """Jobs that should hold eager match scores."""
+    result = await db.execute(select(Job).where(_scorable_job()))
+    return result.scalars().all()
+
+async def get_top_matches_for_job(
+    db: AsyncSession,
+    job_requirements: Dict[str, Any],
+    k: int,
+    min_score: Optional[int] = None,
+    chunk_size: int = 500,
+    use_bitsets: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Exact top-K PARSED resumes for a job, retrieved through the skill index.
+
+    Candidates sharing a required skill are taken from the postings and scored
+    in descending order of their upper bound (exact skills score plus full
+    experience and education points). Scoring stops as soon as the K-th best
+    exact score beats the next bound, or the bound drops below `min_score`,
+    so resumes sharing no skill are only scanned when the candidates cannot
+    fill the top K on their own. Ties are ranked by resume_id DESC, the same
+    order as the stored keyset listing.
+
+    With `use_bitsets`, overlap counts come from AND + popcount over the
+    packed Resume.skill_bits instead of the postings table.
+    """
+    if k <= 0:
+        return []
+    req_skills = list(dict.fromkeys(s.lower() for s in job_requirements.get("required_skills", [])))
+    columns = (Resume.id, Resume.user_id, Resume.original_filename, Resume.parsed_json)
+
+    def upper_bound(matched: int) -> int:
+        if not req_skills:
+            return 100
+        return min(round(matched / len(req_skills) * 50) + 30 + 20, 100)
+
+    top: List[Any] = []  # min-heap of ((score, resume_id), match)
+    seen = set()
+
+    def consume(rows: List[Any]) -> None:
+        # Bitset overlaps can also come from synonyms, which the fallback scan
+        # below does not exclude; never rank a resume twice
+        rows = [row for row in rows if row.id not in seen]
+        seen.update(row.id for row in rows)
+        results = calculate_match_scores_batch([row.parsed_json or {} for row in rows], job_requirements)
+        for row, score_data in zip(rows, results):
+            if min_score is not None and score_data["score"] < min_score:
+                continue
+            key = (score_data["score"], row.id)
+            if len(top) >= k and key <= top[0][0]:
+                continue
+            item = (key, {
+                "resume_id": row.id,
+                "candidate_id": row.user_id,
+                "original_filename": row.original_filename,
+                "score": score_data["score"],
+                "breakdown": score_data["breakdown"],
+            })
+            if len(top) < k:
+                heapq.heappush(top, item)
+            else:
+                heapq.heapreplace(top, item)
+
+    def settled(next_bound: int) -> bool:
+        if min_score is not None and next_bound < min_score:
+            return True
+        return len(top) >= k and top[0][0][0] > next_bound
+
+    def ranked() -> List[Dict[str, Any]]:
+        return [match for _, match in sorted(top, key=lambda item: item[0], reverse=True)]
+
+    if use_bitsets:
+        overlap = await crud_skill.get_skill_overlap_bitset(db, req_skills)
+    else:
+        overlap = await crud_skill_index.get_skill_overlap(db, req_skills)
+    ordered = sorted(overlap.items(), key=lambda kv: kv[1], reverse=True)
+    for start in range(0, len(ordered), chunk_size):
+        chunk = ordered[start:start + chunk_size]
+        if settled(upper_bound(chunk[0][1])):
+            return ranked()
+        result = await db.execute(select(*columns).where(Resume.id.in_([resume_id for resume_id, _ in chunk])))
+        consume(result.all())
+
+    if settled(upper_bound(0)):
+        return ranked()
+
+    # Fall back to resumes without any posting for the required skills
+    rest = select(*columns).where(Resume.status == ResumeStatus.PARSED)
+    if req_skills:
+        rest = rest.where(~exists().where(
+            ResumeSkill.resume_id == Resume.id, ResumeSkill.skill.in_(req_skills)
+        ))
+    stream = await db.stream(rest.execution_options(yield_per=chunk_size))
+    async for partition in stream.partitions():
+        consume(partition)
+    return ranked()
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import logging
+import re
+from datetime import timedelta
+from typing import Any, Dict, Optional
+import redis.asyncio as redis
+from sqlalchemy import delete, update
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import func
+from app.models.parse_cache import ParseCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Resume parses and job analyses share the table (and its TTL and size cap)
+# but have their own hit/miss counters
+PARSE_COUNTER = "parse_cache"
+JOB_ANALYSIS_COUNTER = "job_analysis_cache"
+
+# Reposting boilerplate that does not change the requirements: EEO and
+# accommodation statements, calls to apply, links and contact addresses.
+# Statements are only removed when one starts a line or sentence, and only
+# up to the end of that sentence, so requirement text around them (or merely
+# containing "to apply" or "without regard to") is never touched.
+_LINKS = re.compile(r"https?://\S+|www\.\S+|\S+@\S+\.\w+", re.IGNORECASE)
+_BOILERPLATE_OPENERS = "|".join([
+    r"(?:we are|[\w&,'’ -]{1,60}? is)\s+(?:an?\s+|a proud\s+)?"
+    r"(?:equal (?:employment )?opportunity|eeo|affirmative action)\b",
+    r"(?:equal (?:employment )?opportunity|eeo|affirmative action)\b",
+    r"(?:all )?qualified applicants will receive consideration\b",
+    r"(?:if you (?:need|require) )?(?:an? )?reasonable accommodations?\b",
+    r"we (?:will )?(?:provide|offer) reasonable accommodations?\b",
+    r"(?:apply (?:now|today|here)|click (?:on )?apply|how to apply)\b",
+    r"to apply\s*[,:]",
+])
+_JOB_BOILERPLATE = re.compile(
+    rf"(?:^|(?<=[.;!]))[ \t]*(?:[-*•·][ \t]*)?(?:{_BOILERPLATE_OPENERS})[^.;!\n]*[.;!]?",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Keep the punctuation that is part of skill names (C++, C#, .NET, Node.js)
+_JOB_NOISE = re.compile(r"[^\w+#.]+|\.(?!\w)")
+
+def parse_cache_key(text: str, prompt_version: int, model: str) -> str:
+    """Content address of a resume text for a given prompt and model."""
+    normalized = " ".join(text.split())
+    return hashlib.sha256(f"{prompt_version}\x00{model}\x00{normalized}".encode()).hexdigest()
+
+def normalize_job_description(description: str) -> str:
+    """Description text with casing, punctuation, whitespace and boilerplate that do not affect analysis removed."""
+    # Links first, so sentence ends are not found inside them
+    text = _LINKS.sub(" ", description or "")
+    # Repeat for statements that follow one another ("... employer. Apply now!")
+    while True:
+        stripped = _JOB_BOILERPLATE.sub("", text)
+        if stripped == text:
+            break
+        text = stripped
+    return " ".join(_JOB_NOISE.sub(" ", text.lower()).split())
+
+def job_analysis_cache_key(description: str, prompt_version: int, model: str) -> str:
+    """Content address of a job description's requirement analysis."""
+    return parse_cache_key(normalize_job_description(description), prompt_version, f"job-analysis:{model}")
+
+async def _count(name: str) -> None:
+    # Metrics are best effort and must never fail a parse
+    try:
+        client = redis.from_url(settings.get_redis_url(), socket_connect_timeout=1)
+        try:
+            await client.incr(name)
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.warning(f"Parse cache metrics unavailable: {e}")
+
+async def get_cached_parse(
+    db: AsyncSession, key: str, counter: Optional[str] = PARSE_COUNTER
+) -> Optional[Dict[str, Any]]:
+    """
+    Cached raw LLM output for `key`, bumping its hit count and recency.
+    Re-checks of a lookup already counted pass `counter=None`.
+    """
+    ttl = timedelta(days=settings.PARSE_CACHE_TTL_DAYS)
+    result = await db.execute(
+        update(ParseCache)
+        .where(ParseCache.key == key, ParseCache.last_used_at > func.now() - ttl)
+        .values(hits=ParseCache.hits + 1, last_used_at=func.now())
+        .returning(ParseCache.raw_json)
+    )
+    raw_json = result.scalar_one_or_none()
+    await db.commit()
+    if counter is not None:
+        await _count(f"{counter}:hits" if raw_json is not None else f"{counter}:misses")
+    return raw_json
+
+async def store_parse(db: AsyncSession, key: str, raw_json: Dict[str, Any]) -> None:
+    stmt = insert(ParseCache).values(
+        key=key, raw_json=raw_json, size_bytes=len(json.dumps(raw_json)), hits=0
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["key"],
+        set_={"raw_json": stmt.excluded.raw_json, "size_bytes": stmt.excluded.size_bytes, "last_used_at": func.now()},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+async def evict_parse_cache(db: AsyncSession) -> int:
+    """Drop entries past the TTL, then least recently used ones beyond the size cap."""
+    ttl = timedelta(days=settings.PARSE_CACHE_TTL_DAYS)
+    expired = await db.execute(delete(ParseCache).where(ParseCache.last_used_at <= func.now() - ttl))
+    running = (
+        select(
+            ParseCache.key,
+            func.sum(ParseCache.size_bytes).over(
+                order_by=(ParseCache.last_used_at.desc(), ParseCache.key)
+            ).label("running_bytes"),
+        )
+        .subquery()
+    )
+    oversize = await db.execute(
+        delete(ParseCache).where(ParseCache.key.in_(
+            select(running.c.key).where(running.c.running_bytes > settings.PARSE_CACHE_MAX_BYTES)
+        ))
+    )
+    await db.commit()
+    return expired.rowcount + oversize.rowcount
+
+async def get_parse_cache_stats(db: AsyncSession) -> Dict[str, Any]:
+    """Hit/miss counters plus current cache size."""
+    result = await db.execute(select(func.count(), func.coalesce(func.sum(ParseCache.size_bytes), 0)))
+    entries, size_bytes = result.one()
+    counts = {PARSE_COUNTER: (None, None), JOB_ANALYSIS_COUNTER: (None, None)}
+    try:
+        client = redis.from_url(settings.get_redis_url(), socket_connect_timeout=1)
+        try:
+            for counter in counts:
+                counts[counter] = [int(v or 0) for v in await client.mget(f"{counter}:hits", f"{counter}:misses")]
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.warning(f"Parse cache metrics unavailable: {e}")
+
+    def rates(hits, misses):
+        lookups = (hits or 0) + (misses or 0)
+        return {"hits": hits, "misses": misses, "hit_rate": round(hits / lookups, 4) if lookups else None}
+
+    return {
+        **rates(*counts[PARSE_COUNTER]),
+        "job_analysis": rates(*counts[JOB_ANALYSIS_COUNTER]),
+        "entries": entries,
+        "size_bytes": int(size_bytes),
+    }
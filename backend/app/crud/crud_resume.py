@@ -0,0 +1,108 @@
+import uuid
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import and_, case, insert, or_, update
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.resume import Resume, ResumeStatus
+from app.crud.crud_skill import pack_resume_skills_batch
+from app.crud.crud_skill_index import index_resume_skills_batch
+from app.core.scoring import resume_features_hash
+
+IN_FLIGHT = (ResumeStatus.PENDING, ResumeStatus.PARSING)
+
+def _reusable_source():
+    return or_(
+        Resume.status == ResumeStatus.PARSED,
+        # Only uploads actually being parsed, so duplicates never chain
+        and_(Resume.status.in_(IN_FLIGHT), Resume.duplicate_of.is_(None)),
+    )
+
+def _source_preference():
+    return (
+        case((Resume.status == ResumeStatus.PARSED, 0), else_=1),
+        Resume.parsed_at.desc().nulls_last(),
+        Resume.created_at,
+    )
+
+async def find_parse_source(db: AsyncSession, content_sha256: str) -> Optional[Resume]:
+    """
+    An earlier upload of the same bytes whose parse result a new upload can
+    reuse: a PARSED one if any, else the upload currently being parsed.
+    FAILED uploads are not reused, so a new upload gets a fresh attempt.
+    """
+    result = await db.execute(
+        select(Resume)
+        .where(Resume.content_sha256 == content_sha256, _reusable_source())
+        .order_by(*_source_preference())
+        .limit(1)
+    )
+    return result.scalars().first()
+
+async def find_parse_sources(db: AsyncSession, hashes: List[str]) -> Dict[str, uuid.UUID]:
+    """`find_parse_source` for many hashes in one query: source id per hash that has one."""
+    if not hashes:
+        return {}
+    result = await db.execute(
+        select(Resume.content_sha256, Resume.id)
+        .where(Resume.content_sha256.in_(hashes), _reusable_source())
+        .order_by(Resume.content_sha256, *_source_preference())
+        .distinct(Resume.content_sha256)
+    )
+    return {sha: resume_id for sha, resume_id in result}
+
+async def create_resumes(db: AsyncSession, rows: List[dict]) -> None:
+    """Insert many Resume rows in multi-row INSERTs. The caller commits."""
+    if rows:
+        await db.execute(insert(Resume), rows)
+
+async def get_waiting_duplicates(db: AsyncSession, source_id: uuid.UUID) -> List[Tuple[uuid.UUID, str]]:
+    """(id, file_path) of the uploads attached to `source_id`'s parse that have no result yet."""
+    result = await db.execute(
+        select(Resume.id, Resume.file_path)
+        .where(Resume.duplicate_of == source_id)
+        .where(Resume.status.in_(IN_FLIGHT))
+    )
+    return [tuple(row) for row in result]
+
+async def get_reenrichment_ids(
+    db: AsyncSession, version: int, after: Optional[uuid.UUID] = None, limit: int = 500, force: bool = False
+) -> List[uuid.UUID]:
+    """
+    Next page (keyset on id) of PARSED resumes whose stored raw extraction
+    can be re-enriched, skipping those already at `version` unless `force`.
+    """
+    query = select(Resume.id).where(Resume.status == ResumeStatus.PARSED, Resume.raw_json.is_not(None))
+    if not force:
+        query = query.where(or_(Resume.enrichment_version.is_(None), Resume.enrichment_version != version))
+    if after is not None:
+        query = query.where(Resume.id > after)
+    result = await db.execute(query.order_by(Resume.id).limit(limit))
+    return list(result.scalars())
+
+async def get_enrichment_inputs(db: AsyncSession, ids: List[uuid.UUID]) -> List[Tuple[uuid.UUID, dict, Optional[bytes], dict]]:
+    """(id, raw_json, compressed extracted text, parsed_json) of the given resumes."""
+    result = await db.execute(
+        select(Resume.id, Resume.raw_json, Resume.extracted_text, Resume.parsed_json).where(Resume.id.in_(ids))
+    )
+    return [tuple(row) for row in result]
+
+async def save_enrichments(db: AsyncSession, parsed_by_id: Dict[uuid.UUID, dict], version: int) -> None:
+    """
+    Write re-enriched parsed_json back for a batch, with the feature hash,
+    skill postings and skill bitsets derived from it, in a few bulk
+    statements. The caller commits.
+    """
+    if not parsed_by_id:
+        return
+    bits = await pack_resume_skills_batch(db, parsed_by_id)
+    await index_resume_skills_batch(db, parsed_by_id)
+    await db.execute(update(Resume), [
+        {
+            "id": resume_id,
+            "parsed_json": parsed,
+            "feature_hash": resume_features_hash(parsed),
+            "skill_bits": bits[resume_id],
+            "enrichment_version": version,
+        }
+        for resume_id, parsed in parsed_by_id.items()
+    ])
@@ -0,0 +1,82 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Tuple
+import numpy as np
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.resume import Resume, ResumeStatus
+from app.core.similarity import SimilarityIndex, vector_from_bytes
+
+# How often the in-process index polls for newly parsed resumes, and how far
+# behind the watermark it re-reads to catch transactions that committed late
+REFRESH_INTERVAL_SECONDS = 5
+REFRESH_OVERLAP = timedelta(minutes=5)
+
+_index = SimilarityIndex()
+_watermark: Optional[datetime] = None
+_refreshed_at = 0.0
+_lock = asyncio.Lock()
+
+async def refresh_resume_index(db: AsyncSession, chunk_size: int = 5000) -> SimilarityIndex:
+    """
+    The process-wide resume similarity index, loaded on first use and then
+    updated incrementally with resumes parsed since the last refresh.
+    """
+    global _watermark, _refreshed_at
+    if time.monotonic() - _refreshed_at < REFRESH_INTERVAL_SECONDS:
+        return _index
+    async with _lock:
+        if time.monotonic() - _refreshed_at < REFRESH_INTERVAL_SECONDS:
+            return _index
+        stmt = select(Resume.id, Resume.text_vector, Resume.parsed_at).where(
+            Resume.status == ResumeStatus.PARSED, Resume.text_vector.is_not(None)
+        )
+        if _watermark is not None:
+            stmt = stmt.where(Resume.parsed_at > _watermark - REFRESH_OVERLAP)
+        watermark = _watermark
+        stream = await db.stream(stmt.execution_options(yield_per=chunk_size))
+        async for partition in stream.partitions():
+            for row in partition:
+                vector = vector_from_bytes(row.text_vector)
+                if vector.shape[0] != _index.dim:
+                    continue  # Embedded with another width; waits for the backfill
+                _index.upsert(row.id, vector)
+                if row.parsed_at is not None and (watermark is None or row.parsed_at > watermark):
+                    watermark = row.parsed_at
+        _watermark = watermark
+        _refreshed_at = time.monotonic()
+    return _index
+
+async def get_similar_resumes(
+    db: AsyncSession,
+    query: np.ndarray,
+    k: int,
+    exclude: Optional[uuid.UUID] = None,
+) -> List[Tuple[Any, float]]:
+    """
+    Top `k` PARSED resumes by cosine similarity to `query`, as (row, similarity)
+    pairs with row = (id, user_id, original_filename, parsed_json).
+
+    Index entries whose resume was deleted or is no longer PARSED are dropped
+    from the index as they are found.
+    """
+    index = await refresh_resume_index(db)
+    excluded = {exclude} if exclude is not None else set()
+    while True:
+        hits = index.search(query, k, exclude=excluded)
+        if not hits:
+            return []
+        result = await db.execute(
+            select(Resume.id, Resume.user_id, Resume.original_filename, Resume.parsed_json).where(
+                Resume.id.in_([resume_id for resume_id, _ in hits]),
+                Resume.status == ResumeStatus.PARSED,
+            )
+        )
+        rows = {row.id: row for row in result}
+        gone = [resume_id for resume_id, _ in hits if resume_id not in rows]
+        if not gone:
+            return [(rows[resume_id], similarity) for resume_id, similarity in hits]
+        for resume_id in gone:
+            index.remove(resume_id)
@@ -0,0 +1,134 @@
+import asyncio
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, or_
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.skill import Skill
+from app.models.resume import Resume, ResumeStatus
+from app.core.skill_bits import SkillBitMatrix, pack_skill_bits
+from app.core.skill_matcher import SkillMatcher, builtin_entries, set_default_matcher
+from app.core.scoring import resume_skill_names
+from app.crud.crud_skill_index import get_skill_overlap
+
+async def get_skill_bit_ids(db: AsyncSession, names: Iterable[str]) -> Dict[str, int]:
+    """
+    Map lowercased skill names to Skill.bit_index via canonical_name or
+    synonyms of curated skills. Names outside the taxonomy get no bit.
+    """
+    names = sorted(set(n.lower() for n in names if n))
+    if not names:
+        return {}
+
+    result = await db.execute(
+        select(Skill.canonical_name, Skill.synonyms, Skill.bit_index).where(
+            Skill.curated.is_(True),
+            or_(func.lower(Skill.canonical_name).in_(names), Skill.synonyms.overlap(names)),
+        )
+    )
+    wanted = set(names)
+    found: Dict[str, int] = {}
+    for canonical_name, synonyms, bit_index in result:
+        for alias in [canonical_name, *(synonyms or [])]:
+            alias = alias.lower()
+            # A canonical name wins over another skill's synonym
+            if alias in wanted and (alias not in found or alias == canonical_name.lower()):
+                found[alias] = bit_index
+    return found
+
+async def pack_resume_skills(db: AsyncSession, parsed_data: Dict) -> bytes:
+    """
+    Packed skill bitset of a parsed resume. Skills outside the taxonomy are
+    left out (free-text LLM skills are never registered as canonical skills);
+    they are still in the resume_skills postings.
+    """
+    bit_ids = await get_skill_bit_ids(db, resume_skill_names(parsed_data or {}))
+    return pack_skill_bits(bit_ids.values())
+
+async def pack_resume_skills_batch(db: AsyncSession, parsed_by_id: Dict[uuid.UUID, Dict]) -> Dict[uuid.UUID, bytes]:
+    """`pack_resume_skills` for many resumes with a single taxonomy lookup."""
+    names = {resume_id: resume_skill_names(parsed or {}) for resume_id, parsed in parsed_by_id.items()}
+    bit_ids = await get_skill_bit_ids(db, (n for ns in names.values() for n in ns))
+    return {
+        resume_id: pack_skill_bits(bit_ids[n] for n in ns if n in bit_ids)
+        for resume_id, ns in names.items()
+    }
+
+async def get_skill_overlap_bitset(
+    db: AsyncSession, skills: List[str], chunk_size: int = 5000
+) -> Dict[uuid.UUID, int]:
+    """
+    Bitset counterpart of `crud_skill_index.get_skill_overlap`: how many of the
+    (lowercased) skills each PARSED resume holds, via AND + popcount over
+    chunks of packed bitsets.
+
+    Counts are an upper bound on exact string matches, as synonyms share a
+    bit. Resumes not yet packed are reported with every skill matching so
+    that callers pruning on these counts stay exact. Skills outside the
+    taxonomy have no bit and are counted from the resume_skills postings.
+    Resumes packed before a skill was curated lack its bit until repacked
+    (reenrich_resumes.py --force).
+
+    The job side is looked up per call rather than stored with the job:
+    requirements_hash does not change when the taxonomy does, so a stored
+    job bitset would miss newly curated skills. The lookup is one indexed
+    query over a few required names, small next to the resume scan.
+    """
+    if not skills:
+        return {}
+    bit_ids = await get_skill_bit_ids(db, skills)
+    required = [bit_ids[s] for s in skills if s in bit_ids]
+    distinct = len(set(required)) == len(required)
+
+    unknown = [s for s in skills if s not in bit_ids]
+    overlap: Dict[uuid.UUID, int] = await get_skill_overlap(db, unknown) if unknown else {}
+    stream = await db.stream(
+        select(Resume.id, Resume.skill_bits)
+        .where(Resume.status == ResumeStatus.PARSED)
+        .execution_options(yield_per=chunk_size)
+    )
+    async for partition in stream.partitions():
+        matrix = SkillBitMatrix([row.skill_bits for row in partition])
+        if distinct:
+            counts = matrix.overlap_counts(required)
+        else:
+            # Several required names share a bit: count each name separately
+            counts = matrix.indicator(required).sum(axis=1)
+        for row, count in zip(partition, counts.tolist()):
+            if row.skill_bits is None:
+                overlap[row.id] = len(skills)
+            elif count:
+                overlap[row.id] = overlap.get(row.id, 0) + count
+    return overlap
+
+# How often a process checks whether the taxonomy changed since its matcher was built
+SKILL_MATCHER_CHECK_SECONDS = 60
+
+_matcher: Optional[SkillMatcher] = None
+_matcher_version: Optional[Tuple] = None
+_matcher_checked_at = 0.0
+_matcher_lock = asyncio.Lock()
+
+async def get_skill_matcher(db: AsyncSession) -> SkillMatcher:
+    """
+    Skill extractor over the curated Skill taxonomy (canonical names and
+    synonyms) plus the built-in skills, rebuilt only when the taxonomy changed.
+    """
+    global _matcher, _matcher_version, _matcher_checked_at
+    if _matcher is not None and time.monotonic() - _matcher_checked_at < SKILL_MATCHER_CHECK_SECONDS:
+        return _matcher
+    async with _matcher_lock:
+        if _matcher is not None and time.monotonic() - _matcher_checked_at < SKILL_MATCHER_CHECK_SECONDS:
+            return _matcher
+        result = await db.execute(select(func.count(), func.max(Skill.updated_at)).where(Skill.curated.is_(True)))
+        version = tuple(result.one())
+        if _matcher is None or version != _matcher_version:
+            result = await db.execute(
+                select(Skill.canonical_name, Skill.synonyms).where(Skill.curated.is_(True)).order_by(Skill.bit_index)
+            )
+            _matcher = SkillMatcher([*result.all(), *builtin_entries()])
+            _matcher_version = version
+            set_default_matcher(_matcher)
+        _matcher_checked_at = time.monotonic()
+    return _matcher
@@ -0,0 +1,50 @@
+import uuid
+from typing import Any, Dict, Sequence
+from sqlalchemy import delete, func
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+from app.models.resume import Resume, ResumeStatus
+from app.models.resume_skill import ResumeSkill
+from app.core.scoring import resume_skill_names
+
+async def index_resume_skills(db: AsyncSession, resume_id: uuid.UUID, parsed_data: Dict[str, Any]) -> None:
+    """
+    Replace the skill postings of a resume. The caller owns the transaction,
+    so postings land atomically with the parsed_json they were built from.
+    """
+    await db.execute(delete(ResumeSkill).where(ResumeSkill.resume_id == resume_id))
+    skills = sorted(set(resume_skill_names(parsed_data or {})))
+    if skills:
+        await db.execute(
+            insert(ResumeSkill).on_conflict_do_nothing(),
+            [{"resume_id": resume_id, "skill": skill} for skill in skills]
+        )
+
+async def index_resume_skills_batch(db: AsyncSession, parsed_by_id: Dict[uuid.UUID, Dict[str, Any]]) -> None:
+    """`index_resume_skills` for many resumes in one delete and one insert."""
+    if not parsed_by_id:
+        return
+    await db.execute(delete(ResumeSkill).where(ResumeSkill.resume_id.in_(list(parsed_by_id))))
+    postings = [
+        {"resume_id": resume_id, "skill": skill}
+        for resume_id, parsed in parsed_by_id.items()
+        for skill in sorted(set(resume_skill_names(parsed or {})))
+    ]
+    if postings:
+        await db.execute(insert(ResumeSkill).on_conflict_do_nothing(), postings)
+
+async def get_skill_overlap(db: AsyncSession, skills: Sequence[str]) -> Dict[uuid.UUID, int]:
+    """
+    Number of the given (lowercased) skills held by each PARSED resume.
+    Resumes sharing no skill with the list are not returned.
+    """
+    if not skills:
+        return {}
+    result = await db.execute(
+        select(ResumeSkill.resume_id, func.count())
+        .join(Resume, Resume.id == ResumeSkill.resume_id)
+        .where(ResumeSkill.skill.in_(list(skills)), Resume.status == ResumeStatus.PARSED)
+        .group_by(ResumeSkill.resume_id)
+    )
+    return {resume_id: count for resume_id, count in result}
@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import Float, Integer, String
+from app.core.scoring import EDU_RANK, normalize_edu
+
+# Postgres port of calculate_match_score, evaluated set-based over
+# resumes.parsed_json. Arithmetic is done in float8 and rounded with
+# round(float8), which rounds half to even like Python's round().
+# Keep in step with app/core/scoring.py and bump SCORING_VERSION together.
+TOP_MATCHES_SQL = text("""
+WITH scored AS (
+    SELECT
+        r.id AS resume_id,
+        r.user_id AS candidate_id,
+        r.original_filename,
+        COALESCE(sk.matched, ARRAY[]::text[]) AS matched_skills,
+        CASE WHEN :req_count > 0
+             THEN round(COALESCE(cardinality(sk.matched), 0)::float8 / :req_count * 50)::int
+             ELSE 50 END AS skills_score,
+        CASE WHEN :req_exp > 0
+             THEN CASE WHEN exp.years >= :req_exp THEN 30
+                       ELSE round(exp.years / :req_exp * 30)::int END
+             ELSE 30 END AS experience_score,
+        CASE WHEN :req_rank = 0 THEN 20
+             WHEN edu.rank >= :req_rank THEN 20
+             ELSE 10 END AS education_score
+    FROM resumes r
+    CROSS JOIN LATERAL (
+        SELECT CASE WHEN jsonb_typeof(r.parsed_json->'total_experience_years') = 'number'
+                    THEN (r.parsed_json->>'total_experience_years')::float8
+                    ELSE 0 END AS years
+    ) exp
+    CROSS JOIN LATERAL (
+        SELECT CASE WHEN lvl LIKE '%phd%' OR lvl LIKE '%doctor%' THEN 4
+                    WHEN lvl LIKE '%master%' THEN 3
+                    WHEN lvl LIKE '%bachelor%' OR lvl LIKE '%degree%' THEN 2
+                    ELSE 0 END AS rank
+        FROM (SELECT lower(COALESCE(r.parsed_json->>'education_level', '')) AS lvl) l
+    ) edu
+    LEFT JOIN LATERAL (
+        SELECT array_agg(DISTINCT name) AS matched
+        FROM (
+            SELECT lower(COALESCE(s->>'skill', s #>> '{}')) AS name
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(r.parsed_json->'skills') = 'array'
+                     THEN r.parsed_json->'skills' ELSE '[]'::jsonb END
+            ) s
+        ) names
+        WHERE name = ANY(:req_skills)
+    ) sk ON true
+    WHERE r.status = 'PARSED'
+)
+SELECT *, LEAST(skills_score + experience_score + education_score, 100) AS score
+FROM scored
+WHERE LEAST(skills_score + experience_score + education_score, 100) >= :min_score
+ORDER BY score DESC, resume_id DESC
+LIMIT :limit
+""").bindparams(
+    bindparam("req_skills", type_=ARRAY(String)),
+    bindparam("req_count", type_=Integer),
+    bindparam("req_exp", type_=Float),
+    bindparam("req_rank", type_=Integer),
+    bindparam("min_score", type_=Integer),
+    bindparam("limit", type_=Integer),
+)
+
+async def get_top_matches_for_job_sql(
+    db: AsyncSession,
+    job_requirements: Dict[str, Any],
+    k: Optional[int],
+    min_score: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Top-K PARSED resumes for a job, scored inside Postgres.
+
+    Same ranking and result shape as `crud_match.get_top_matches_for_job`,
+    but only the returned rows leave the database. `k=None` returns all.
+    """
+    req_skills = list(dict.fromkeys(s.lower() for s in job_requirements.get("required_skills", [])))
+    result = await db.execute(TOP_MATCHES_SQL, {
+        "req_skills": req_skills,
+        "req_count": len(req_skills),
+        "req_exp": float(job_requirements.get("experience_years", 0)),
+        "req_rank": EDU_RANK[normalize_edu(job_requirements.get("education_level", "").lower())],
+        "min_score": min_score or 0,
+        "limit": k,
+    })
+    matches = []
+    for row in result:
+        matched = set(row.matched_skills)
+        matches.append({
+            "resume_id": row.resume_id,
+            "candidate_id": row.candidate_id,
+            "original_filename": row.original_filename,
+            "score": row.score,
+            "breakdown": {
+                "skills_score": row.skills_score,
+                "experience_score": row.experience_score,
+                "education_score": row.education_score,
+                "matched_skills": [s for s in req_skills if s in matched],
+                "missing_skills": [s for s in req_skills if s not in matched],
+            },
+        })
+    return matches
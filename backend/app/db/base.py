@@ -6,3 +6,5 @@ from app.models.application import Application
 from app.models.skill import Skill
 from app.models.match_score import MatchScore
 from app.models.event import Event
+from app.models.resume_skill import ResumeSkill
+from app.models.parse_cache import ParseCache
@@ -1,4 +1,5 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.api_v1.api import api_router
@@ -18,6 +19,21 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
 
+# Multipart framing around the file part of an upload
+UPLOAD_FORM_OVERHEAD_BYTES = 16 * 1024
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """Reject oversized resume uploads from their Content-Length, before the body is read."""
+    if request.method == "POST" and request.url.path == f"{settings.API_V1_STR}/resumes/upload":
+        length = request.headers.get("content-length", "")
+        if length.isdigit() and int(length) > settings.MAX_UPLOAD_BYTES + UPLOAD_FORM_OVERHEAD_BYTES:
+            return JSONResponse(
+                status_code=413,
+                content={"detail": f"File exceeds the {settings.MAX_UPLOAD_BYTES / (1024 * 1024):g} MB upload limit"},
+            )
+    return await call_next(request)
+
 # CORS Configuration
 origins = [
     "http://localhost:3000",  # React Frontend
@@ -18,6 +18,7 @@ class Job(Base):
     title = Column(String, nullable=False)
     raw_description = Column(Text, nullable=False)
     parsed_json = Column(JSONB, nullable=True)
+    requirements_hash = Column(String(64), nullable=True)
     quality_score = Column(Integer, nullable=True)
     status = Column(Enum(JobStatus), default=JobStatus.DRAFT, nullable=False)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Integer, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -13,9 +13,20 @@ class MatchScore(Base):
     score = Column(Integer, nullable=False)
     breakdown = Column(JSONB, nullable=True)
     explanation = Column(Text, nullable=True)
+    # Cache stamps, compared against SCORING_VERSION, Resume.feature_hash and Job.requirements_hash
+    scoring_version = Column(Integer, nullable=True)
+    resume_hash = Column(String(64), nullable=True)
+    job_hash = Column(String(64), nullable=True)
     computed_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     
     # Relationships
     job = relationship("Job")
     candidate = relationship("User", foreign_keys=[candidate_id])
     resume = relationship("Resume")
+    
+    __table_args__ = (
+        UniqueConstraint('job_id', 'resume_id', name='unique_match_score'),
+        # Keyset paging of ranked matches, see crud_match.get_ranked_matches_*
+        Index('ix_matchscores_job_id_score', job_id, score.desc(), resume_id.desc()),
+        Index('ix_matchscores_resume_id_score', resume_id, score.desc(), job_id.desc()),
+    )
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Integer
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class ParseCache(Base):
+    """Raw LLM resume extraction keyed by normalized text + prompt/model version."""
+    key = Column(String(64), primary_key=True)
+    raw_json = Column(JSONB, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    hits = Column(Integer, default=0, nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    last_used_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), index=True)
@@ -1,8 +1,8 @@
 import uuid
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP, JSONB
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 import enum
 from app.db.base_class import Base
 
@@ -18,11 +18,27 @@ class Resume(Base):
     original_filename = Column(String, nullable=False)
     file_path = Column(String, nullable=False)
     file_size_bytes = Column(Integer, nullable=False)
+    # SHA-256 of the uploaded bytes, computed while streaming the upload to disk
+    content_sha256 = Column(String(64), nullable=True, index=True)
+    # Earlier upload of the same bytes this one takes its parse result from
+    duplicate_of = Column(UUID(as_uuid=True), ForeignKey("resumes.id"), nullable=True, index=True)
     parsed_json = Column(JSONB, nullable=True)
+    feature_hash = Column(String(64), nullable=True)
+    # Binary columns are deferred so they stay out of resumes returned as JSON
+    # Packed bitset over Skill.bit_index, see app/core/skill_bits.py
+    skill_bits = deferred(Column(LargeBinary, nullable=True))
+    # float32 hashed text embedding, see app/core/similarity.py
+    text_vector = deferred(Column(LargeBinary, nullable=True))
+    # Inputs of the local enrichment stage, so it can be rerun without the PDF
+    # or the LLM: zlib-compressed extracted text (app/core/text_codec.py) and
+    # the raw extraction (LLM or heuristic) that parsed_json was built from
+    extracted_text = deferred(Column(LargeBinary, nullable=True))
+    raw_json = deferred(Column(JSONB, nullable=True))
+    enrichment_version = Column(Integer, nullable=True)
     status = Column(Enum(ResumeStatus), default=ResumeStatus.PENDING, nullable=False)
     error_message = Column(Text, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
-    parsed_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    parsed_at = Column(TIMESTAMP(timezone=True), nullable=True, index=True)
     
     # Relationships
     user = relationship("User", backref="resumes")
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base_class import Base
+
+class ResumeSkill(Base):
+    """Inverted skill index: one posting per (lowercased skill, PARSED resume)."""
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True)
+    
+    __table_args__ = (
+        Index('ix_resumeskills_skill_resume_id', 'skill', 'resume_id'),
+    )
@@ -1,12 +1,20 @@
 import uuid
-from sqlalchemy import Column, String
+from sqlalchemy import Boolean, Column, String, Integer, Sequence, true
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP, ARRAY
 from sqlalchemy.sql import func
 from app.db.base_class import Base
 
+skill_bit_index_seq = Sequence("skills_bit_index_seq", start=0, minvalue=0)
+
 class Skill(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     canonical_name = Column(String, unique=True, nullable=False)
     synonyms = Column(ARRAY(String), default=[])
     category = Column(String, nullable=True)
+    # Only curated skills get a bit; parsed resume skills are never added here
+    curated = Column(Boolean, nullable=False, default=True, server_default=true())
+    # Dense integer ID: the bit position of this skill in packed skill bitsets
+    bit_index = Column(Integer, skill_bit_index_seq, server_default=skill_bit_index_seq.next_value(), unique=True, nullable=False)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    # With the row count, the taxonomy version the skill matcher is built from
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
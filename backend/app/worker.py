@@ -1,17 +1,48 @@
-import fitz  # PyMuPDF
 import json
 import os
+import time
+import zipfile
+from itertools import islice
 import re
 import logging
 from datetime import datetime
-from sqlalchemy.orm import Session
-from app.core.celery_app import celery_app
+from functools import lru_cache
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.sql import func
+from celery import group
+from app.core.celery_app import celery_app, PRIORITY_BULK
 from app.db.session import AsyncSessionLocal
 from app.models.resume import Resume, ResumeStatus
 from app.models.user import User  # Essential for SQLAlchemy relationship resolution
+from app.models.job import Job, JobStatus
+from app.crud.crud_skill_index import index_resume_skills
+from app.crud import crud_match
+from app.crud.crud_resume import (
+    get_waiting_duplicates, get_reenrichment_ids, get_enrichment_inputs, save_enrichments,
+    find_parse_sources, create_resumes,
+)
+from app.crud.crud_skill import pack_resume_skills, pack_resume_skills_batch, get_skill_matcher
+from app.crud.crud_parse_cache import (
+    parse_cache_key, get_cached_parse, store_parse, evict_parse_cache,
+    job_analysis_cache_key, JOB_ANALYSIS_COUNTER,
+)
+from app.core.scoring import resume_features_hash, job_requirements_hash
+from app.core.similarity import embed_text, resume_text, vector_to_bytes
+from app.core.resume_heuristics import extract_resume_locally, refine_llm_result
+from app.core.pdf_text import PdfExtraction, extract_pdf_text
+from app.core.text_codec import compress_text, decompress_text
+from app.core.uploads import UPLOAD_DIR, UploadTooLarge, iter_pdf_sources, store_file
+from app.core.queue_stats import record_ingest_progress
+from app.core.resume_events import publish_resume_status
+from app.core.skill_matcher import get_default_matcher
+from app.core.llm_rate_limit import (
+    LLMPriority, LLMRateLimited, acquire_llm_capacity, refund_llm_tokens,
+    estimate_tokens, backoff_delay, retry_after_seconds,
+)
 from app.core.config import settings
-from groq import Groq
+from groq import AsyncGroq, RateLimitError
 import asyncio
+import threading
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -21,7 +52,11 @@ logger = logging.getLogger(__name__)
 # However, our DB stack is async.
 # We will run the DB update part in a sync wrapper or using asyncio.run
 
-async def update_resume_status(resume_id: str, status: ResumeStatus, parsed_data: dict = None, error: str = None):
+async def update_resume_status(
+    resume_id: str, status: ResumeStatus, parsed_data: dict = None, error: str = None, text_vector: bytes = None,
+    raw_data: dict = None, extracted_text: bytes = None, enrichment_version: int = None,
+):
+    """`extracted_text` is compressed (app/core/text_codec.py); `raw_data` is the input of enrich_resume_data."""
     async with AsyncSessionLocal() as session:
         import uuid
         resume = await session.get(Resume, uuid.UUID(resume_id))
@@ -29,64 +64,70 @@ async def update_resume_status(resume_id: str, status: ResumeStatus, parsed_data
             resume.status = status
             if parsed_data:
                 resume.parsed_json = parsed_data
+                resume.feature_hash = resume_features_hash(parsed_data)
+            if raw_data is not None:
+                resume.raw_json = raw_data
+            if enrichment_version is not None:
+                resume.enrichment_version = enrichment_version
+            if extracted_text is not None:
+                resume.extracted_text = extracted_text
+            if status == ResumeStatus.PARSED:
+                # Keep the inverted skill index and skill bitset in step with parsed_json
+                await index_resume_skills(session, resume.id, resume.parsed_json)
+                resume.skill_bits = await pack_resume_skills(session, resume.parsed_json)
+                resume.parsed_at = func.now()
+            if text_vector is not None:
+                resume.text_vector = text_vector
             if error:
                 resume.error_message = error
             await session.commit()
         else:
             logger.error(f"Resume not found for resume_id={resume_id}")
             raise ValueError(f"Resume not found for resume_id={resume_id}")
+    # Pushed to the uploader's event stream (GET /resumes/{id}/events)
+    await publish_resume_status(resume_id, status.value, error)
 
-def extract_text_from_pdf(file_path: str) -> str:
-    text = ""
-    with fitz.open(file_path) as doc:
-        for page in doc:
-            text += page.get_text()
-    return text
+def extract_text_from_pdf(file_path: str) -> PdfExtraction:
+    """Budgeted, cached text of an uploaded PDF (see app/core/pdf_text.py)"""
+    return extract_pdf_text(
+        file_path,
+        max_chars=settings.PDF_MAX_CHARS,
+        max_pages=settings.PDF_MAX_PAGES,
+        parallel_min_pages=settings.PDF_PARALLEL_MIN_PAGES,
+        workers=settings.PDF_EXTRACT_WORKERS,
+    )
 
 
 # ====== HELPER FUNCTIONS ======
+# Common mappings
+SKILL_MAPPINGS = {
+    "react.js": "React",
+    "reactjs": "React",
+    "js": "JavaScript",
+    "ts": "TypeScript",
+    "py": "Python",
+    "ml": "Machine Learning",
+    "ai": "Artificial Intelligence",
+    "next.js": "Next.js",
+    "node.js": "Node.js",
+    "nodejs": "Node.js",
+    "mysql": "MySQL",
+    "postgresql": "PostgreSQL",
+    "postgres": "PostgreSQL",
+    "mongo": "MongoDB",
+    "mongodb": "MongoDB"
+}
+
+
 def normalize_skill(skill: str) -> str:
     """Normalize skill names"""
     skill = skill.strip()
-    
-    # Common mappings
-    mappings = {
-        "react.js": "React",
-        "reactjs": "React",
-        "js": "JavaScript",
-        "ts": "TypeScript",
-        "py": "Python",
-        "ml": "Machine Learning",
-        "ai": "Artificial Intelligence",
-        "next.js": "Next.js",
-        "node.js": "Node.js",
-        "nodejs": "Node.js",
-        "mysql": "MySQL",
-        "postgresql": "PostgreSQL",
-        "postgres": "PostgreSQL",
-        "mongo": "MongoDB",
-        "mongodb": "MongoDB"
-    }
-    
-    lower_skill = skill.lower()
-    return mappings.get(lower_skill, skill)
+    return SKILL_MAPPINGS.get(skill.lower(), skill)
 
 
 def extract_skills_from_text(text: str) -> list:
-    """Extract skill keywords from text"""
-    common_skills = [
-        "Python", "Java", "JavaScript", "TypeScript", "React", "Node.js",
-        "Flask", "Django", "MySQL", "PostgreSQL", "MongoDB", "AWS", 
-        "Machine Learning", "Data Analysis", "Git", "Docker", "Kubernetes",
-        "Spring Boot", "HTML", "CSS", "TailwindCSS", "FastAPI", "SQL"
-    ]
-    
-    found = []
-    text_lower = text.lower()
-    for skill in common_skills:
-        if skill.lower() in text_lower:
-            found.append(skill)
-    return found
+    """Extract skill keywords from text (single pass, whole tokens only)"""
+    return get_default_matcher().extract(text)
 
 
 def calculate_total_experience(experiences: list) -> int:
@@ -97,57 +138,43 @@ def calculate_total_experience(experiences: list) -> int:
     return total
 
 
+# Format: "MMM YYYY" or "Month YYYY", then just year "2024"
+DATE_PATTERNS = [re.compile(r'(\w+)\s+(\d{4})'), re.compile(r'(\d{4})')]
+
+
+@lru_cache(maxsize=4096)
+def parse_month_year(date_str: str, default_month: int) -> tuple:
+    """
+    (year, month) of a resume date, or (None, None). `default_month` is used
+    for a bare year or an unreadable month name.
+    """
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(date_str)
+        if match:
+            if len(match.groups()) == 2:
+                month_str, year_str = match.groups()
+                # Try to parse month
+                try:
+                    month = datetime.strptime(month_str[:3], "%b").month
+                except ValueError:
+                    month = default_month
+                return int(year_str), month
+            return int(match.group(1)), default_month
+    return None, None
+
+
 def calculate_duration_months(start: str, end: str) -> int:
     """Calculate months between two dates"""
     try:
         if not start:
             return 0
         
-        # Try to parse various date formats
-        # Format: "MMM YYYY" or "Month YYYY"
-        patterns = [
-            r'(\w+)\s+(\d{4})',  # "Jan 2024" or "January 2024"
-            r'(\d{4})',          # Just year "2024"
-        ]
-        
-        start_month = start_year = None
-        end_month = end_year = None
-        
-        # Parse start date
-        for pattern in patterns:
-            match = re.search(pattern, start)
-            if match:
-                if len(match.groups()) == 2:
-                    month_str, year_str = match.groups()
-                    start_year = int(year_str)
-                    # Try to parse month
-                    try:
-                        start_month = datetime.strptime(month_str[:3], "%b").month
-                    except:
-                        start_month = 1  # Default to January
-                else:
-                    start_year = int(match.group(1))
-                    start_month = 1
-                break
+        start_year, start_month = parse_month_year(start, 1)
         
-        # Parse end date
         if end and end.lower() not in ["present", "current", "now"]:
-            for pattern in patterns:
-                match = re.search(pattern, end)
-                if match:
-                    if len(match.groups()) == 2:
-                        month_str, year_str = match.groups()
-                        end_year = int(year_str)
-                        try:
-                            end_month = datetime.strptime(month_str[:3], "%b").month
-                        except:
-                            end_month = 12
-                    else:
-                        end_year = int(match.group(1))
-                        end_month = 12
-                    break
+            end_year, end_month = parse_month_year(end, 12)
         else:
-            # Present - use current date
+            # Present - use current date (never cached)
             now = datetime.now()
             end_year = now.year
             end_month = now.month
@@ -243,7 +270,12 @@ def extract_year(date_str: str) -> int:
 
 # ====== LOCAL ENRICHMENT ======
 def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
-    """Transform simple extraction into detailed structure needed for matching"""
+    """
+    Transform simple extraction into detailed structure needed for matching.
+
+    Every experience is normalized and its duration computed once up front;
+    the per-skill work months then come from a single lookup table.
+    """
     
     contact = raw_data.get("contact", {})
     if not isinstance(contact, dict):
@@ -264,28 +296,36 @@ def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
         "additional_info": {}
     }
     
-    # Build evidence map
-    evidence_map = {}
-    
-    # From projects
+    # Normalize each project and experience once
+    projects = []
     for project in raw_data.get("projects", []):
         if not isinstance(project, dict):
             continue
-        project_name = project.get("title", "Project")
         techs = project.get("technologies", [])
-        if isinstance(techs, list):
-            for tech in techs:
-                if not tech:
-                    continue
-                skill = normalize_skill(str(tech))
-                if skill not in evidence_map:
-                    evidence_map[skill] = []
-                evidence_map[skill].append(f"project:{project_name}")
+        normalized_techs = [normalize_skill(str(t)) for t in techs if t] if isinstance(techs, list) else []
+        projects.append((project, normalized_techs))
     
-    # From experience
+    experiences = []
     for exp in raw_data.get("experience", []):
         if not isinstance(exp, dict):
             continue
+        techs = exp.get("technologies", [])
+        normalized_techs = [normalize_skill(str(t)) for t in techs if t] if isinstance(techs, list) else []
+        duration_months = calculate_duration_months(exp.get("start_date", ""), exp.get("end_date", ""))
+        experiences.append((exp, normalized_techs, duration_months))
+    
+    # Build evidence map, and the longest work duration per skill
+    evidence_map = {}
+    work_months = {}
+    
+    # From projects
+    for project, normalized_techs in projects:
+        project_name = project.get("title", "Project")
+        for skill in normalized_techs:
+            evidence_map.setdefault(skill, []).append(f"project:{project_name}")
+    
+    # From experience
+    for exp, normalized_techs, duration_months in experiences:
         company = exp.get("company", "Company")
         role = exp.get("role", "")
         
@@ -293,15 +333,9 @@ def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
         is_internship = "intern" in role.lower() or "virtual" in company.lower()
         exp_type = "internship" if is_internship else "work"
         
-        techs = exp.get("technologies", [])
-        if isinstance(techs, list):
-            for tech in techs:
-                if not tech:
-                    continue
-                skill = normalize_skill(str(tech))
-                if skill not in evidence_map:
-                    evidence_map[skill] = []
-                evidence_map[skill].append(f"{exp_type}:{company}")
+        for skill in normalized_techs:
+            evidence_map.setdefault(skill, []).append(f"{exp_type}:{company}")
+            work_months[skill] = max(work_months.get(skill, 0), duration_months)
     
     # From certifications
     for cert in raw_data.get("certifications", []):
@@ -313,9 +347,7 @@ def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
         for skill in raw_data.get("skills", []):
             if skill and skill.lower() in cert_name.lower():
                 norm_skill = normalize_skill(str(skill))
-                if norm_skill not in evidence_map:
-                    evidence_map[norm_skill] = []
-                evidence_map[norm_skill].append(f"certification:{cert_name[:40]}")
+                evidence_map.setdefault(norm_skill, []).append(f"certification:{cert_name[:40]}")
     
     # Collect all unique skills
     all_skills = set()
@@ -329,22 +361,14 @@ def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
     all_skills.update(evidence_map.keys())
     
     # Calculate total experience
-    total_exp_months = calculate_total_experience(raw_data.get("experience", []))
+    total_exp_months = sum(duration_months for _, _, duration_months in experiences)
     
     # Build enriched skills with evidence
     for skill in all_skills:
         evidence = evidence_map.get(skill, ["resume:mentioned"])
         
-        # Estimate months based on usage
-        months = 0
-        
         # If used in work experience, use that duration
-        for exp in raw_data.get("experience", []):
-            if isinstance(exp, dict):
-                exp_techs = exp.get("technologies", [])
-                if isinstance(exp_techs, list) and skill in [normalize_skill(str(t)) for t in exp_techs if t]:
-                    exp_months = calculate_duration_months(exp.get("start_date", ""), exp.get("end_date", ""))
-                    months = max(months, exp_months)
+        months = work_months.get(skill, 0)
         
         # If used in projects but not work, estimate 3 months
         if months == 0 and any("project:" in str(e) for e in evidence):
@@ -373,15 +397,7 @@ def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
     )
     
     # Transform projects
-    for project in raw_data.get("projects", []):
-        if not isinstance(project, dict):
-            continue
-        
-        techs = project.get("technologies", [])
-        normalized_techs = []
-        if isinstance(techs, list):
-            normalized_techs = [normalize_skill(str(t)) for t in techs if t]
-        
+    for project, normalized_techs in projects:
         enriched["projects"].append({
             "title": project.get("title", ""),
             "description": project.get("description", ""),
@@ -393,10 +409,7 @@ def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
     
     # Transform experience
     enriched_experience = []
-    for exp in raw_data.get("experience", []):
-        if not isinstance(exp, dict):
-            continue
-        
+    for exp, normalized_techs, duration_months in experiences:
         company = exp.get("company", "")
         role = exp.get("role", "")
         
@@ -407,13 +420,6 @@ def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
         if "virtual" in company.lower() or "virtual" in role.lower():
             exp_type = "virtual"
         
-        techs = exp.get("technologies", [])
-        normalized_techs = []
-        if isinstance(techs, list):
-            normalized_techs = [normalize_skill(str(t)) for t in techs if t]
-        
-        duration_months = calculate_duration_months(exp.get("start_date", ""), exp.get("end_date", ""))
-        
         enriched_experience.append({
             "company": company,
             "role": role,
@@ -488,9 +494,19 @@ def enrich_resume_data(raw_data: dict, original_text: str) -> dict:
 
 
 # ====== TWO-STAGE PARSING: Simple LLM + Local Enrichment ======
-def parse_with_llm(text: str) -> dict:
-    """Use LLM to extract basic structured data, then enrich locally"""
-    client = Groq(api_key=settings.GROQ_API_KEY)
+# Stored with each result: bump when enrich_resume_data or normalize_skill
+# change, then run reenrich_resumes_task to rebuild parsed_json without the LLM
+ENRICHMENT_VERSION = 1
+# Keys the parse pipeline adds next to the enrichment output
+PARSE_METADATA_KEYS = ("parser", "extraction")
+
+# Part of the parse cache key: bump when the prompt below changes
+LLM_PARSE_MODEL = "llama-3.3-70b-versatile"
+LLM_PARSE_PROMPT_VERSION = 1
+
+async def extract_with_llm(text: str) -> dict:
+    """Use LLM to extract basic structured data (the raw, un-enriched JSON)"""
+    client = get_llm_client()
     
     # SIMPLE extraction prompt - just get the raw data
     prompt = f"""Extract information from this resume as JSON.
@@ -552,33 +568,57 @@ Resume:
 
 Return only JSON, no explanation."""
     
+    # Global Groq quota first (raises LLMRateLimited to requeue the task),
+    # then this process's concurrency cap
+    charged = await acquire_llm_capacity(
+        LLMPriority.BULK, estimate_tokens(prompt, 4000), settings.LLM_BULK_MAX_WAIT_SECONDS
+    )
     try:
-        completion = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[
-                {"role": "system", "content": "You are a resume parser. Extract information and return valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=4000,
-            response_format={"type": "json_object"},
-            timeout=60.0
-        )
+        async with get_llm_slots():
+            try:
+                completion = await client.chat.completions.create(
+                    model=LLM_PARSE_MODEL,
+                    messages=[
+                        {"role": "system", "content": "You are a resume parser. Extract information and return valid JSON only."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.1,
+                    max_tokens=4000,
+                    response_format={"type": "json_object"},
+                    timeout=60.0
+                )
+            except RateLimitError as e:
+                # Quota used outside this deployment, or configured too high
+                raise LLMRateLimited(retry_after=retry_after_seconds(e, default=10.0)) from e
+        await refund_llm_tokens(charged, getattr(completion.usage, "total_tokens", None))
         
         raw_data = json.loads(completion.choices[0].message.content)
         logger.info(f"LLM extracted skills: {len(raw_data.get('skills', []))}, projects: {len(raw_data.get('projects', []))}")
-        
-        # NOW enrich it locally with all the evidence/proficiency logic
-        enriched = enrich_resume_data(raw_data, text)
-        logger.info(f"After enrichment: {len(enriched.get('skills', []))} skills with evidence")
-        
-        return enriched
+        return raw_data
         
     except Exception as e:
         logger.error(f"LLM parsing failed: {e}")
         raise
 
 
+async def extract_raw_with_llm(text: str, local_raw: dict = None) -> dict:
+    """
+    Raw extraction from the LLM, or the cached extraction of identical text.
+    `local_raw` (the heuristic extraction) fills gaps the LLM left.
+    """
+    key = parse_cache_key(text, LLM_PARSE_PROMPT_VERSION, LLM_PARSE_MODEL)
+    async with AsyncSessionLocal() as session:
+        raw_data = await get_cached_parse(session, key)
+        if raw_data is None:
+            raw_data = await extract_with_llm(text)
+            await store_parse(session, key, raw_data)
+        else:
+            logger.info(f"Parse cache hit for {key[:12]}, skipping LLM")
+    if local_raw:
+        raw_data = refine_llm_result(raw_data, local_raw)
+    return raw_data
+
+
 async def parse_resume_async(resume_id: str, file_path: str):
     print(f"WORKER: Starting task for resume {resume_id}")
     try:
@@ -588,43 +628,624 @@ async def parse_resume_async(resume_id: str, file_path: str):
         
         # 2. Extract Text
         print(f"WORKER: Extracting text from {file_path}...")
-        text = extract_text_from_pdf(file_path)
-        print(f"WORKER: Extracted {len(text)} chars.")
+        extraction = await asyncio.to_thread(extract_text_from_pdf, file_path)
+        text = extraction.text
+        print(f"WORKER: Extracted {len(text)} chars from {extraction.pages_read}/{extraction.page_count} pages "
+              f"in {extraction.seconds * 1000:.0f} ms{' (cached)' if extraction.cached else ''}.")
         
-        # 3. LLM Extraction (Sync call wrapped to avoid blocking loop too hard, though logic is simple)
-        print(f"WORKER: Calling Groq LLM...")
-        parsed_data = parse_with_llm(text)
-        print(f"WORKER: LLM Success! Keys: {list(parsed_data.keys())}")
+        # 3. Local heuristic extraction; only low-confidence resumes go to the LLM
+        async with AsyncSessionLocal() as session:
+            matcher = await get_skill_matcher(session)
+        local_raw, confidence = extract_resume_locally(text, matcher.extract)
+        print(f"WORKER: Local extraction confidence {confidence:.2f}")
+        if confidence >= settings.HEURISTIC_PARSE_MIN_CONFIDENCE:
+            raw_data = local_raw
+            parsed_data = enrich_resume_data(raw_data, text)
+            parsed_data["parser"] = {"tier": "heuristic", "confidence": confidence}
+        else:
+            # Show the preliminary result while the LLM runs
+            await update_resume_status(
+                resume_id, ResumeStatus.PARSING, parsed_data=enrich_resume_data(local_raw, text)
+            )
+            # LLM Extraction (cached, and awaited so other resumes progress meanwhile)
+            print(f"WORKER: Calling Groq LLM...")
+            raw_data = await extract_raw_with_llm(text, local_raw=local_raw)
+            parsed_data = enrich_resume_data(raw_data, text)
+            logger.info(f"After enrichment: {len(parsed_data.get('skills', []))} skills with evidence")
+            parsed_data["parser"] = {"tier": "llm", "confidence": confidence}
+            print(f"WORKER: LLM Success! Keys: {list(parsed_data.keys())}")
+        parsed_data["extraction"] = extraction.report()
         
-        # 4. Save Success
+        # 4. Save Success, with the enrichment inputs for later re-enrichment
         print(f"WORKER: Saving results...")
-        await update_resume_status(resume_id, ResumeStatus.PARSED, parsed_data=parsed_data)
+        await update_resume_status(
+            resume_id, ResumeStatus.PARSED, parsed_data=parsed_data,
+            text_vector=vector_to_bytes(embed_text(text)),
+            raw_data=raw_data, extracted_text=compress_text(text), enrichment_version=ENRICHMENT_VERSION
+        )
         print(f"WORKER: Task Complete.")
         
+    except LLMRateLimited:
+        # Not a parse failure: the task requeues itself and the resume stays PARSING
+        raise
     except Exception as e:
         print(f"WORKER ERROR: {str(e)}")
         import traceback
         traceback.print_exc()
         try:
-            # 5. Handle Failure
+            # Handle Failure (identical uploads would fail the same way)
             await update_resume_status(resume_id, ResumeStatus.FAILED, error=str(e))
+            await resolve_duplicates(resume_id, error=str(e))
         except Exception as db_err:
              print(f"WORKER CRITICAL: Check failed to update status to FAILED: {db_err}")
+    else:
+        # 5. Fan out match scoring against every open job. The resume is
+        # PARSED either way: a lost dispatch is caught up by
+        # fill_unscored_resumes on the next listing and by the stale sweep
+        try:
+            score_resume_task.delay(resume_id)
+        except Exception as e:
+            logger.error(f"Could not queue scoring for parsed resume {resume_id}: {e}")
+
+        # 6. Identical uploads that attached to this parse take its result;
+        # a failure here is theirs, not the source's
+        try:
+            await resolve_duplicates(resume_id)
+        except Exception as e:
+            logger.error(f"Could not resolve duplicate uploads of resume {resume_id}: {e}")
+
 
+# ====== DUPLICATE UPLOADS ======
+async def link_duplicate_async(resume_id: str) -> str:
+    """
+    Give an upload flagged as a duplicate its source's parse result.
 
-@celery_app.task(ack_late=True)
-def parse_resume_task(resume_id: str, file_path: str):
-    import asyncio
+    Returns "linked", "waiting" when the source is still being parsed (its
+    parse resolves this upload when done), or "orphaned" when the source
+    failed or is gone and the upload needs a parse of its own.
+    """
+    import uuid
+    async with AsyncSessionLocal() as session:
+        resume = await session.get(Resume, uuid.UUID(resume_id))
+        if not resume or resume.status == ResumeStatus.PARSED:
+            return "linked"
+        source = await session.get(
+            Resume, resume.duplicate_of,
+            options=[undefer(Resume.text_vector), undefer(Resume.raw_json), undefer(Resume.extracted_text)]
+        ) if resume.duplicate_of else None
+        if source is None or source.status == ResumeStatus.FAILED:
+            # Parsed on its own from now on, so later uploads can attach to it
+            resume.duplicate_of = None
+            await session.commit()
+            return "orphaned"
+    if source.status != ResumeStatus.PARSED:
+        return "waiting"
+    await update_resume_status(
+        resume_id, ResumeStatus.PARSED, parsed_data=source.parsed_json, text_vector=source.text_vector,
+        raw_data=source.raw_json, extracted_text=source.extracted_text,
+        enrichment_version=source.enrichment_version
+    )
     try:
-        # Create a new event loop for this task to avoid conflicts
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        score_resume_task.delay(resume_id)
+    except Exception as e:
+        # Caught up later, like a lost dispatch after a parse
+        logger.error(f"Could not queue scoring for linked resume {resume_id}: {e}")
+    return "linked"
+
+
+async def resolve_duplicates(resume_id: str, error: str = None) -> None:
+    """Finish the uploads waiting on `resume_id`'s parse, with its result or its error."""
+    import uuid
+    async with AsyncSessionLocal() as session:
+        waiting = await get_waiting_duplicates(session, uuid.UUID(resume_id))
+    for duplicate_id, file_path in waiting:
         try:
-            loop.run_until_complete(parse_resume_async(resume_id, file_path))
-        finally:
-            # Clean up the loop
-            loop.close()
+            if error:
+                await update_resume_status(str(duplicate_id), ResumeStatus.FAILED, error=error)
+            else:
+                await link_duplicate_async(str(duplicate_id))
+        except Exception as e:
+            # Never touches the source: the duplicate gets another go on its own
+            logger.error(f"Could not resolve duplicate upload {duplicate_id} of resume {resume_id}: {e}")
+            try:
+                link_duplicate_resume_task.delay(str(duplicate_id), file_path)
+            except Exception as e:
+                logger.error(f"Could not requeue duplicate upload {duplicate_id}: {e}")
+    if waiting:
+        logger.info(f"Resolved {len(waiting)} duplicate uploads of resume {resume_id}")
+
+
+# ====== ASYNC RUNTIME ======
+# One event loop per worker process, running forever in a background thread.
+# Tasks submit their coroutines to it and wait, so under
+# `--pool=threads --concurrency=N` up to N tasks are in flight at once while
+# sharing a single loop, DB connection pool and LLM client.
+_worker_loop = None
+_worker_loop_pid = None
+_worker_loop_lock = threading.Lock()
+_llm_client = None
+_llm_slots = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    global _worker_loop, _worker_loop_pid, _llm_client, _llm_slots
+    with _worker_loop_lock:
+        # A forked child inherits the loop object but not its thread
+        if _worker_loop is None or _worker_loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="worker-loop", daemon=True).start()
+            _worker_loop, _worker_loop_pid = loop, os.getpid()
+            # Loop-bound resources are recreated on first use in the new loop
+            _llm_client = _llm_slots = None
+        return _worker_loop
+
+
+def get_llm_client() -> AsyncGroq:
+    """Pooled async Groq client of this process (use from the worker loop)."""
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = AsyncGroq(api_key=settings.GROQ_API_KEY)
+    return _llm_client
+
+
+def get_llm_slots() -> asyncio.Semaphore:
+    """Caps in-flight LLM requests of this process at PARSE_CONCURRENCY."""
+    global _llm_slots
+    if _llm_slots is None:
+        _llm_slots = asyncio.Semaphore(settings.PARSE_CONCURRENCY)
+    return _llm_slots
+
+
+def run_in_worker_loop(coro):
+    """Run `coro` on the process-wide worker loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, get_worker_loop()).result()
+
+
+@celery_app.task(bind=True, acks_late=True)
+def parse_resume_task(self, resume_id: str, file_path: str):
+    try:
+        run_in_worker_loop(parse_resume_async(resume_id, file_path))
+    except LLMRateLimited as e:
+        if self.request.retries >= settings.LLM_MAX_REQUEUES:
+            run_in_worker_loop(update_resume_status(resume_id, ResumeStatus.FAILED, error=str(e)))
+            run_in_worker_loop(resolve_duplicates(resume_id, error=str(e)))
+            raise
+        countdown = e.retry_after + backoff_delay(self.request.retries)
+        logger.info(f"LLM quota exhausted, requeueing resume {resume_id} in {countdown:.0f}s")
+        raise self.retry(exc=e, countdown=countdown, max_retries=settings.LLM_MAX_REQUEUES)
     except Exception as e:
         logger.exception(f"WORKER FATAL LOOP ERROR for resume {resume_id}: {e}")
         raise  # Re-raise so Celery can handle retries/monitoring
 
+
+@celery_app.task(bind=True, acks_late=True)
+def link_duplicate_resume_task(self, resume_id: str, file_path: str):
+    outcome = run_in_worker_loop(link_duplicate_async(resume_id))
+    if outcome == "orphaned":
+        parse_resume_task.apply_async((resume_id, file_path), priority=self.request.delivery_info.get("priority"))
+    logger.info(f"Duplicate upload {resume_id}: {outcome}")
+
+
+# ====== JOB ANALYSIS ======
+# Runs on the analysis queue so job creation returns at once; the job stays
+# PENDING_ANALYSIS (and out of matching) until its requirements land, or
+# becomes a DRAFT with the error recorded if the analysis fails
+# Part of the job analysis cache key: bump when the prompt below changes
+JOB_ANALYSIS_MODEL = "llama3-70b-8192"
+JOB_ANALYSIS_PROMPT_VERSION = 1
+
+async def analyze_job_description(description: str) -> dict:
+    """
+    Use LLM to extract structured requirements from a job description.
+    """
+    client = get_llm_client()
+    
+    prompt = f"""
+    You are an expert Job Analyzer. Extract structured requirements from the job description text below and return ONLY valid JSON.
+    Do not add any markdown formatting or explanations.
+    
+    Structure:
+    {{
+        "required_skills": [],
+        "preferred_skills": [],
+        "experience_years": 0,
+        "education_level": "",
+        "key_responsibilities": []
+    }}
+    
+    Job Description:
+    {description[:10000]}
+    """
+    
+    # Interactive class: draws on the full Groq quota, ahead of bulk parsing
+    charged = await acquire_llm_capacity(
+        LLMPriority.INTERACTIVE, estimate_tokens(prompt, 1024), settings.LLM_INTERACTIVE_MAX_WAIT_SECONDS
+    )
+    try:
+        completion = await client.chat.completions.create(
+            model=JOB_ANALYSIS_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0,
+            max_tokens=1024,
+            response_format={"type": "json_object"},
+            timeout=60.0
+        )
+    except RateLimitError as e:
+        raise LLMRateLimited(retry_after=retry_after_seconds(e, default=5.0)) from e
+    await refund_llm_tokens(charged, getattr(completion.usage, "total_tokens", None))
+    
+    return json.loads(completion.choices[0].message.content)
+
+
+def job_analysis_key(description: str) -> str:
+    return job_analysis_cache_key(description, JOB_ANALYSIS_PROMPT_VERSION, JOB_ANALYSIS_MODEL)
+
+
+async def get_cached_job_analysis(description: str, db=None, count: bool = True) -> dict:
+    """
+    Stored requirements of an earlier job whose normalized description is
+    the same (reposts, title or location edits), or None. `count=False`
+    leaves the hit/miss counters alone, for re-checks of a counted lookup.
+    """
+    counter = JOB_ANALYSIS_COUNTER if count else None
+    if db is not None:
+        return await get_cached_parse(db, job_analysis_key(description), counter=counter)
+    async with AsyncSessionLocal() as session:
+        return await get_cached_parse(session, job_analysis_key(description), counter=counter)
+
+
+async def analyze_job_async(job_id: str) -> bool:
+    """
+    Analyze a PENDING_ANALYSIS job and activate it. False if there was
+    nothing to do or the analysis failed (the job is then a DRAFT).
+    """
+    import uuid
+    async with AsyncSessionLocal() as session:
+        job = await session.get(Job, uuid.UUID(job_id))
+        if not job or job.status != JobStatus.PENDING_ANALYSIS:
+            logger.warning(f"Skipping analysis for job_id={job_id}: not pending")
+            return False
+        description = job.description
+    
+    # create_job already counted its lookup; this re-check catches an
+    # identical description analyzed since
+    requirements = await get_cached_job_analysis(description, count=False)
+    if requirements is None:
+        try:
+            requirements = await analyze_job_description(description)
+        except LLMRateLimited:
+            raise
+        except Exception as e:
+            logger.error(f"Job analysis failed for {job_id}: {e}")
+            await store_job_analysis_error(job_id, str(e))
+            return False
+        else:
+            async with AsyncSessionLocal() as session:
+                await store_parse(session, job_analysis_key(description), requirements)
+    
+    return await store_job_requirements(job_id, requirements)
+
+
+async def store_job_requirements(job_id: str, requirements: dict) -> bool:
+    """Save analyzed requirements and activate the job."""
+    import uuid
+    async with AsyncSessionLocal() as session:
+        job = await session.get(Job, uuid.UUID(job_id))
+        if not job:
+            return False
+        job.parsed_requirements = requirements
+        job.requirements_hash = job_requirements_hash(requirements)
+        job.status = JobStatus.ACTIVE
+        job.analyzed_at = func.now()
+        await session.commit()
+    return True
+
+
+async def store_job_analysis_error(job_id: str, error: str) -> None:
+    """
+    Record a failed analysis and move the job back to DRAFT, out of matching:
+    it has no requirements to score against or hash.
+    """
+    import uuid
+    async with AsyncSessionLocal() as session:
+        job = await session.get(Job, uuid.UUID(job_id))
+        if not job:
+            return
+        job.parsed_requirements = {"error": error}
+        job.requirements_hash = None
+        job.status = JobStatus.DRAFT
+        job.analyzed_at = func.now()
+        await session.commit()
+
+
+@celery_app.task(bind=True, acks_late=True)
+def analyze_job_task(self, job_id: str):
+    try:
+        analyzed = run_in_worker_loop(analyze_job_async(job_id))
+    except LLMRateLimited as e:
+        if self.request.retries >= settings.LLM_MAX_REQUEUES:
+            # Same outcome as any other analysis error: a draft, with the error recorded
+            run_in_worker_loop(store_job_analysis_error(job_id, str(e)))
+            raise
+        raise self.retry(exc=e, countdown=e.retry_after + backoff_delay(self.request.retries), max_retries=settings.LLM_MAX_REQUEUES)
+    if analyzed:
+        # Fan out match scoring against every parsed resume
+        score_job_task.delay(job_id)
+
+
+# ====== EAGER MATCH SCORING ======
+SCORING_CHUNK_SIZE = 1000
+
+async def score_resume_async(resume_id: str) -> int:
+    """Score a freshly PARSED resume against every open job in one bulk upsert."""
+    import uuid
+    async with AsyncSessionLocal() as session:
+        resume = await session.get(Resume, uuid.UUID(resume_id))
+        if not resume or resume.status != ResumeStatus.PARSED:
+            logger.warning(f"Skipping scoring for resume_id={resume_id}: not parsed")
+            return 0
+        jobs = await crud_match.get_scorable_jobs(session)
+        count = await crud_match.score_jobs_for_resume(session, resume, jobs)
+        await session.commit()
+        return count
+
+
+async def score_job_async(job_id: str) -> int:
+    """Score every PARSED resume lacking a fresh score for a job, streamed in chunks with one upsert per chunk."""
+    import uuid
+    async with AsyncSessionLocal() as session:
+        job = await session.get(Job, uuid.UUID(job_id))
+        if not job:
+            logger.warning(f"Skipping scoring for job_id={job_id}: not found")
+            return 0
+        count = await crud_match.fill_unscored_resumes(session, job, chunk_size=SCORING_CHUNK_SIZE)
+        await session.commit()
+        return count
+
+
+async def backfill_hashes_async() -> None:
+    """
+    Stamp resumes and jobs scored before feature hashing, skill bitsets and
+    text vectors existed. Resumes are done a chunk at a time (keyset on id),
+    each chunk in its own transaction.
+    """
+    from sqlalchemy import select, or_
+    after = None
+    while True:
+        async with AsyncSessionLocal() as session:
+            query = select(Resume).where(
+                Resume.status == ResumeStatus.PARSED,
+                or_(Resume.feature_hash.is_(None), Resume.skill_bits.is_(None), Resume.text_vector.is_(None))
+            )
+            if after is not None:
+                query = query.where(Resume.id > after)
+            result = await session.execute(query.order_by(Resume.id).limit(SCORING_CHUNK_SIZE))
+            resumes = result.scalars().all()
+            if not resumes:
+                break
+            skill_bits = await pack_resume_skills_batch(session, {r.id: r.parsed_json for r in resumes})
+            for resume in resumes:
+                resume.feature_hash = resume_features_hash(resume.parsed_json or {})
+                resume.skill_bits = skill_bits[resume.id]
+                # The PDF text is gone by now; embed what was parsed out of it
+                resume.text_vector = vector_to_bytes(embed_text(resume_text(resume.parsed_json or {})))
+                resume.parsed_at = resume.parsed_at or func.now()
+            await session.commit()
+            after = resumes[-1].id
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Job).where(Job.requirements_hash.is_(None), Job.status != JobStatus.PENDING_ANALYSIS)
+        )
+        for job in result.scalars():
+            job.requirements_hash = job_requirements_hash(job.parsed_requirements or {})
+        await session.commit()
+
+
+async def refresh_stale_scores_async() -> int:
+    """
+    Recompute only stored scores whose scoring version or input hashes are
+    out of date, a chunk at a time, grouped by job so each job is one batch.
+    """
+    from collections import defaultdict
+    from sqlalchemy import select
+    await backfill_hashes_async()
+    refreshed = 0
+    after = None
+    while True:
+        async with AsyncSessionLocal() as session:
+            pairs = await crud_match.get_stale_pairs(session, limit=SCORING_CHUNK_SIZE, after=after)
+            if not pairs:
+                return refreshed
+            after = tuple(pairs[-1])
+            by_job = defaultdict(list)
+            for job_id, resume_id in pairs:
+                by_job[job_id].append(resume_id)
+            for job_id, resume_ids in by_job.items():
+                job = await session.get(Job, job_id)
+                result = await session.execute(
+                    select(Resume.id, Resume.user_id, Resume.parsed_json, Resume.feature_hash)
+                    .where(Resume.id.in_(resume_ids))
+                )
+                refreshed += await crud_match.score_resumes_for_job(session, job, result.all())
+            await session.commit()
+
+
+@celery_app.task(acks_late=True)
+def score_resume_task(resume_id: str):
+    count = run_in_worker_loop(score_resume_async(resume_id))
+    logger.info(f"Scored resume {resume_id} against {count} jobs")
+
+
+@celery_app.task(acks_late=True)
+def score_job_task(job_id: str):
+    count = run_in_worker_loop(score_job_async(job_id))
+    logger.info(f"Scored job {job_id} against {count} resumes")
+
+
+
+@celery_app.task
+def refresh_stale_scores_task():
+    count = run_in_worker_loop(refresh_stale_scores_async())
+    logger.info(f"Refreshed {count} stale match scores")
+
+
+# ====== PARSE CACHE MAINTENANCE ======
+async def evict_parse_cache_async() -> int:
+    async with AsyncSessionLocal() as session:
+        return await evict_parse_cache(session)
+
+
+@celery_app.task
+def evict_parse_cache_task():
+    count = run_in_worker_loop(evict_parse_cache_async())
+    logger.info(f"Evicted {count} parse cache entries")
+
+
+# ====== BULK RE-ENRICHMENT ======
+# Rebuilds parsed_json from the stored raw extraction and text after an
+# ENRICHMENT_VERSION bump: local CPU work only, no PDF reads and no LLM calls
+REENRICH_BATCH_SIZE = 500
+
+def reenrich_rows(rows) -> dict:
+    """Enriched parsed_json per resume id for (id, raw_json, extracted_text, parsed_json) rows."""
+    results = {}
+    for resume_id, raw_data, extracted_text, previous in rows:
+        parsed_data = enrich_resume_data(raw_data or {}, decompress_text(extracted_text))
+        for key in PARSE_METADATA_KEYS:
+            if previous and key in previous:
+                parsed_data[key] = previous[key]
+        results[resume_id] = parsed_data
+    return results
+
+
+async def reenrich_batch_async(resume_ids: list) -> int:
+    import uuid
+    async with AsyncSessionLocal() as session:
+        rows = await get_enrichment_inputs(session, [uuid.UUID(str(i)) for i in resume_ids])
+    # CPU-bound, so off the shared worker loop
+    results = await asyncio.to_thread(reenrich_rows, rows)
+    async with AsyncSessionLocal() as session:
+        await save_enrichments(session, results, ENRICHMENT_VERSION)
+        await session.commit()
+    return len(results)
+
+
+async def dispatch_reenrichment_async(batch_size: int = REENRICH_BATCH_SIZE, force: bool = False) -> int:
+    """Queue every resume below ENRICHMENT_VERSION (all with `force`) in batches; returns the resume count."""
+    after, total = None, 0
+    async with AsyncSessionLocal() as session:
+        while ids := await get_reenrichment_ids(session, ENRICHMENT_VERSION, after, batch_size, force):
+            reenrich_batch_task.apply_async(([str(i) for i in ids],), priority=PRIORITY_BULK)
+            after, total = ids[-1], total + len(ids)
+    return total
+
+
+@celery_app.task(acks_late=True)
+def reenrich_batch_task(resume_ids: list):
+    count = run_in_worker_loop(reenrich_batch_async(resume_ids))
+    logger.info(f"Re-enriched {count} resumes")
+
+
+@celery_app.task
+def reenrich_resumes_task(batch_size: int = REENRICH_BATCH_SIZE, force: bool = False):
+    # Match scores go stale through the feature hash and are refreshed by refresh_stale_scores_task
+    count = run_in_worker_loop(dispatch_reenrichment_async(batch_size, force))
+    logger.info(f"Queued {count} resumes for re-enrichment")
+
+
+# ====== BULK INGESTION ======
+# A directory or zip of PDFs becomes Resume rows batch by batch: files are
+# stored in one streaming pass, rows go in as multi-row INSERTs and parses
+# are published as one Celery group per batch at bulk priority
+INGEST_BATCH_SIZE = 500
+
+def _store_ingest_batch(sources, size: int, stats: dict) -> list:
+    """Store the next `size` files of `sources`; (filename, StoredUpload) pairs."""
+    stored = []
+    for filename, opener in islice(sources, size):
+        try:
+            with opener() as source:
+                stored.append((filename, store_file(source, UPLOAD_DIR, ".pdf")))
+        except (UploadTooLarge, OSError, zipfile.BadZipFile) as e:
+            stats["rejected"] += 1
+            logger.warning(f"Skipping {filename}: {e}")
+    return stored
+
+
+async def ingest_resumes_async(
+    source_path: str, user_id: str, batch_size: int = INGEST_BATCH_SIZE, ingest_id: str = None, progress=None
+) -> dict:
+    """
+    Ingest every PDF under `source_path` (directory or zip archive) for `user_id`.
+
+    Identical files are stored once and parsed once: a file whose bytes were
+    seen before, in this run or earlier, is linked to that parse instead.
+    After each batch the running totals are passed to `progress` and, with an
+    `ingest_id`, published for GET /resumes/bulk/{ingest_id}.
+    """
+    import uuid
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    stats = {
+        "files": 0, "bytes": 0, "parses": 0, "duplicates": 0, "rejected": 0,
+        "seconds": 0.0, "files_per_second": 0.0, "done": False,
+    }
+    start = time.perf_counter()
+    sources = iter_pdf_sources(source_path)
+    while True:
+        # File I/O and hashing stay off the shared worker loop
+        batch = await asyncio.to_thread(_store_ingest_batch, sources, batch_size, stats)
+        if not batch:
+            break
+        async with AsyncSessionLocal() as session:
+            known = await find_parse_sources(session, list({stored.sha256 for _, stored in batch}))
+            rows, signatures = [], []
+            for filename, stored in batch:
+                resume_id = uuid.uuid4()
+                source_id = known.get(stored.sha256)
+                rows.append({
+                    "id": resume_id,
+                    "user_id": uuid.UUID(str(user_id)),
+                    "original_filename": filename,
+                    "file_path": stored.path,
+                    "file_size_bytes": stored.size_bytes,
+                    "content_sha256": stored.sha256,
+                    "duplicate_of": source_id,
+                    "status": ResumeStatus.PENDING,
+                })
+                task = link_duplicate_resume_task if source_id else parse_resume_task
+                signatures.append(task.si(str(resume_id), stored.path).set(priority=PRIORITY_BULK))
+                if source_id:
+                    stats["duplicates"] += 1
+                else:
+                    # Later copies in this run attach to this parse
+                    known[stored.sha256] = resume_id
+                    stats["parses"] += 1
+                stats["bytes"] += stored.size_bytes
+            await create_resumes(session, rows)
+            await session.commit()
+        group(signatures).apply_async()
+
+        stats["files"] += len(batch)
+        stats["seconds"] = round(time.perf_counter() - start, 2)
+        stats["files_per_second"] = round(stats["files"] / max(stats["seconds"], 1e-9), 1)
+        if progress:
+            progress(stats)
+        if ingest_id:
+            await asyncio.to_thread(record_ingest_progress, ingest_id, stats)
+    stats["done"] = True
+    if ingest_id:
+        await asyncio.to_thread(record_ingest_progress, ingest_id, stats)
+    return stats
+
+
+@celery_app.task(acks_late=True)
+def ingest_resumes_task(source_path: str, user_id: str, ingest_id: str, remove_source: bool = False):
+    try:
+        stats = run_in_worker_loop(ingest_resumes_async(source_path, user_id, ingest_id=ingest_id))
+        logger.info(f"Ingested {stats['files']} resumes from {source_path} in {stats['seconds']}s")
+    except Exception as e:
+        record_ingest_progress(ingest_id, {"done": True, "error": str(e)})
+        raise
+    finally:
+        if remove_source and os.path.isfile(source_path):
+            os.remove(source_path)
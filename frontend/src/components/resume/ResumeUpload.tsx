@@ -39,16 +39,20 @@ const ResumeUpload = () => {
 
     const statusStr = status?.status?.toLowerCase() || '';
 
-    // Polling logic: Only poll if we are in a transitive state (PENDING or PARSING)
+    const resumeId = status?.id;
+    const inFlight = statusStr === 'pending' || statusStr === 'parsing';
+
+    // Status updates: the server pushes each transition (Server-Sent Events) while
+    // the resume is PENDING or PARSING, then closes the stream
     useEffect(() => {
-        if (!statusStr || (statusStr !== 'pending' && statusStr !== 'parsing')) {
+        if (!resumeId || !inFlight) {
             return;
         }
 
-        const fetchLatestResume = async () => {
-            const token = localStorage.getItem('access_token');
-            if (!token) return;
+        const token = localStorage.getItem('access_token');
+        if (!token) return;
 
+        const fetchLatestResume = async () => {
             try {
                 const response = await axios.get('http://localhost:8000/api/v1/resumes/mine/latest', {
                     headers: { Authorization: `Bearer ${token}` }
@@ -57,13 +61,27 @@ const ResumeUpload = () => {
                     setStatus(response.data);
                 }
             } catch (error) {
-                console.error("Polling error", error);
+                console.error("Error fetching parsed resume", error);
             }
         };
 
-        const interval = setInterval(fetchLatestResume, 3000);
-        return () => clearInterval(interval);
-    }, [statusStr]);
+        // EventSource cannot send headers, so the token goes in the query string
+        const events = new EventSource(
+            `http://localhost:8000/api/v1/resumes/${resumeId}/events?access_token=${encodeURIComponent(token)}`
+        );
+        events.addEventListener('status', (e) => {
+            const update = JSON.parse((e as MessageEvent).data);
+            if (update.status === 'parsed') {
+                events.close();
+                fetchLatestResume();
+            } else {
+                if (update.status === 'failed') events.close();
+                setStatus((prev: any) => ({ ...prev, status: update.status, error: update.error }));
+            }
+        });
+        // On errors EventSource reconnects by itself and gets the current status first
+        return () => events.close();
+    }, [resumeId, inFlight]);
 
     const handleFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
         if (e.target.files) {
@@ -0,0 +1,51 @@
+"""
+Bulk-ingest a directory tree or zip archive of PDF resumes.
+
+Stores the files (identical files once), inserts their Resume rows in
+multi-row INSERTs and queues the parses on the Celery parse queue at bulk
+priority, printing progress after every batch. Parse progress then shows in
+GET /system/queues.
+
+    python ingest_resumes.py <directory-or-zip> --owner recruiter@example.com [--batch-size 500]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from app.worker import INGEST_BATCH_SIZE, ingest_resumes_async
+
+
+def print_progress(stats: dict) -> None:
+    print(f"   {stats['files']} files ({stats['bytes'] / 2**20:.0f} MiB) | {stats['parses']} parses, "
+          f"{stats['duplicates']} duplicates, {stats['rejected']} rejected | {stats['files_per_second']:.0f} files/s")
+
+
+async def main(path: str, owner: str, batch_size: int) -> int:
+    from app.db.session import AsyncSessionLocal
+    from app.crud.crud_user import get_user_by_email
+
+    async with AsyncSessionLocal() as session:
+        user = await get_user_by_email(session, owner)
+    if not user:
+        print(f"❌ No user with email {owner}")
+        return 1
+    print(f"Ingesting {path} for {user.email}...")
+    stats = await ingest_resumes_async(path, str(user.id), batch_size=batch_size, progress=print_progress)
+    print(f"✅ {stats['files']} resumes in {stats['seconds']} s: {stats['parses']} parses queued, "
+          f"{stats['duplicates']} linked to existing parses, {stats['rejected']} rejected")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="directory (searched recursively) or .zip archive of PDFs")
+    parser.add_argument("--owner", required=True, help="email of the user the resumes are uploaded as")
+    parser.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE)
+    args = parser.parse_args()
+    if not os.path.exists(args.path):
+        sys.exit(f"❌ {args.path} not found")
+    sys.exit(asyncio.run(main(args.path, args.owner, args.batch_size)))
@@ -0,0 +1,59 @@
+"""
+Rebuild parsed_json of every PARSED resume from its stored raw extraction
+and text, after a change to enrich_resume_data or normalize_skill (bump
+ENRICHMENT_VERSION in app/worker.py first). No PDF reads and no LLM calls.
+
+By default the work is queued as batches on the Celery parse queue, spread
+over all running parse workers. With --local it runs in this process,
+enriching each batch across --workers processes, and reports throughput.
+
+    python reenrich_resumes.py [--batch-size 500] [--force] [--local [--workers 4]]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from app.worker import ENRICHMENT_VERSION, REENRICH_BATCH_SIZE, reenrich_rows, reenrich_resumes_task
+
+
+async def run_local(batch_size: int, force: bool, workers: int) -> None:
+    from app.db.session import AsyncSessionLocal
+    from app.crud.crud_resume import get_reenrichment_ids, get_enrichment_inputs, save_enrichments
+
+    start = time.perf_counter()
+    after, total = None, 0
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        async with AsyncSessionLocal() as session:
+            while ids := await get_reenrichment_ids(session, ENRICHMENT_VERSION, after, batch_size, force):
+                rows = await get_enrichment_inputs(session, ids)
+                step = -(-len(rows) // workers)
+                parts = await asyncio.gather(*[
+                    loop.run_in_executor(pool, reenrich_rows, rows[i:i + step]) for i in range(0, len(rows), step)
+                ])
+                await save_enrichments(session, {k: v for part in parts for k, v in part.items()}, ENRICHMENT_VERSION)
+                await session.commit()
+                after, total = ids[-1], total + len(ids)
+                elapsed = time.perf_counter() - start
+                print(f"   {total} resumes re-enriched, {total / elapsed:.0f}/s")
+    print(f"✅ {total} resumes at enrichment version {ENRICHMENT_VERSION} in {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=REENRICH_BATCH_SIZE)
+    parser.add_argument("--force", action="store_true", help="also redo resumes already at the current version")
+    parser.add_argument("--local", action="store_true", help="run here instead of on the Celery workers")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    if args.local:
+        asyncio.run(run_local(args.batch_size, args.force, args.workers))
+    else:
+        result = reenrich_resumes_task.delay(args.batch_size, args.force)
+        print(f"Queued re-enrichment dispatch as task {result.id}; see GET /system/queues for progress")
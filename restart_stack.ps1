@@ -9,7 +9,9 @@ Start-Sleep -Seconds 2
 Write-Host "Launching services in new windows..."
 
 # Start Celery
-Start-Process -FilePath "powershell.exe" -ArgumentList "-NoExit", "-Command", "& {HOST_NAME; Write-Host 'Starting Celery Worker...'; $env:PYTHONPATH='backend'; .venv\Scripts\celery -A app.worker.celery_app worker --pool=solo --loglevel=info}"
+Start-Process -FilePath "powershell.exe" -ArgumentList "-NoExit", "-Command", "& {HOST_NAME; Write-Host 'Starting Celery Parse Worker...'; $env:PYTHONPATH='backend'; .venv\Scripts\celery -A app.worker.celery_app worker -Q parse -n parse@%h --pool=threads --concurrency=8 --prefetch-multiplier=1 --loglevel=info}"
+Start-Process -FilePath "powershell.exe" -ArgumentList "-NoExit", "-Command", "& {HOST_NAME; Write-Host 'Starting Celery Score Worker...'; $env:PYTHONPATH='backend'; .venv\Scripts\celery -A app.worker.celery_app worker -Q score -n score@%h --pool=threads --concurrency=4 --prefetch-multiplier=4 --loglevel=info}"
+Start-Process -FilePath "powershell.exe" -ArgumentList "-NoExit", "-Command", "& {HOST_NAME; Write-Host 'Starting Celery Analysis Worker...'; $env:PYTHONPATH='backend'; .venv\Scripts\celery -A app.worker.celery_app worker -Q analysis -n analysis@%h --pool=threads --concurrency=4 --prefetch-multiplier=1 --loglevel=info}"
 
 # Start Backend
 Start-Process -FilePath "powershell.exe" -ArgumentList "-NoExit", "-Command", "& {HOST_NAME; Write-Host 'Starting Backend API...'; $env:PYTHONPATH='backend'; .venv\Scripts\python.exe -m uvicorn app.main:app --host 127.0.0.1 --port 8000 --reload}"
@@ -17,7 +17,10 @@ Write-Host "Launching services in new windows..."
 
 # Start Celery
 # Note: Backticks ` before $ escape variable expansion so it happens in the new process
-Start-Process -FilePath "powershell.exe" -WorkingDirectory $ws -ArgumentList "-NoExit", "-Command", "& {`$Host.UI.RawUI.WindowTitle = 'Celery Worker'; Write-Host 'Starting Celery Worker...'; `$env:PYTHONPATH='backend'; .venv\Scripts\celery -A app.worker.celery_app worker --pool=solo --loglevel=info}"
+# One worker per queue; scale each stage by adding workers for its queue
+Start-Process -FilePath "powershell.exe" -WorkingDirectory $ws -ArgumentList "-NoExit", "-Command", "& {`$Host.UI.RawUI.WindowTitle = 'Celery Parse Worker'; Write-Host 'Starting Celery Parse Worker...'; `$env:PYTHONPATH='backend'; .venv\Scripts\celery -A app.worker.celery_app worker -Q parse -n parse@%h --pool=threads --concurrency=8 --prefetch-multiplier=1 --loglevel=info}"
+Start-Process -FilePath "powershell.exe" -WorkingDirectory $ws -ArgumentList "-NoExit", "-Command", "& {`$Host.UI.RawUI.WindowTitle = 'Celery Score Worker'; Write-Host 'Starting Celery Score Worker...'; `$env:PYTHONPATH='backend'; .venv\Scripts\celery -A app.worker.celery_app worker -Q score -n score@%h --pool=threads --concurrency=4 --prefetch-multiplier=4 --loglevel=info}"
+Start-Process -FilePath "powershell.exe" -WorkingDirectory $ws -ArgumentList "-NoExit", "-Command", "& {`$Host.UI.RawUI.WindowTitle = 'Celery Analysis Worker'; Write-Host 'Starting Celery Analysis Worker...'; `$env:PYTHONPATH='backend'; .venv\Scripts\celery -A app.worker.celery_app worker -Q analysis -n analysis@%h --pool=threads --concurrency=4 --prefetch-multiplier=1 --loglevel=info}"
 
 # Start Backend
 Start-Process -FilePath "powershell.exe" -WorkingDirectory $ws -ArgumentList "-NoExit", "-Command", "& {`$Host.UI.RawUI.WindowTitle = 'Backend API'; Write-Host 'Starting Backend API...'; `$env:PYTHONPATH='backend'; .venv\Scripts\python.exe -m uvicorn app.main:app --host 127.0.0.1 --port 8000 --reload}"
@@ -0,0 +1,97 @@
+"""
+Parity check: vectorized batch scorer vs. scalar calculate_match_score.
+
+No database needed. Scores `--size` generated resumes (plain and enriched
+skill entries, duplicate and mixed-case skills, numeric, string and missing
+experience, every education branch) against a set of requirement profiles,
+including empty requirements and the rounding ties, with and without a
+prebuilt feature block and similarities. Exits non-zero on any difference.
+
+    python verify_batch_scoring.py [--size 2000] [--seed 7]
+"""
+import argparse
+import os
+import random
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from app.core.scoring import ResumeFeatureBlock, calculate_match_score, calculate_match_scores_batch
+
+SKILLS = ["Python", "React", "SQL", "Docker", "Java", "JavaScript", "AWS", "Git", "Machine Learning", "C++"]
+EXPERIENCE = [0, 1, 1.25, 2, 2.5, 3.75, 4, 10, "5", "3 years", None, True]
+EDUCATION = ["", "PhD in Physics", "Master of Science", "Bachelor's degree", "B.Tech degree",
+             "High school", "Doctorate", None]
+REQUIREMENTS = [
+    {},
+    {"required_skills": []},
+    {"required_skills": ["Python", "React", "SQL", "Docker"]},
+    {"required_skills": ["python", "PYTHON", "Java"], "experience_years": 2.5},
+    {"required_skills": ["JavaScript"], "experience_years": 4, "education_level": "Bachelor's degree"},
+    {"required_skills": [], "experience_years": 1, "education_level": "Master of Science"},
+    {"required_skills": ["Machine Learning", "AWS", "Rust"], "experience_years": 8, "education_level": "PhD"},
+    {"required_skills": ["Git"], "experience_years": 0, "education_level": "High school"},
+]
+
+
+def make_resume(rng: random.Random) -> dict:
+    resume = {}
+    if rng.random() < 0.9:
+        skills = []
+        for name in rng.sample(SKILLS, rng.randint(0, 6)):
+            name = rng.choice([name, name.lower(), name.upper()])
+            # Enriched entries carry evidence alongside the name
+            skills.append({"skill": name, "evidence": "Projects"} if rng.random() < 0.5 else name)
+        if skills and rng.random() < 0.2:
+            skills.append(skills[0])
+        resume["skills"] = skills
+    if rng.random() < 0.9:
+        resume["total_experience_years"] = rng.choice(EXPERIENCE)
+    if rng.random() < 0.9:
+        resume["education_level"] = rng.choice(EDUCATION)
+    return resume
+
+
+def same(scalar: dict, batch: dict) -> bool:
+    a, b = scalar["breakdown"], batch["breakdown"]
+    return (
+        scalar["score"] == batch["score"]
+        and all(a[k] == b[k] for k in ("skills_score", "experience_score", "education_score"))
+        and a.get("semantic_score") == b.get("semantic_score")
+        and sorted(a["matched_skills"]) == sorted(b["matched_skills"])
+        and sorted(a["missing_skills"]) == sorted(b["missing_skills"])
+    )
+
+
+def main(size: int, seed: int) -> int:
+    rng = random.Random(seed)
+    resumes = [make_resume(rng) for _ in range(size)]
+    similarities = [rng.random() for _ in range(size)]
+    block = ResumeFeatureBlock(resumes)
+    failures = 0
+    for req in REQUIREMENTS:
+        runs = {
+            "batch": calculate_match_scores_batch(resumes, req),
+            "prebuilt block": calculate_match_scores_batch(resumes, req, block=block),
+            "similarities": calculate_match_scores_batch(resumes, req, block=block, similarities=similarities),
+        }
+        for label, results in runs.items():
+            with_similarity = label == "similarities"
+            for i, (resume, result) in enumerate(zip(resumes, results)):
+                expected = calculate_match_score(resume, req, similarities[i] if with_similarity else None)
+                if not same(expected, result):
+                    failures += 1
+                    print(f"   ❌ {req} ({label}): {resume}\n      scalar={expected}\n      batch={result}")
+                    break
+            else:
+                print(f"   ✅ {req} ({label}): {size} resumes identical")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    sys.exit(main(args.size, args.seed))
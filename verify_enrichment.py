@@ -0,0 +1,465 @@
+"""
+Parity check and benchmark for the single-pass enrich_resume_data.
+
+Runs the current enrichment and a frozen copy of the previous nested-loop
+implementation (below) over synthetic raw LLM extractions with hundreds of
+skills and dozens of roles, asserts identical output and prints timings.
+No database or LLM needed.
+
+    python verify_enrichment.py [--resumes 20] [--skills 300] [--roles 40] [--repeat 3]
+"""
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from app.worker import enrich_resume_data, extract_year
+
+logger = logging.getLogger("verify_enrichment")
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+          "January", "Sept", "Summer", "Q3"]
+END_WORDS = ["Present", "present", "Current", "now", ""]
+ALIASES = ["react.js", "ReactJS", "js", "ts", "py", "ml", "ai", "nodejs", "Postgres", "mongo", " MySQL "]
+
+
+def random_date(rng):
+    kind = rng.random()
+    if kind < 0.6:
+        return f"{rng.choice(MONTHS)} {rng.randint(2005, 2025)}"
+    if kind < 0.8:
+        return str(rng.randint(2005, 2025))
+    if kind < 0.9:
+        return f"{rng.randint(1, 12):02d}/{rng.randint(2005, 2025)}"
+    return rng.choice(["", "N/A", "recently"])
+
+
+def synthetic_resume(rng, n_skills, n_roles):
+    vocab = [f"Skill{i}" for i in range(n_skills)] + ALIASES
+    skills = rng.sample(vocab, min(len(vocab), n_skills)) + ["", None]
+    experience = []
+    for i in range(n_roles):
+        techs = rng.sample(vocab, rng.randint(0, 25)) + rng.choice([[], [""], [None]])
+        experience.append({
+            "company": rng.choice(["Acme", "Globex", "Virtual Labs", "Initech"]) + f" {i}",
+            "role": rng.choice(["Engineer", "Software Intern", "Virtual Analyst", "Lead Developer"]),
+            "start_date": random_date(rng),
+            "end_date": rng.choice(END_WORDS) if rng.random() < 0.3 else random_date(rng),
+            "description": "Did things" if rng.random() < 0.7 else "",
+            "technologies": techs if rng.random() < 0.95 else "Python, SQL",
+        })
+    projects = [
+        {"title": f"Project {i}", "description": "Built it", "technologies": rng.sample(vocab, rng.randint(0, 10))}
+        for i in range(n_roles // 2)
+    ] + ["not a dict"]
+    certifications = [{"name": f"Certified {rng.choice(vocab)} Professional"} for _ in range(10)] + [None]
+    return {
+        "contact": {"name": "Synthetic Person", "email": "s@example.com"},
+        "summary": "Synthetic",
+        "skills": [s for s in skills if s is None or isinstance(s, str)],
+        "projects": projects,
+        "experience": experience,
+        "education": [{"institution": "State U", "degree": "BSc", "end_date": "2019"}, "bad"],
+        "certifications": certifications,
+        "volunteering": [],
+    }
+
+
+# ====== REFERENCE: enrich_resume_data before the single-pass rewrite ======
+def reference_normalize_skill(skill: str) -> str:
+    """Normalize skill names"""
+    skill = skill.strip()
+    
+    # Common mappings
+    mappings = {
+        "react.js": "React",
+        "reactjs": "React",
+        "js": "JavaScript",
+        "ts": "TypeScript",
+        "py": "Python",
+        "ml": "Machine Learning",
+        "ai": "Artificial Intelligence",
+        "next.js": "Next.js",
+        "node.js": "Node.js",
+        "nodejs": "Node.js",
+        "mysql": "MySQL",
+        "postgresql": "PostgreSQL",
+        "postgres": "PostgreSQL",
+        "mongo": "MongoDB",
+        "mongodb": "MongoDB"
+    }
+    
+    lower_skill = skill.lower()
+    return mappings.get(lower_skill, skill)
+
+
+def reference_calculate_total_experience(experiences: list) -> int:
+    """Calculate total work experience in months"""
+    total = 0
+    for exp in experiences:
+        total += reference_calculate_duration_months(exp.get("start_date", ""), exp.get("end_date", ""))
+    return total
+
+
+def reference_calculate_duration_months(start: str, end: str) -> int:
+    """Calculate months between two dates"""
+    try:
+        if not start:
+            return 0
+        
+        # Try to parse various date formats
+        # Format: "MMM YYYY" or "Month YYYY"
+        patterns = [
+            r'(\w+)\s+(\d{4})',  # "Jan 2024" or "January 2024"
+            r'(\d{4})',          # Just year "2024"
+        ]
+        
+        start_month = start_year = None
+        end_month = end_year = None
+        
+        # Parse start date
+        for pattern in patterns:
+            match = re.search(pattern, start)
+            if match:
+                if len(match.groups()) == 2:
+                    month_str, year_str = match.groups()
+                    start_year = int(year_str)
+                    # Try to parse month
+                    try:
+                        start_month = datetime.strptime(month_str[:3], "%b").month
+                    except:
+                        start_month = 1  # Default to January
+                else:
+                    start_year = int(match.group(1))
+                    start_month = 1
+                break
+        
+        # Parse end date
+        if end and end.lower() not in ["present", "current", "now"]:
+            for pattern in patterns:
+                match = re.search(pattern, end)
+                if match:
+                    if len(match.groups()) == 2:
+                        month_str, year_str = match.groups()
+                        end_year = int(year_str)
+                        try:
+                            end_month = datetime.strptime(month_str[:3], "%b").month
+                        except:
+                            end_month = 12
+                    else:
+                        end_year = int(match.group(1))
+                        end_month = 12
+                    break
+        else:
+            # Present - use current date
+            now = datetime.now()
+            end_year = now.year
+            end_month = now.month
+        
+        if start_year and end_year:
+            months = (end_year - start_year) * 12 + (end_month or 12) - (start_month or 1)
+            return max(0, months)
+        
+        return 0
+    except Exception as e:
+        print(f"Date parsing error: {e}")
+        return 0
+
+
+def reference_enrich_resume_data(raw_data: dict, original_text: str) -> dict:
+    """Transform simple extraction into detailed structure needed for matching"""
+    
+    contact = raw_data.get("contact", {})
+    if not isinstance(contact, dict):
+        contact = {}
+    
+    enriched = {
+        "name": contact.get("name", ""),
+        "email": contact.get("email", ""),
+        "phone": contact.get("phone", ""),
+        "linkedin": contact.get("linkedin", ""),
+        "location": contact.get("location", ""),
+        "summary": raw_data.get("summary", ""),
+        "skills": [],
+        "projects": [],
+        "experience": [],
+        "education": [],
+        "certifications": [],
+        "additional_info": {}
+    }
+    
+    # Build evidence map
+    evidence_map = {}
+    
+    # From projects
+    for project in raw_data.get("projects", []):
+        if not isinstance(project, dict):
+            continue
+        project_name = project.get("title", "Project")
+        techs = project.get("technologies", [])
+        if isinstance(techs, list):
+            for tech in techs:
+                if not tech:
+                    continue
+                skill = reference_normalize_skill(str(tech))
+                if skill not in evidence_map:
+                    evidence_map[skill] = []
+                evidence_map[skill].append(f"project:{project_name}")
+    
+    # From experience
+    for exp in raw_data.get("experience", []):
+        if not isinstance(exp, dict):
+            continue
+        company = exp.get("company", "Company")
+        role = exp.get("role", "")
+        
+        # Determine if internship/virtual
+        is_internship = "intern" in role.lower() or "virtual" in company.lower()
+        exp_type = "internship" if is_internship else "work"
+        
+        techs = exp.get("technologies", [])
+        if isinstance(techs, list):
+            for tech in techs:
+                if not tech:
+                    continue
+                skill = reference_normalize_skill(str(tech))
+                if skill not in evidence_map:
+                    evidence_map[skill] = []
+                evidence_map[skill].append(f"{exp_type}:{company}")
+    
+    # From certifications
+    for cert in raw_data.get("certifications", []):
+        if not isinstance(cert, dict):
+            continue
+        cert_name = cert.get("name", "Certification")
+        
+        # Check if any skill from main list is in cert name
+        for skill in raw_data.get("skills", []):
+            if skill and skill.lower() in cert_name.lower():
+                norm_skill = reference_normalize_skill(str(skill))
+                if norm_skill not in evidence_map:
+                    evidence_map[norm_skill] = []
+                evidence_map[norm_skill].append(f"certification:{cert_name[:40]}")
+    
+    # Collect all unique skills
+    all_skills = set()
+    
+    # From explicit skills list
+    for skill in raw_data.get("skills", []):
+        if skill:
+            all_skills.add(reference_normalize_skill(str(skill)))
+    
+    # From evidence map
+    all_skills.update(evidence_map.keys())
+    
+    # Calculate total experience
+    total_exp_months = reference_calculate_total_experience(raw_data.get("experience", []))
+    
+    # Build enriched skills with evidence
+    for skill in all_skills:
+        evidence = evidence_map.get(skill, ["resume:mentioned"])
+        
+        # Estimate months based on usage
+        months = 0
+        
+        # If used in work experience, use that duration
+        for exp in raw_data.get("experience", []):
+            if isinstance(exp, dict):
+                exp_techs = exp.get("technologies", [])
+                if isinstance(exp_techs, list) and skill in [reference_normalize_skill(str(t)) for t in exp_techs if t]:
+                    exp_months = reference_calculate_duration_months(exp.get("start_date", ""), exp.get("end_date", ""))
+                    months = max(months, exp_months)
+        
+        # If used in projects but not work, estimate 3 months
+        if months == 0 and any("project:" in str(e) for e in evidence):
+            months = 3
+        
+        # Determine proficiency
+        evidence_count = len(evidence)
+        if months >= 12 and evidence_count >= 3:
+            proficiency = "advanced"
+        elif months >= 6 or evidence_count >= 2:
+            proficiency = "intermediate"
+        else:
+            proficiency = "beginner"
+        
+        enriched["skills"].append({
+            "skill": skill,
+            "evidence": evidence,
+            "months_experience": months,
+            "proficiency": proficiency
+        })
+    
+    # Sort skills by evidence count and experience
+    enriched["skills"].sort(
+        key=lambda s: (len(s.get("evidence", [])), s.get("months_experience", 0)), 
+        reverse=True
+    )
+    
+    # Transform projects
+    for project in raw_data.get("projects", []):
+        if not isinstance(project, dict):
+            continue
+        
+        techs = project.get("technologies", [])
+        normalized_techs = []
+        if isinstance(techs, list):
+            normalized_techs = [reference_normalize_skill(str(t)) for t in techs if t]
+        
+        enriched["projects"].append({
+            "title": project.get("title", ""),
+            "description": project.get("description", ""),
+            "technologies": normalized_techs,
+            "duration": str(project.get("duration", "")),
+            "key_achievements": [project.get("description", "")] if project.get("description") else [],
+            "url": project.get("url", "")
+        })
+    
+    # Transform experience
+    enriched_experience = []
+    for exp in raw_data.get("experience", []):
+        if not isinstance(exp, dict):
+            continue
+        
+        company = exp.get("company", "")
+        role = exp.get("role", "")
+        
+        # Infer type
+        exp_type = "full-time"
+        if "intern" in role.lower():
+            exp_type = "internship"
+        if "virtual" in company.lower() or "virtual" in role.lower():
+            exp_type = "virtual"
+        
+        techs = exp.get("technologies", [])
+        normalized_techs = []
+        if isinstance(techs, list):
+            normalized_techs = [reference_normalize_skill(str(t)) for t in techs if t]
+        
+        duration_months = reference_calculate_duration_months(exp.get("start_date", ""), exp.get("end_date", ""))
+        
+        enriched_experience.append({
+            "company": company,
+            "role": role,
+            "type": exp_type,
+            "start_date": str(exp.get("start_date", "")),
+            "end_date": str(exp.get("end_date", "Present")),
+            "duration_months": duration_months,
+            "description": exp.get("description", ""),
+            "key_responsibilities": [exp.get("description", "")] if exp.get("description") else [],
+            "technologies_used": normalized_techs
+        })
+    
+    enriched["experience"] = enriched_experience
+    
+    # Transform education
+    for edu in raw_data.get("education", []):
+        if not isinstance(edu, dict):
+            continue
+        
+        end_date = edu.get("end_date", "")
+        year = extract_year(end_date) if end_date else 0
+        
+        enriched["education"].append({
+            "institution": edu.get("institution", ""),
+            "degree": edu.get("degree", ""),
+            "field_of_study": edu.get("field", ""),
+            "start_date": str(edu.get("start_date", "")),
+            "end_date": str(end_date),
+            "year": year,
+            "gpa": "",
+            "relevant_coursework": []
+        })
+    
+    # Transform certifications
+    for cert in raw_data.get("certifications", []):
+        if not isinstance(cert, dict):
+            continue
+        
+        enriched["certifications"].append({
+            "name": cert.get("name", ""),
+            "issuer": cert.get("issuer", ""),
+            "date": str(cert.get("date", "")),
+            "technologies": []
+        })
+    
+    # Determine experience level
+    virtual_count = sum(1 for exp in enriched_experience if exp["type"] in ["internship", "virtual"])
+    total_count = len(enriched_experience)
+    mostly_virtual = virtual_count > total_count / 2 if total_count > 0 else True
+    
+    if total_exp_months < 12 or (mostly_virtual and total_exp_months < 24):
+        exp_level = "fresher"
+    elif total_exp_months < 36:
+        exp_level = "junior"
+    elif total_exp_months < 60:
+        exp_level = "mid"
+    else:
+        exp_level = "senior"
+    
+    # Additional info
+    enriched["additional_info"] = {
+        "total_experience_months": total_exp_months,
+        "experience_level": exp_level,
+        "strongest_skills": [s["skill"] for s in enriched["skills"][:5]],
+        "volunteering": raw_data.get("volunteering", []),
+        "languages": []
+    }
+    
+    logger.info(f"Enrichment complete: {len(enriched['skills'])} skills, {len(enriched['projects'])} projects, {len(enriched['experience'])} experiences")
+    
+    return enriched
+
+
+def main(n_resumes, n_skills, n_roles, repeat):
+    rng = random.Random(42)
+    resumes = [synthetic_resume(rng, n_skills, n_roles) for _ in range(n_resumes)]
+    # The reference prints on unparseable dates; keep the output readable
+    devnull = open(os.devnull, "w")
+
+    print(f"1. Parity over {n_resumes} synthetic resumes ({n_skills} skills, {n_roles} roles each)...")
+    stdout, sys.stdout = sys.stdout, devnull
+    try:
+        mismatches = [i for i, raw in enumerate(resumes)
+                      if enrich_resume_data(raw, "") != reference_enrich_resume_data(raw, "")]
+    finally:
+        sys.stdout = stdout
+    if mismatches:
+        print(f"   ❌ {len(mismatches)} resumes differ, first: #{mismatches[0]}")
+    else:
+        print("   ✅ identical output")
+
+    print(f"\n2. Benchmark (best of {repeat})...")
+    timings = {}
+    for label, fn in (("reference", reference_enrich_resume_data), ("single-pass", enrich_resume_data)):
+        best = float("inf")
+        for _ in range(repeat):
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                start = time.perf_counter()
+                for raw in resumes:
+                    fn(raw, "")
+                best = min(best, time.perf_counter() - start)
+            finally:
+                sys.stdout = stdout
+        timings[label] = best
+        print(f"   {label}: {best * 1000:.1f} ms total, {best / n_resumes * 1000:.2f} ms per resume")
+    print(f"   speedup: {timings['reference'] / timings['single-pass']:.1f}x")
+    return not mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--skills", type=int, default=300)
+    parser.add_argument("--roles", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sys.exit(0 if main(args.resumes, args.skills, args.roles, args.repeat) else 1)
@@ -0,0 +1,65 @@
+"""
+Key check for the job analysis cache.
+
+Job descriptions that differ only in boilerplate (EEO and accommodation
+statements, calls to apply, links), casing or punctuation must share a
+cache key; descriptions whose requirements differ must not, or a job would
+be given another job's cached requirements. No database needed.
+
+    python verify_job_analysis_cache.py
+"""
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from app.crud.crud_parse_cache import job_analysis_cache_key, normalize_job_description
+
+BASE = "Senior backend engineer.\nRequired: Python, PostgreSQL and Docker. 5+ years of experience."
+
+SAME_KEY = [
+    (BASE, BASE.upper()),
+    (BASE, BASE + "\nWe are an equal opportunity employer. All qualified applicants will receive "
+                  "consideration without regard to race, religion or age."),
+    (BASE, "Acme Corp is an Equal Opportunity Employer.\n" + BASE),
+    (BASE, BASE + "\nIf you need a reasonable accommodation, contact hr@acme.com.\nApply now at https://acme.com/jobs!"),
+    (BASE, BASE + "\nTo apply, send your CV to jobs@acme.com."),
+    (BASE, "  Senior backend engineer --\n\nRequired:  Python,  PostgreSQL and Docker;  5+ years of experience!"),
+]
+DIFFERENT_KEY = [
+    ("Must be able to apply deep learning with PyTorch in production.",
+     "Must be able to apply classical statistics with R and SAS in production."),
+    ("To apply deep learning at scale you need CUDA.",
+     "To apply data pipelines at scale you need Spark."),
+    (BASE + "\nWe are an equal opportunity employer; also required: Terraform and Rust",
+     BASE + "\nWe are an equal opportunity employer."),
+    (BASE + " Hiring without regard to degree: Kubernetes required.",
+     BASE + " Hiring without regard to degree."),
+    (BASE, BASE.replace("Python", "Java")),
+    ("C and C++ required.", "C# and C++ required."),
+    (".NET required.", "NET required."),
+]
+
+
+def key(description: str) -> str:
+    return job_analysis_cache_key(description, prompt_version=1, model="check")
+
+
+def main() -> int:
+    failures = 0
+    for a, b in SAME_KEY:
+        if key(a) != key(b):
+            failures += 1
+            print(f"   ❌ expected one key:\n      {normalize_job_description(a)!r}\n      {normalize_job_description(b)!r}")
+    for a, b in DIFFERENT_KEY:
+        if key(a) == key(b):
+            failures += 1
+            print(f"   ❌ expected different keys, both normalize to {normalize_job_description(a)!r}")
+    total = len(SAME_KEY) + len(DIFFERENT_KEY)
+    print(f"{'✅' if not failures else '❌'} {total - failures}/{total} description pairs keyed as expected")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
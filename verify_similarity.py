@@ -0,0 +1,132 @@
+"""
+Exactness check and latency benchmark for the local similarity index.
+
+First checks that the fallback embedding text of an enriched resume keeps
+its job titles and project names.
+
+Builds an index of `--size` synthetic resumes (hashed from random skill
+vocabularies, no database needed), checks that top-K search agrees with a
+full sort and prints query latencies. With `--db`, also loads the real index
+from the configured database and lists the closest resumes for every job.
+
+    python verify_similarity.py [--size 100000] [--top 20] [--queries 200] [--db]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from app.core.similarity import SIMILARITY_DIM, SimilarityIndex, embed_text, resume_text
+
+VOCABULARY = [
+    "python", "java", "javascript", "typescript", "react", "node.js", "django", "fastapi", "flask",
+    "sql", "postgresql", "mongodb", "redis", "docker", "kubernetes", "aws", "azure", "gcp", "git",
+    "machine learning", "deep learning", "pytorch", "tensorflow", "pandas", "numpy", "spark", "kafka",
+    "c++", "c#", ".net", "go", "rust", "html", "css", "figma", "linux", "terraform", "graphql",
+    "backend developer", "frontend engineer", "data scientist", "devops engineer", "intern",
+]
+LATENCY_BUDGET_MS = 50
+
+
+def build_index(size: int, seed: int = 7):
+    rng = random.Random(seed)
+    templates = [embed_text(" ".join(rng.sample(VOCABULARY, 8))) for _ in range(2000)]
+    index = SimilarityIndex()
+    noise = np.random.default_rng(seed)
+    for i in range(size):
+        # Template plus noise keeps the vectors distinct without embedding 100k texts
+        vector = templates[i % len(templates)] + noise.normal(0, 0.05, SIMILARITY_DIM).astype(np.float32)
+        index.upsert(i, vector / np.linalg.norm(vector))
+    return index
+
+
+def benchmark(size: int, top: int, queries: int) -> bool:
+    print(f"\n1. Building synthetic index of {size} resumes ({SIMILARITY_DIM} dims)...")
+    start = time.perf_counter()
+    index = build_index(size)
+    print(f"   built in {time.perf_counter() - start:.1f} s, {index.matrix[:len(index)].nbytes / 2**20:.0f} MiB")
+
+    rng = random.Random(11)
+    texts = [" ".join(rng.sample(VOCABULARY, 6)) for _ in range(queries)]
+
+    print(f"\n2. Exactness against a full sort (top {top})...")
+    ok = True
+    for text in texts[:20]:
+        query = embed_text(text)
+        hits = index.search(query, top)
+        sims = index.matrix[:len(index)] @ query
+        expected = np.sort(sims)[::-1][:top]
+        if not np.allclose([s for _, s in hits], expected):
+            print(f"   ❌ mismatch for {text!r}")
+            ok = False
+    if ok:
+        print("   ✅ top-K similarities identical")
+
+    print(f"\n3. Latency over {queries} queries (embed + search)...")
+    timings = []
+    for text in texts:
+        start = time.perf_counter()
+        index.search(embed_text(text), top)
+        timings.append((time.perf_counter() - start) * 1000)
+    p50, p95 = np.percentile(timings, [50, 95])
+    within = p95 < LATENCY_BUDGET_MS
+    print(f"   {'✅' if within else '❌'} p50 {p50:.1f} ms | p95 {p95:.1f} ms | budget {LATENCY_BUDGET_MS} ms")
+    return ok and within
+
+
+def check_resume_text() -> bool:
+    """The fallback embedding text of an enriched resume keeps job titles and project names."""
+    from app.worker import enrich_resume_data
+
+    raw = {
+        "skills": ["Python"],
+        "experience": [{"company": "Acme", "role": "Staff Data Engineer", "start_date": "2020-01",
+                        "end_date": "2023-06", "description": "Pipelines", "technologies": ["Spark"]}],
+        "projects": [{"title": "Fraud Radar", "description": "Anomaly detection", "technologies": ["Kafka"]}],
+    }
+    text = resume_text(enrich_resume_data(raw, ""))
+    missing = [s for s in ("Staff Data Engineer", "Acme", "Fraud Radar", "Spark", "Kafka") if s not in text]
+    print("0. Fallback resume text of an enriched resume...")
+    print(f"   {'❌ missing ' + ', '.join(missing) if missing else '✅ role, company, project and technologies present'}")
+    return not missing
+
+
+async def check_db(top: int) -> None:
+    from sqlalchemy import select
+    from app.db.session import AsyncSessionLocal
+    from app.models.job import Job
+    from app.core.similarity import job_text
+    from app.crud.crud_similarity import get_similar_resumes, refresh_resume_index
+
+    async with AsyncSessionLocal() as session:
+        start = time.perf_counter()
+        index = await refresh_resume_index(session)
+        print(f"\n4. Loaded {len(index)} resume vectors from the database in {time.perf_counter() - start:.2f} s")
+        result = await session.execute(select(Job))
+        for job in result.scalars():
+            query = embed_text(job_text(job.title, job.description, job.parsed_requirements))
+            hits = await get_similar_resumes(session, query, top)
+            print(f"   {job.title}:")
+            for row, similarity in hits[:5]:
+                print(f"      {similarity:.3f}  {row.original_filename}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--db", action="store_true")
+    args = parser.parse_args()
+    ok = check_resume_text()
+    ok = benchmark(args.size, args.top, args.queries) and ok
+    if args.db:
+        asyncio.run(check_db(args.top))
+    sys.exit(0 if ok else 1)
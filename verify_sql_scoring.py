@@ -0,0 +1,101 @@
+"""
+Parity check and benchmark: Python batch scorer vs. set-based SQL scorer.
+
+Read-only. Scores every PARSED resume in the configured database against a
+set of requirement profiles (edge cases plus every stored job) with both
+engines, asserts identical results and prints timings.
+
+    python verify_sql_scoring.py [--top 50] [--repeat 3]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from sqlalchemy import select
+from app.db.session import AsyncSessionLocal
+from app.models.job import Job
+from app.models.resume import Resume, ResumeStatus
+from app.core.scoring import calculate_match_scores_batch
+from app.crud.crud_sql_scoring import get_top_matches_for_job_sql
+
+# Profiles that hit the rounding ties (1/4, 3/4 of 50; 1.25/2.5 of 30),
+# missing sections and every education branch
+EDGE_CASE_REQUIREMENTS = [
+    {},
+    {"required_skills": ["Python", "React", "SQL", "Docker"]},
+    {"required_skills": ["python", "PYTHON", "Java"], "experience_years": 2.5},
+    {"required_skills": ["JavaScript"], "experience_years": 4, "education_level": "Bachelor's degree"},
+    {"required_skills": [], "experience_years": 1, "education_level": "Master of Science"},
+    {"required_skills": ["Machine Learning", "AWS"], "experience_years": 8, "education_level": "PhD"},
+    {"required_skills": ["Git"], "experience_years": 0, "education_level": "High school"},
+]
+
+
+def python_ranking(rows, job_requirements):
+    results = calculate_match_scores_batch([row.parsed_json or {} for row in rows], job_requirements)
+    ranked = sorted(zip(rows, results), key=lambda pair: (pair[1]["score"], pair[0].id), reverse=True)
+    return [(row.id, result["score"], result["breakdown"]) for row, result in ranked]
+
+
+def compare(label, py, sql):
+    sql_rows = [(m["resume_id"], m["score"], m["breakdown"]) for m in sql]
+    if len(py) != len(sql_rows):
+        print(f"   ❌ {label}: {len(py)} python rows vs {len(sql_rows)} sql rows")
+        return False
+    for (p_id, p_score, p_bd), (s_id, s_score, s_bd) in zip(py, sql_rows):
+        same_breakdown = all(p_bd[k] == s_bd[k] for k in ("skills_score", "experience_score", "education_score")) \
+            and sorted(p_bd["matched_skills"]) == sorted(s_bd["matched_skills"])
+        if p_id != s_id or p_score != s_score or not same_breakdown:
+            print(f"   ❌ {label}: resume {p_id} python={p_score} {p_bd} / sql resume {s_id}={s_score} {s_bd}")
+            return False
+    print(f"   ✅ {label}: {len(py)} rows identical")
+    return True
+
+
+async def main(top: int, repeat: int):
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Resume.id, Resume.parsed_json).where(Resume.status == ResumeStatus.PARSED)
+        )
+        rows = result.all()
+        result = await session.execute(select(Job))
+        profiles = [(f"edge case {i}", req) for i, req in enumerate(EDGE_CASE_REQUIREMENTS)]
+        profiles += [(f"job {job.id}", job.parsed_requirements or {}) for job in result.scalars()]
+
+        print(f"1. Parity over {len(rows)} PARSED resumes and {len(profiles)} requirement profiles...")
+        ok = True
+        for label, req in profiles:
+            sql = await get_top_matches_for_job_sql(session, req, None)
+            ok = compare(label, python_ranking(rows, req), sql) and ok
+
+        print(f"\n2. Benchmark (top {top}, best of {repeat})...")
+        for label, req in profiles[:3]:
+            py_best = sql_best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = await session.execute(
+                    select(Resume.id, Resume.parsed_json).where(Resume.status == ResumeStatus.PARSED)
+                )
+                python_ranking(result.all(), req)[:top]
+                py_best = min(py_best, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                await get_top_matches_for_job_sql(session, req, top)
+                sql_best = min(sql_best, time.perf_counter() - start)
+            print(f"   {label}: python (fetch + score) {py_best * 1000:.1f} ms | sql {sql_best * 1000:.1f} ms")
+
+    print("\n✅ Engines agree" if ok else "\n❌ Engines disagree")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(main(args.top, args.repeat)) else 1)